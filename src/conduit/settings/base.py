@@ -190,9 +190,34 @@ REST_FRAMEWORK = {
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
     "EXCEPTION_HANDLER": "resources.exceptions.problem_detail_handler",
+    "DEFAULT_PAGINATION_CLASS": "hsds.pagination.KeysetPagination",
+    "PAGE_SIZE": 50,
 }
 
 # Authentication redirects
 LOGIN_URL = "users:login"
 LOGIN_REDIRECT_URL = "/"
 LOGOUT_REDIRECT_URL = "users:login"
+
+# Number of bulk-operation targets written per transaction on commit.
+BULK_OPERATION_CHUNK_SIZE = 500
+
+# Run background jobs inline instead of queueing them for ``run_workers``.
+JOB_QUEUE_EAGER = False
+
+# Change feed entries are served once this many seconds old, so writers that
+# took a lower cursor id have time to commit before consumers move past it.
+CHANGE_FEED_SETTLE_SECONDS = 5
+
+# Local-memory caches are per process; point ``default`` at a shared backend
+# (Redis, Memcached) when running more than one process.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "conduit",
+    }
+}
+
+# Cache alias and lifetime (seconds) for serialized composite resources.
+RESOURCE_CACHE_ALIAS = "default"
+RESOURCE_CACHE_TIMEOUT = 300
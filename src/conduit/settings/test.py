@@ -26,3 +26,8 @@ TEMPLATES = [
     }
 ]
 
+# Execute queued jobs synchronously so request tests observe their results.
+JOB_QUEUE_EAGER = True
+
+# Serve change feed entries immediately so request tests observe their writes.
+CHANGE_FEED_SETTLE_SECONDS = 0
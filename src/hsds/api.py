@@ -2,8 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Max, Prefetch, QuerySet
+from django.utils.translation import get_language
 from django_filters import rest_framework as filters
-from rest_framework import serializers, viewsets
+from rest_framework import serializers, status, viewsets
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from hsds_ext.models import ChangeLogEntry
+
+from .conditional import not_modified, set_validators
 
 from .models import (
     URL,
@@ -234,10 +248,137 @@ class ServiceSerializer(serializers.ModelSerializer):
         model = Service
         fields = "__all__"
 
+
+def _plan_for(serializer: serializers.Serializer) -> tuple[list[str], list[Prefetch]]:
+    """Walk ``serializer`` fields and collect related-object lookups.
+
+    Nested single-object serializers become ``select_related`` joins, nested
+    ``many=True`` serializers become :class:`Prefetch` objects whose querysets
+    carry the plan for the next level down, and plain many-to-many primary-key
+    fields are prefetched so they do not query once per row.
+    """
+
+    model = serializer.Meta.model
+    select: list[str] = []
+    prefetch: list[Prefetch] = []
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        try:
+            relation = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            # Sources that are not model relations (or are skipped at
+            # serialization time) have nothing to load.
+            continue
+        if not relation.is_relation:
+            continue
+        source = field.source
+        if isinstance(field, serializers.ListSerializer) and isinstance(
+            field.child, serializers.ModelSerializer
+        ):
+            child_select, child_prefetch = _plan_for(field.child)
+            queryset = field.child.Meta.model._default_manager.all()
+            if child_select:
+                queryset = queryset.select_related(*child_select)
+            if child_prefetch:
+                queryset = queryset.prefetch_related(*child_prefetch)
+            prefetch.append(Prefetch(source, queryset=queryset))
+        elif isinstance(field, serializers.ModelSerializer):
+            child_select, child_prefetch = _plan_for(field)
+            select.append(source)
+            select.extend(f"{source}__{lookup}" for lookup in child_select)
+            prefetch.extend(
+                Prefetch(f"{source}__{p.prefetch_through}", queryset=p.queryset)
+                for p in child_prefetch
+            )
+        elif isinstance(field, serializers.ManyRelatedField):
+            prefetch.append(Prefetch(source))
+    return select, prefetch
+
+
+@lru_cache(maxsize=None)
+def prefetch_plan(
+    serializer_class: type[serializers.Serializer],
+) -> tuple[tuple[str, ...], tuple[Prefetch, ...]]:
+    """Return the ``(select_related, prefetch_related)`` plan for ``serializer_class``.
+
+    The plan is derived once per serializer class from its nested field tree.
+    """
+
+    select, prefetch = _plan_for(serializer_class())
+    return tuple(select), tuple(prefetch)
+
+
+def with_prefetch_plan(
+    queryset: QuerySet, serializer_class: type[serializers.Serializer]
+) -> QuerySet:
+    """Apply the :func:`prefetch_plan` of ``serializer_class`` to ``queryset``."""
+
+    select, prefetch = prefetch_plan(serializer_class)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
 class FilteredModelViewSet(viewsets.ModelViewSet):
-    """Base viewset that enables django-filter on all model fields."""
+    """Base viewset that enables django-filter on all model fields.
+
+    Querysets are loaded with the related-object plan derived from the
+    viewset's serializer so nested representations do not trigger N+1
+    queries. List endpoints are paginated by keyset over ``keyset_ordering``.
+
+    ``list`` and ``retrieve`` answer conditional requests. The ETag combines
+    the newest change-log id, so any HSDS write (including to nested
+    records) invalidates it, with the language and the request URL;
+    ``Last-Modified`` is sent for models with a ``last_modified`` column.
+    """
 
     filterset_fields = "__all__"
+    keyset_ordering: tuple[str, ...] = ("id",)
+
+    def get_queryset(self) -> QuerySet:
+        """Return the base queryset with its serializer prefetch plan applied."""
+
+        return with_prefetch_plan(super().get_queryset(), self.get_serializer_class())
+
+    def get_etag(self, request: Request) -> str:
+        """Return the weak ETag of the representation at ``request``'s URL."""
+
+        cursor = ChangeLogEntry.objects.aggregate(cursor=Max("id"))["cursor"] or 0
+        key = f"{request.get_full_path()}|{get_language()}|{cursor}"
+        return f'W/"{hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]}"'
+
+    def get_last_modified(self, queryset: QuerySet) -> datetime | None:
+        """Return the newest ``last_modified`` in ``queryset``, if tracked."""
+
+        if not any(f.name == "last_modified" for f in queryset.model._meta.concrete_fields):
+            return None
+        return queryset.order_by().aggregate(latest=Max("last_modified"))["latest"]
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Return a page of objects, or 304 when the client's copy is current."""
+
+        etag = self.get_etag(request)
+        last_modified = self.get_last_modified(self.filter_queryset(self.get_queryset()))
+        if not_modified(request.headers, etag, last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = super().list(request, *args, **kwargs)
+        return set_validators(response, etag, last_modified)
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Return one object, or 304 before loading it when unchanged."""
+
+        etag = self.get_etag(request)
+        lookup = {self.lookup_field: kwargs[self.lookup_url_kwarg or self.lookup_field]}
+        last_modified = self.get_last_modified(self.get_queryset().filter(**lookup))
+        if not_modified(request.headers, etag, last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = super().retrieve(request, *args, **kwargs)
+        return set_validators(response, etag, last_modified)
 
 
 class ServiceFilterSet(filters.FilterSet):
@@ -257,6 +398,7 @@ class OrganizationViewSet(FilteredModelViewSet):
 
     queryset = Organization.objects.all()
     serializer_class = OrganizationSerializer
+    keyset_ordering = ("name", "id")
 
 
 class ProgramViewSet(FilteredModelViewSet):
@@ -264,6 +406,7 @@ class ProgramViewSet(FilteredModelViewSet):
 
     queryset = Program.objects.all()
     serializer_class = ProgramSerializer
+    keyset_ordering = ("name", "id")
 
 
 class ServiceViewSet(FilteredModelViewSet):
@@ -272,6 +415,7 @@ class ServiceViewSet(FilteredModelViewSet):
     queryset = Service.objects.all()
     serializer_class = ServiceSerializer
     filterset_class = ServiceFilterSet
+    keyset_ordering = ("last_modified", "id")
 
 
 class LocationViewSet(FilteredModelViewSet):
@@ -370,6 +514,7 @@ class UnitViewSet(FilteredModelViewSet):
 
     queryset = Unit.objects.all()
     serializer_class = UnitSerializer
+    keyset_ordering = ("name", "id")
 
 
 class ServiceCapacityViewSet(FilteredModelViewSet):
@@ -391,6 +536,7 @@ class TaxonomyViewSet(FilteredModelViewSet):
 
     queryset = Taxonomy.objects.all()
     serializer_class = TaxonomySerializer
+    keyset_ordering = ("name", "id")
 
 
 class TaxonomyTermViewSet(FilteredModelViewSet):
@@ -398,3 +544,4 @@ class TaxonomyTermViewSet(FilteredModelViewSet):
 
     queryset = TaxonomyTerm.objects.all()
     serializer_class = TaxonomyTermSerializer
+    keyset_ordering = ("name", "id")
@@ -0,0 +1,58 @@
+"""Conditional GET helpers shared by the HSDS and resource APIs."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Mapping
+
+from django.http import HttpResponseBase
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+
+
+def _opaque(tag: str) -> str:
+    """Return ``tag`` without its weak prefix, for weak comparison."""
+
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def not_modified(
+    headers: Mapping[str, str], etag: str, last_modified: datetime | None = None
+) -> bool:
+    """Return whether a GET with request ``headers`` can be answered with 304.
+
+    Every validator the client sent must still match: ``If-None-Match``
+    against ``etag`` (weak comparison) and ``If-Modified-Since`` against
+    ``last_modified``. A request without validators is never 304.
+    """
+
+    if_none_match = headers.get("If-None-Match")
+    if_modified_since = headers.get("If-Modified-Since")
+    if not if_none_match and not if_modified_since:
+        return False
+    if if_none_match:
+        tags = parse_etags(if_none_match)
+        if "*" not in tags and _opaque(etag) not in {_opaque(tag) for tag in tags}:
+            return False
+    if if_modified_since:
+        since = parse_http_date_safe(if_modified_since)
+        if since is None or last_modified is None or int(last_modified.timestamp()) > since:
+            return False
+    return True
+
+
+def set_validators(
+    response: HttpResponseBase, etag: str, last_modified: datetime | None = None
+) -> HttpResponseBase:
+    """Attach ``ETag``/``Last-Modified`` to ``response`` and return it.
+
+    Representations are translated, so ``Accept-Language`` is added to
+    ``Vary``. Error responses are returned unchanged.
+    """
+
+    if response.status_code >= 400:
+        return response
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_vary_headers(response, ("Accept-Language",))
+    return response
@@ -2,21 +2,122 @@
 from __future__ import annotations
 
 import csv
+import io
+import json
+import tempfile
+import zipfile
+from contextlib import contextmanager
 from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List
 
 from django.core.management.base import BaseCommand
+from django.db.models import Model
 
-from hsds.api import (
-    ContactSerializer,
-    LocationSerializer,
-    OrganizationSerializer,
-    ServiceSerializer,
-)
-from hsds.models import Contact, Location, Organization, Service
+from hsds.parallel import run_parallel
+from hsds.tables import HSDS_TABLES, columns, source_columns
+
+DEFAULT_CHUNK_SIZE = 2000
+
+FIELD_TYPES = {
+    "DateField": "date",
+    "DateTimeField": "datetime",
+    "TimeField": "time",
+    "DecimalField": "number",
+    "FloatField": "number",
+    "IntegerField": "integer",
+    "PositiveIntegerField": "integer",
+    "BooleanField": "boolean",
+}
+"""Django internal field types mapped to Table Schema types; others are strings."""
+
+
+def csv_value(value: Any) -> Any:
+    """Return ``value`` as written to an HSDS CSV cell."""
+
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def write_table_csv(model: type[Model], fh: IO[str], chunk_size: int) -> int:
+    """Stream every row of ``model`` to ``fh`` as flat CSV.
+
+    Rows come from ``values_list().iterator()`` so only one fetch of tuples
+    is held in memory. Returns the number of rows written.
+    """
+
+    writer = csv.writer(fh)
+    writer.writerow(columns(model))
+    rows = (
+        model._default_manager.order_by("pk")
+        .values_list(*source_columns(model))
+        .iterator(chunk_size=chunk_size)
+    )
+    count = 0
+    for row in rows:
+        writer.writerow([csv_value(value) for value in row])
+        count += 1
+    return count
+
+
+def export_table(table: str, path: str, chunk_size: int) -> int:
+    """Write ``table`` to the CSV file at ``path``; runs in export workers."""
+
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        return write_table_csv(dict(HSDS_TABLES)[table], fh, chunk_size)
+
+
+def table_schema(model: type[Model]) -> Dict[str, Any]:
+    """Return the Table Schema describing the CSV columns of ``model``."""
+
+    names = set(columns(model))
+    fields = [
+        {
+            "name": field.attname,
+            "type": FIELD_TYPES.get(field.get_internal_type(), "string"),
+        }
+        for field in model._meta.concrete_fields
+        if field.attname in names
+    ]
+    return {"fields": fields, "primaryKey": model._meta.pk.attname}
+
+
+def datapackage(tables: List[str]) -> Dict[str, Any]:
+    """Return a Data Package descriptor listing ``tables``."""
+
+    models = dict(HSDS_TABLES)
+    return {
+        "name": "hsds",
+        "profile": "tabular-data-package",
+        "resources": [
+            {
+                "name": table,
+                "path": f"{table}.csv",
+                "profile": "tabular-data-resource",
+                "schema": table_schema(models[table]),
+            }
+            for table in tables
+        ],
+    }
+
+
+@contextmanager
+def open_member(target: Path | zipfile.ZipFile, name: str) -> Iterator[IO[str]]:
+    """Open ``name`` for text writing in a directory or zip archive."""
+
+    if isinstance(target, zipfile.ZipFile):
+        with target.open(name, "w", force_zip64=True) as raw:
+            with io.TextIOWrapper(raw, encoding="utf-8", newline="") as fh:
+                yield fh
+    else:
+        with (target / name).open("w", newline="", encoding="utf-8") as fh:
+            yield fh
 
 
 class Command(BaseCommand):
-    """Export HSDS data to separate CSV files per model."""
+    """Export every HSDS table to its own flat CSV file."""
 
     help = "Export HSDS data to CSV files"
 
@@ -25,27 +126,79 @@ class Command(BaseCommand):
             "output_dir",
             nargs="?",
             default="hsds_csv",
-            help="Directory to write CSV files into",
+            help="Directory to write CSV files into, or a .zip path",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of rows fetched per database round trip",
+        )
+        parser.add_argument(
+            "--zip",
+            action="store_true",
+            help="Write a zipped data package (implied by a .zip suffix)",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help=(
+                "Number of tables exported concurrently in worker processes; "
+                "workers share one snapshot on PostgreSQL only"
+            ),
         )
 
     def handle(self, *args, **options):
-        output_dir = Path(options["output_dir"]).expanduser().resolve()
-        output_dir.mkdir(parents=True, exist_ok=True)
-        mappings = [
-            (Organization, OrganizationSerializer),
-            (Service, ServiceSerializer),
-            (Location, LocationSerializer),
-            (Contact, ContactSerializer),
-        ]
-        for model, serializer_cls in mappings:
-            queryset = model.objects.all()
-            serializer = serializer_cls(queryset, many=True)
-            data = serializer.data
-            if not data:
-                continue
-            file_path = output_dir / f"{model._meta.model_name}s.csv"
-            with file_path.open("w", newline="", encoding="utf-8") as fh:
-                writer = csv.DictWriter(fh, fieldnames=data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
-        self.stdout.write(self.style.SUCCESS(f"Exported CSV files to {output_dir}"))
+        output = Path(options["output_dir"]).expanduser().resolve()
+        chunk_size = max(1, options["chunk_size"])
+        jobs = max(1, options["jobs"])
+        if options["zip"] and output.suffix != ".zip":
+            output = output.with_suffix(".zip")
+
+        tables = [table for table, _ in HSDS_TABLES]
+        if output.suffix == ".zip":
+            output.parent.mkdir(parents=True, exist_ok=True)
+            with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+                if jobs > 1:
+                    with tempfile.TemporaryDirectory() as tmp:
+                        self.export_parallel(Path(tmp), chunk_size, jobs)
+                        for name in sorted(p.name for p in Path(tmp).iterdir()):
+                            archive.write(Path(tmp) / name, name)
+                else:
+                    self.export(archive, chunk_size)
+        else:
+            output.mkdir(parents=True, exist_ok=True)
+            if jobs > 1:
+                self.export_parallel(output, chunk_size, jobs)
+            else:
+                self.export(output, chunk_size)
+        self.stdout.write(
+            self.style.SUCCESS(f"Exported {len(tables)} CSV tables to {output}")
+        )
+
+    def export(self, target: Path | zipfile.ZipFile, chunk_size: int) -> None:
+        """Write every table and the ``datapackage.json`` to ``target``."""
+
+        for table, model in HSDS_TABLES:
+            with open_member(target, f"{table}.csv") as fh:
+                count = write_table_csv(model, fh, chunk_size)
+            self.stdout.write(f"{table}: {count}")
+        with open_member(target, "datapackage.json") as fh:
+            json.dump(datapackage([table for table, _ in HSDS_TABLES]), fh, indent=2)
+
+    def export_parallel(self, directory: Path, chunk_size: int, jobs: int) -> None:
+        """Write the tables to ``directory`` from ``jobs`` worker processes.
+
+        Tables are independent, so each worker streams whole tables over its
+        own connection; the data package descriptor is written once they
+        have all finished.
+        """
+
+        tables = [table for table, _ in HSDS_TABLES]
+        calls = [(table, str(directory / f"{table}.csv"), chunk_size) for table in tables]
+        counts = run_parallel(export_table, calls, jobs)
+        for table, count in zip(tables, counts):
+            self.stdout.write(f"{table}: {count}")
+        with open_member(directory, "datapackage.json") as fh:
+            json.dump(datapackage(tables), fh, indent=2)
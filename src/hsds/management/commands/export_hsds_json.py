@@ -1,18 +1,91 @@
 """Management command to export HSDS data to JSON."""
 from __future__ import annotations
 
+import gzip
 import json
+import shutil
+import tempfile
+from itertools import islice
 from pathlib import Path
+from typing import IO, Iterable, Iterator
 
 from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, QuerySet
+from rest_framework.serializers import Serializer
 
 from hsds.api import (
     ContactSerializer,
     LocationSerializer,
     OrganizationSerializer,
     ServiceSerializer,
+    with_prefetch_plan,
 )
 from hsds.models import Contact, Location, Organization, Service
+from hsds.parallel import run_parallel
+
+DEFAULT_CHUNK_SIZE = 500
+
+SECTIONS: list[tuple[str, type[Model], type[Serializer]]] = [
+    ("organizations", Organization, OrganizationSerializer),
+    ("services", Service, ServiceSerializer),
+    ("locations", Location, LocationSerializer),
+    ("contacts", Contact, ContactSerializer),
+]
+
+
+def iter_chunks(queryset: QuerySet, chunk_size: int) -> Iterator[list[Model]]:
+    """Yield lists of at most ``chunk_size`` rows streamed from ``queryset``.
+
+    ``QuerySet.iterator`` uses a server-side cursor on PostgreSQL so only one
+    chunk of model instances is held in memory at a time.
+    """
+
+    rows = queryset.order_by("pk").iterator(chunk_size=chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def write_json_array(
+    fh: IO[str], records: Iterable[dict], indent: str = "    "
+) -> int:
+    """Write ``records`` to ``fh`` as the items of a JSON array.
+
+    Returns the number of records written.
+    """
+
+    count = 0
+    fh.write("[")
+    for record in records:
+        fh.write("," if count else "")
+        fh.write(f"\n{indent}")
+        fh.write(json.dumps(record, ensure_ascii=False, cls=DjangoJSONEncoder))
+        count += 1
+    fh.write(f"\n{indent[:-2]}]" if count else "]")
+    return count
+
+
+def write_section(fh: IO[str], key: str, chunk_size: int) -> int:
+    """Write the JSON array for section ``key`` to ``fh``.
+
+    Returns the number of records written.
+    """
+
+    _, model, serializer_cls = next(section for section in SECTIONS if section[0] == key)
+    queryset = with_prefetch_plan(model.objects.all(), serializer_cls)
+    records = (
+        record
+        for chunk in iter_chunks(queryset, chunk_size)
+        for record in serializer_cls(chunk, many=True).data
+    )
+    return write_json_array(fh, records)
+
+
+def export_section(key: str, path: str, chunk_size: int) -> int:
+    """Write section ``key`` to the file at ``path``; runs in export workers."""
+
+    with open(path, "w", encoding="utf-8") as fh:
+        return write_section(fh, key, chunk_size)
 
 
 class Command(BaseCommand):
@@ -27,15 +100,50 @@ class Command(BaseCommand):
             default="hsds_export.json",
             help="Path to the output JSON file",
         )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of rows fetched and serialized per batch",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Gzip-compress the output (implied by a .gz suffix)",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help=(
+                "Number of sections serialized concurrently in worker processes; "
+                "workers share one snapshot on PostgreSQL only"
+            ),
+        )
 
     def handle(self, *args, **options):
         output_path = Path(options["output"]).expanduser().resolve()
-        data = {
-            "organizations": OrganizationSerializer(Organization.objects.all(), many=True).data,
-            "services": ServiceSerializer(Service.objects.all(), many=True).data,
-            "locations": LocationSerializer(Location.objects.all(), many=True).data,
-            "contacts": ContactSerializer(Contact.objects.all(), many=True).data,
-        }
-        with output_path.open("w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2, ensure_ascii=False)
+        chunk_size = max(1, options["chunk_size"])
+        compress = options["gzip"] or output_path.suffix == ".gz"
+        jobs = max(1, options["jobs"])
+        keys = [key for key, _, _ in SECTIONS]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            if jobs > 1:
+                paths = [str(Path(tmp) / f"{key}.json") for key in keys]
+                run_parallel(
+                    export_section, [(k, p, chunk_size) for k, p in zip(keys, paths)], jobs
+                )
+            opener = gzip.open if compress else open
+            with opener(output_path, "wt", encoding="utf-8") as fh:
+                fh.write("{")
+                for index, key in enumerate(keys):
+                    fh.write(",\n" if index else "\n")
+                    fh.write(f"  {json.dumps(key)}: ")
+                    if jobs > 1:
+                        with open(paths[index], encoding="utf-8") as part:
+                            shutil.copyfileobj(part, fh)
+                    else:
+                        write_section(fh, key, chunk_size)
+                fh.write("\n}\n")
         self.stdout.write(self.style.SUCCESS(f"Exported data to {output_path}"))
@@ -0,0 +1,301 @@
+"""Management command to import HSDS data from JSON or CSV."""
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import time
+import zipfile
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Field, Model
+
+from hsds.models import Phone
+from hsds.signals import bulk_written
+from hsds.tables import HSDS_TABLES, update_columns
+
+DEFAULT_BATCH_SIZE = 1000
+
+TABLE_MODELS = dict(HSDS_TABLES)
+
+
+class Importer:
+    """Buffer HSDS rows and upsert them by id in batches.
+
+    Rows are keyed by primary key per model, so a row repeated within a
+    batch is written once with its last values. Each flush writes every
+    buffered table in dependency order with one
+    ``bulk_create(update_conflicts=True)`` per table.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self.batch_size = batch_size
+        self.buffers: Dict[type[Model], Dict[Any, Model]] = {}
+        self.pending = 0
+        self.counts: Counter[str] = Counter()
+        self._columns: Dict[type[Model], Dict[str, Field]] = {}
+
+    def column_fields(self, model: type[Model]) -> Dict[str, Field]:
+        """Return ``model`` concrete fields keyed by both name and attname."""
+
+        if model not in self._columns:
+            fields = {}
+            for field in model._meta.concrete_fields:
+                fields[field.name] = fields[field.attname] = field
+            self._columns[model] = fields
+        return self._columns[model]
+
+    def add(self, model: type[Model], record: Dict[str, Any]) -> None:
+        """Buffer one flat ``record`` of ``model``."""
+
+        fields = self.column_fields(model)
+        values = {}
+        for key, value in record.items():
+            field = fields.get(key)
+            if field is None:
+                continue
+            if value in ("", None) and field.null:
+                value = None
+            values[field.attname] = None if value is None else field.to_python(value)
+        instance = model(**values)
+        if isinstance(instance, Phone):
+            instance.normalize_number()
+        buffer = self.buffers.setdefault(model, {})
+        if instance.pk not in buffer:
+            self.pending += 1
+        buffer[instance.pk] = instance
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def add_nested(self, model: type[Model], record: Dict[str, Any]) -> None:
+        """Buffer ``record`` and every nested related record it contains.
+
+        Lists of objects under a reverse relation name (``phones``,
+        ``schedules``, ...) and objects under a forward relation are
+        imported into their own tables; children missing a reference to
+        their parent get it filled in.
+        """
+
+        flat = {}
+        for key, value in record.items():
+            nested = isinstance(value, dict) or (
+                isinstance(value, list) and value and isinstance(value[0], dict)
+            )
+            if not nested:
+                flat[key] = value
+                continue
+            try:
+                relation = model._meta.get_field(key)
+            except FieldDoesNotExist:
+                continue
+            if not relation.is_relation or relation.related_model is None:
+                continue
+            if isinstance(value, dict):
+                self.add_nested(relation.related_model, value)
+                flat[key] = value.get("id")
+                continue
+            parent_field = getattr(relation, "field", None)
+            for child in value:
+                if parent_field is not None and record.get("id") is not None:
+                    child.setdefault(parent_field.name, record["id"])
+                self.add_nested(relation.related_model, child)
+        self.add(model, flat)
+
+    def flush(self) -> None:
+        """Upsert all buffered rows, parents before children."""
+
+        for table, model in HSDS_TABLES:
+            rows = self.buffers.pop(model, None)
+            if not rows:
+                continue
+            objs = list(rows.values())
+            model.objects.bulk_create(
+                objs,
+                update_conflicts=True,
+                unique_fields=[model._meta.pk.name],
+                update_fields=update_columns(model),
+                batch_size=self.batch_size,
+            )
+            bulk_written.send(sender=model, ids=[obj.pk for obj in objs])
+            self.counts[table] += len(objs)
+        self.pending = 0
+
+
+READ_SIZE = 1 << 16
+"""Characters read from a JSON source at a time."""
+
+
+class _JSONReader:
+    """Decode a JSON document from a text stream one value at a time.
+
+    Only the unread tail of the current read and the value being decoded
+    are held in memory, so a large export is read record by record.
+    """
+
+    def __init__(self, fh: io.TextIOBase) -> None:
+        self.fh = fh
+        self.buffer = ""
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Append the next read to the buffer; return ``False`` at EOF."""
+
+        data = self.fh.read(READ_SIZE)
+        if not data:
+            return False
+        self.buffer = self.buffer[self.pos :] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or ``""`` at EOF."""
+
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos : self.pos + 1]
+
+    def skip(self, char: str) -> bool:
+        """Consume ``char`` if it is next and return whether it was."""
+
+        if self.peek() != char:
+            return False
+        self.pos += 1
+        return True
+
+    def expect(self, char: str, message: str) -> None:
+        """Consume ``char`` or raise ``CommandError(message)``."""
+
+        if not self.skip(char):
+            raise CommandError(message)
+
+    def value(self) -> Any:
+        """Decode and consume the next complete JSON value."""
+
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                raise CommandError(f"Invalid HSDS JSON: {exc}") from exc
+            if end == len(self.buffer) and not isinstance(value, (dict, list, str)):
+                # A number or literal may continue in the next read.
+                if self._fill():
+                    continue
+            self.pos = end
+            return value
+
+
+def read_json(path: Path) -> Iterator[Tuple[type[Model], Dict[str, Any]]]:
+    """Yield ``(model, record)`` pairs from an ``export_hsds_json`` document.
+
+    The document is parsed incrementally, one table record at a time, so
+    memory use does not grow with the size of the file.
+    """
+
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as fh:
+        reader = _JSONReader(fh)
+        reader.expect("{", "HSDS JSON must be an object keyed by table name")
+        if reader.skip("}"):
+            return
+        while True:
+            table = reader.value()
+            model = TABLE_MODELS.get(table) if isinstance(table, str) else None
+            if model is None:
+                raise CommandError(f"Unknown HSDS table: {table}")
+            reader.expect(":", "Invalid HSDS JSON: expected ':' after a table name")
+            reader.expect("[", f"HSDS JSON table {table} must be a list of records")
+            if not reader.skip("]"):
+                while True:
+                    yield model, reader.value()
+                    if not reader.skip(","):
+                        break
+                reader.expect("]", f"Invalid HSDS JSON: unterminated table {table}")
+            if not reader.skip(","):
+                break
+        reader.expect("}", "Invalid HSDS JSON: expected '}' after the last table")
+
+
+def _csv_sources(path: Path) -> Iterator[Tuple[str, io.TextIOBase]]:
+    """Yield ``(table, text stream)`` for each table CSV in a directory or zip."""
+
+    if path.is_dir():
+        for table, _ in HSDS_TABLES:
+            file_path = path / f"{table}.csv"
+            if file_path.exists():
+                with file_path.open(newline="", encoding="utf-8") as fh:
+                    yield table, fh
+        return
+    with zipfile.ZipFile(path) as archive:
+        names = {Path(name).name: name for name in archive.namelist()}
+        for table, _ in HSDS_TABLES:
+            name = names.get(f"{table}.csv")
+            if name:
+                with archive.open(name) as raw:
+                    yield table, io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+
+def read_csv(path: Path) -> Iterator[Tuple[type[Model], Dict[str, Any]]]:
+    """Yield ``(model, row)`` pairs streamed from per-table HSDS CSV files."""
+
+    for table, fh in _csv_sources(path):
+        model = TABLE_MODELS[table]
+        for row in csv.DictReader(fh):
+            yield model, row
+
+
+class Command(BaseCommand):
+    """Import HSDS JSON or per-table CSV files, upserting rows by id."""
+
+    help = "Import HSDS data from a JSON file or a directory/zip of CSV files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "source",
+            help="HSDS JSON file (.json or .json.gz), CSV directory, or CSV zip",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of rows buffered before each bulk upsert",
+        )
+
+    def handle(self, *args, **options):
+        source = Path(options["source"]).expanduser().resolve()
+        if not source.exists():
+            raise CommandError(f"{source} does not exist")
+        is_json = source.is_file() and ".json" in source.suffixes
+        records: Iterable[Tuple[type[Model], Dict[str, Any]]] = (
+            read_json(source) if is_json else read_csv(source)
+        )
+
+        importer = Importer(max(1, options["batch_size"]))
+        started = time.perf_counter()
+        with transaction.atomic():
+            for model, record in records:
+                if is_json:
+                    importer.add_nested(model, record)
+                else:
+                    importer.add(model, record)
+            importer.flush()
+        elapsed = time.perf_counter() - started
+
+        total = sum(importer.counts.values())
+        for table, count in importer.counts.items():
+            self.stdout.write(f"{table}: {count}")
+        rate = total / elapsed if elapsed else total
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {total} rows in {elapsed:.1f}s ({rate:.0f} rows/s)")
+        )
@@ -0,0 +1,40 @@
+"""Management command to backfill normalized phone-number digits."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from hsds.management.commands.export_hsds_json import iter_chunks
+from hsds.models import Phone
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    """Recompute ``Phone.number_digits`` for existing rows."""
+
+    help = "Backfill normalized digits for every phone number"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of phones updated per query",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        queryset = Phone.objects.only("id", "number", "number_digits", "number_digits_reversed")
+        updated = 0
+        for chunk in iter_chunks(queryset, batch_size):
+            changed = []
+            for phone in chunk:
+                before = (phone.number_digits, phone.number_digits_reversed)
+                phone.normalize_number()
+                if (phone.number_digits, phone.number_digits_reversed) != before:
+                    changed.append(phone)
+            Phone.objects.bulk_update(
+                changed, ["number_digits", "number_digits_reversed"], batch_size=batch_size
+            )
+            updated += len(changed)
+        self.stdout.write(self.style.SUCCESS(f"Normalized {updated} phone numbers"))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-18 05:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds', '0003_accessibility_description_en_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['last_modified', 'id'], name='hsds_servic_last_mo_04d87b_idx'),
+        ),
+    ]
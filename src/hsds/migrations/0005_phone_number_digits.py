@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-18 05:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds', '0004_service_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='phone',
+            name='number_digits',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, help_text='Normalized digits of ``number`` for exact duplicate matching.', max_length=32),
+        ),
+        migrations.AddField(
+            model_name='phone',
+            name='number_digits_reversed',
+            field=models.CharField(blank=True, default='', editable=False, help_text='``number_digits`` reversed, for index-served suffix matching.', max_length=32),
+        ),
+        migrations.AddIndex(
+            model_name='phone',
+            index=models.Index(fields=['number_digits_reversed'], name='hsds_phone_digits_rev_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
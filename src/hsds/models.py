@@ -1,10 +1,32 @@
 """Core HSDS models: Organization, Program, Service, and Location."""
 from __future__ import annotations
 
+import re
 import uuid
 
 from django.db import models
 
+DEFAULT_COUNTRY_CODE = "1"
+"""Country calling code assumed for national (10-digit) numbers."""
+
+_EXTENSION_RE = re.compile(r"\s*(?:x|ext\.?|extension)\s*\d*\s*$", re.IGNORECASE)
+
+
+def normalize_phone_number(number: str | None) -> str:
+    """Return ``number`` reduced to E.164-style digits without the ``+``.
+
+    Formatting and any trailing extension are discarded, and 10-digit
+    national numbers get :data:`DEFAULT_COUNTRY_CODE` prefixed so that
+    ``"(555) 010-0100"`` and ``"+1 555 010 0100"`` normalize identically.
+    """
+
+    if not number:
+        return ""
+    digits = re.sub(r"\D", "", _EXTENSION_RE.sub("", number))
+    if len(digits) == 10 and not number.lstrip().startswith("+"):
+        digits = DEFAULT_COUNTRY_CODE + digits
+    return digits
+
 
 class Organization(models.Model):
     """An organization providing human services."""
@@ -95,6 +117,9 @@ class Service(models.Model):
         "Location", through="ServiceAtLocation", related_name="services", blank=True
     )
 
+    class Meta:
+        indexes = [models.Index(fields=["last_modified", "id"])]
+
     def __str__(self) -> str:  # pragma: no cover - simple representation
         return self.name
 
@@ -249,13 +274,56 @@ class Phone(models.Model):
         null=True,
     )
     number = models.TextField()
+    number_digits = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        editable=False,
+        db_index=True,
+        help_text="Normalized digits of ``number`` for exact duplicate matching.",
+    )
+    number_digits_reversed = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="``number_digits`` reversed, for index-served suffix matching.",
+    )
     extension = models.PositiveIntegerField(blank=True, null=True)
     type = models.CharField(max_length=20, choices=PhoneType.choices, blank=True, null=True)
     description = models.TextField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["number_digits_reversed"],
+                name="hsds_phone_digits_rev_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
+
     def __str__(self) -> str:  # pragma: no cover
         return self.number
 
+    def normalize_number(self) -> None:
+        """Recompute the normalized digit columns from ``number``."""
+
+        self.number_digits = normalize_phone_number(self.number)
+        self.number_digits_reversed = self.number_digits[::-1]
+
+    def save(self, *args, **kwargs) -> None:
+        """Keep the normalized digit columns in step with ``number``."""
+
+        self.normalize_number()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "number" in update_fields:
+            kwargs["update_fields"] = {
+                *update_fields,
+                "number_digits",
+                "number_digits_reversed",
+            }
+        super().save(*args, **kwargs)
+
 
 class Schedule(models.Model):
     """Opening hours or recurring availability for services and locations."""
@@ -0,0 +1,144 @@
+"""Keyset (cursor) pagination for the HSDS REST API."""
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any, Sequence
+
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Paginate by seeking past the last row's ordering key.
+
+    Each page is fetched with a ``WHERE (a, b) > (x, y)`` style predicate on
+    the view's ``keyset_ordering`` instead of an ``OFFSET``, so the cost of a
+    page does not grow with its depth. The final ordering field must be unique
+    (normally ``id``) to make the ordering total. Fields prefixed with ``-``
+    are ordered descending.
+
+    Navigation links are returned in an RFC 8288 ``Link`` header and the body
+    remains a plain list of results.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    cursor_query_param = "cursor"
+    ordering: Sequence[str] = ("id",)
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> list[Model] | None:
+        """Return one page of ``queryset`` after the cursor in ``request``."""
+
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.fields = tuple(getattr(view, "keyset_ordering", self.ordering))
+        values, reverse = self.decode_cursor(request)
+
+        ordering = [_flip(f) if reverse else f for f in self.fields]
+        queryset = queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self._seek(values, reverse))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.first_key = self._key(rows[0]) if rows else None
+        self.last_key = self._key(rows[-1]) if rows else None
+        if reverse:
+            self.has_previous, self.has_next = has_more, values is not None
+        else:
+            self.has_previous, self.has_next = values is not None, has_more
+        return rows
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """Return ``data`` with ``Link`` navigation headers."""
+
+        links = []
+        if self.has_next and self.last_key is not None:
+            links.append(f'<{self.encode_cursor(self.last_key, False)}>; rel="next"')
+        if self.has_previous and self.first_key is not None:
+            links.append(f'<{self.encode_cursor(self.first_key, True)}>; rel="prev"')
+        if self.has_previous:
+            first_url = remove_query_param(self.base_url, self.cursor_query_param)
+            links.append(f'<{first_url}>; rel="first"')
+        headers = {"Link": ", ".join(links)} if links else None
+        return Response(data, headers=headers)
+
+    def get_page_size(self, request: Request) -> int | None:
+        """Return the requested page size clamped to ``max_page_size``."""
+
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw:
+            try:
+                requested = int(raw)
+            except ValueError:
+                requested = 0
+            if requested > 0:
+                return min(requested, self.max_page_size)
+        return self.page_size
+
+    def encode_cursor(self, key: list[Any], reverse: bool) -> str:
+        """Return the page URL for a cursor positioned at ``key``."""
+
+        payload = json.dumps({"k": key, "r": reverse}, separators=(",", ":"))
+        token = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request: Request) -> tuple[list[Any] | None, bool]:
+        """Return ``(key, reverse)`` decoded from the request cursor."""
+
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+            key = payload["k"]
+            reverse = bool(payload.get("r", False))
+        except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(key, list) or len(key) != len(self.fields):
+            raise NotFound(self.invalid_cursor_message)
+        return key, reverse
+
+    def _key(self, row: Model) -> list[Any]:
+        """Return the JSON-safe ordering key of ``row``."""
+
+        key = []
+        for field in self.fields:
+            value = getattr(row, field.lstrip("-"))
+            key.append(value.isoformat() if hasattr(value, "isoformat") else str(value))
+        return key
+
+    def _seek(self, key: list[Any], reverse: bool) -> Q:
+        """Build the row-value comparison selecting rows past ``key``."""
+
+        condition = Q()
+        for index, field in enumerate(self.fields):
+            equal = {f.lstrip("-"): key[i] for i, f in enumerate(self.fields[:index])}
+            op = "lt" if field.startswith("-") != reverse else "gt"
+            condition |= Q(**equal, **{f"{field.lstrip('-')}__{op}": key[index]})
+        return condition
+
+
+def _flip(field: str) -> str:
+    """Return ``field`` with its ordering direction reversed."""
+
+    return field[1:] if field.startswith("-") else f"-{field}"
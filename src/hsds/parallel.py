@@ -0,0 +1,91 @@
+"""Run independent per-table work in a pool of worker processes."""
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Sequence, TypeVar
+
+from django.db import connection, connections, transaction
+
+T = TypeVar("T")
+
+
+def can_fork_workers() -> bool:
+    """Return whether forked workers can open their own database connections.
+
+    Processes cannot share an in-memory SQLite database, so work against
+    one (as in the test suite) always runs in the calling process.
+    """
+
+    return not any(
+        getattr(conn, "is_in_memory_db", lambda: False)() for conn in connections.all()
+    )
+
+
+def _supports_shared_snapshots() -> bool:
+    """Return whether transactions can adopt another session's snapshot."""
+
+    return connection.vendor == "postgresql"
+
+
+@contextmanager
+def _repeatable_read(snapshot: str | None = None) -> Iterator[None]:
+    """Run the block in a ``REPEATABLE READ`` transaction.
+
+    With ``snapshot`` the transaction sees exactly the data of the session
+    that exported it.
+    """
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            if snapshot:
+                cursor.execute("SET TRANSACTION SNAPSHOT %s", [snapshot])
+        yield
+
+
+def _call_in_snapshot(snapshot: str, func: Callable[..., T], *args: Any) -> T:
+    """Return ``func(*args)`` evaluated in the exported ``snapshot``."""
+
+    with _repeatable_read(snapshot):
+        return func(*args)
+
+
+def run_parallel(
+    func: Callable[..., T], calls: Sequence[Sequence[Any]], jobs: int
+) -> List[T]:
+    """Return ``[func(*args) for args in calls]``, using ``jobs`` processes.
+
+    ``func`` must be a module-level function. The parent's connections are
+    closed before forking so each worker opens its own.
+
+    On PostgreSQL every call reads the same data: the parent exports its
+    snapshot with ``pg_export_snapshot()`` and keeps that transaction open
+    while each worker adopts it with ``SET TRANSACTION SNAPSHOT``, so an
+    export taken during writes never holds child rows without their
+    parents. Other backends give each worker its own view of the data, so
+    parallel exports taken while the database is written to are not
+    guaranteed to be consistent across tables.
+    """
+
+    if jobs <= 1 or len(calls) <= 1 or not can_fork_workers():
+        if not _supports_shared_snapshots() or connection.in_atomic_block:
+            return [func(*args) for args in calls]
+        with _repeatable_read():
+            return [func(*args) for args in calls]
+    connections.close_all()
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        if not _supports_shared_snapshots():
+            futures = [pool.submit(func, *args) for args in calls]
+            return [future.result() for future in futures]
+        # Fork pools start every worker on the first submit; do that while
+        # the parent has no connection, so none inherits the snapshot session.
+        pool.submit(int).result()
+        with _repeatable_read():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_export_snapshot()")
+                (snapshot,) = cursor.fetchone()
+            futures = [pool.submit(_call_in_snapshot, snapshot, func, *args) for args in calls]
+            return [future.result() for future in futures]
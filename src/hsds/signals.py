@@ -0,0 +1,19 @@
+"""Signals sent by HSDS bulk write paths."""
+from __future__ import annotations
+
+from django.dispatch import Signal
+
+bulk_written = Signal()
+"""Sent after rows are written with ``bulk_create``/``bulk_update``.
+
+Model signals do not fire for bulk writes, so receivers maintaining derived
+data listen for this instead. ``sender`` is the model class and ``ids`` the
+primary keys written.
+"""
+
+versions_bumped = Signal()
+"""Sent after ``FieldVersion.bump_many`` increments field versions.
+
+``sender`` is the ``FieldVersion`` model and ``keys`` the bumped
+``(entity_type, entity_id, field_path)`` tuples.
+"""
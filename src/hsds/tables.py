@@ -0,0 +1,120 @@
+"""Flat HSDS table layout shared by the bulk import and export commands."""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from django.conf import settings
+from django.db.models import Model
+from modeltranslation.fields import TranslationField
+from modeltranslation.utils import build_localized_fieldname
+
+from .models import (
+    URL,
+    Accessibility,
+    Address,
+    Contact,
+    CostOption,
+    Funding,
+    Language,
+    Location,
+    Organization,
+    OrganizationIdentifier,
+    Phone,
+    Program,
+    RequiredDocument,
+    Schedule,
+    Service,
+    ServiceArea,
+    ServiceAtLocation,
+    ServiceCapacity,
+    Taxonomy,
+    TaxonomyTerm,
+    Unit,
+)
+
+HSDS_TABLES: List[Tuple[str, type[Model]]] = [
+    ("organizations", Organization),
+    ("organization_identifiers", OrganizationIdentifier),
+    ("programs", Program),
+    ("services", Service),
+    ("locations", Location),
+    ("service_at_locations", ServiceAtLocation),
+    ("contacts", Contact),
+    ("phones", Phone),
+    ("addresses", Address),
+    ("schedules", Schedule),
+    ("accessibility", Accessibility),
+    ("languages", Language),
+    ("service_areas", ServiceArea),
+    ("cost_options", CostOption),
+    ("funding", Funding),
+    ("required_documents", RequiredDocument),
+    ("units", Unit),
+    ("service_capacity", ServiceCapacity),
+    ("urls", URL),
+    ("taxonomies", Taxonomy),
+    ("taxonomy_terms", TaxonomyTerm),
+]
+"""HSDS table names and models, parents before the tables referencing them."""
+
+INTERNAL_FIELDS = {"number_digits", "number_digits_reversed"}
+"""Derived columns maintained by the application and not part of HSDS."""
+
+
+def columns(model: type[Model]) -> List[str]:
+    """Return the HSDS column names of ``model``.
+
+    Foreign keys use their ``*_id`` attribute names. Per-language columns
+    added by modeltranslation and internal derived columns are omitted;
+    translated fields are read and written in the default language.
+    """
+
+    return [
+        field.attname
+        for field in model._meta.concrete_fields
+        if not isinstance(field, TranslationField) and field.name not in INTERNAL_FIELDS
+    ]
+
+
+def update_columns(model: type[Model]) -> List[str]:
+    """Return the non-key columns an upsert of ``model`` must overwrite.
+
+    Includes the default-language column of every translated field, which
+    modeltranslation reads in place of the base column.
+    """
+
+    language = settings.MODELTRANSLATION_DEFAULT_LANGUAGE
+    names = [name for name in columns(model) if name != model._meta.pk.attname]
+    translated = {
+        field.translated_field.name
+        for field in model._meta.concrete_fields
+        if isinstance(field, TranslationField)
+    }
+    names += [build_localized_fieldname(name, language) for name in sorted(translated)]
+    names += [name for name in INTERNAL_FIELDS if _has_field(model, name)]
+    return names
+
+
+def _has_field(model: type[Model], name: str) -> bool:
+    """Return whether ``model`` has a concrete field called ``name``."""
+
+    return any(field.name == name for field in model._meta.concrete_fields)
+
+
+def source_columns(model: type[Model]) -> List[str]:
+    """Return the names to select for :func:`columns`, in the same order.
+
+    Translated fields are read from their default-language column so the
+    output does not depend on the active language.
+    """
+
+    language = settings.MODELTRANSLATION_DEFAULT_LANGUAGE
+    translated = {
+        field.translated_field.name
+        for field in model._meta.concrete_fields
+        if isinstance(field, TranslationField)
+    }
+    return [
+        build_localized_fieldname(name, language) if name in translated else name
+        for name in columns(model)
+    ]
@@ -3,10 +3,58 @@
 from __future__ import annotations
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient
 
-from hsds.models import Address, Location, Organization, Service, ServiceAtLocation
+from hsds.models import (
+    Address,
+    Contact,
+    Language,
+    Location,
+    Organization,
+    Phone,
+    Schedule,
+    Service,
+    ServiceAtLocation,
+)
+
+
+def _create_nested_service(org: Organization, index: int) -> Service:
+    """Create a service with nested phones, contacts, and a located address."""
+
+    service = Service.objects.create(
+        organization=org, name=f"Svc {index}", status=Service.Status.ACTIVE
+    )
+    phone = Phone.objects.create(service=service, number=f"555-01{index:02d}")
+    Language.objects.create(phone=phone, name="English", code="en")
+    contact = Contact.objects.create(service=service, name=f"Contact {index}")
+    Phone.objects.create(contact=contact, number=f"555-02{index:02d}")
+    Schedule.objects.create(service=service, description="Weekdays")
+    location = Location.objects.create(location_type="physical", name=f"Loc {index}")
+    Address.objects.create(
+        location=location,
+        address_1=f"{index} Main St",
+        city="Town",
+        state_province="State",
+        postal_code="12345",
+        country="Country",
+        address_type="physical",
+    )
+    Phone.objects.create(location=location, number=f"555-03{index:02d}")
+    ServiceAtLocation.objects.create(service=service, location=location)
+    return service
+
+
+def _list_query_count(url: str) -> int:
+    """Return the number of queries issued to render ``url``."""
+
+    client = APIClient()
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(ctx.captured_queries)
 
 
 @pytest.mark.django_db
@@ -80,6 +128,31 @@ def test_service_detail_returns_nested_location_address() -> None:
     assert nested_address["address_1"] == "123 Main St"
 
 
+@pytest.mark.django_db
+def test_detail_and_list_answer_conditional_requests() -> None:
+    """Unchanged objects return 304; any HSDS write invalidates the ETag."""
+
+    org = Organization.objects.create(name="Org", description="Desc")
+    service = Service.objects.create(organization=org, name="Svc", status="active")
+    client = APIClient()
+    detail = reverse("service-detail", args=[service.id])
+    first = client.get(detail)
+    assert "Last-Modified" in first.headers
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(detail, HTTP_IF_NONE_MATCH=first.headers["ETag"])
+    assert response.status_code == 304
+    assert not any("hsds_phone" in q["sql"] for q in ctx.captured_queries)
+
+    listing = client.get(reverse("service-list"))
+    etag = listing.headers["ETag"]
+    assert client.get(reverse("service-list"), HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    Phone.objects.create(service=service, number="555-0100")
+    assert client.get(detail, HTTP_IF_NONE_MATCH=first.headers["ETag"]).status_code == 200
+    assert client.get(reverse("service-list"), HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
 @pytest.mark.django_db
 def test_service_filter_by_status() -> None:
     """Filtering the service list by status returns only matching services."""
@@ -100,3 +173,75 @@ def test_service_filter_by_status() -> None:
     assert len(response.data) == 1
     assert response.data[0]["id"] == str(active.id)
 
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name", ["service-list", "location-list", "serviceatlocation-list", "contact-list"]
+)
+def test_list_query_count_is_independent_of_row_count(url_name: str) -> None:
+    """Nested serializers are fed by prefetches, not per-row queries."""
+
+    org = Organization.objects.create(name="Org", description="Desc")
+    for index in range(2):
+        _create_nested_service(org, index)
+    url = reverse(url_name)
+    baseline = _list_query_count(url)
+
+    for index in range(2, 8):
+        _create_nested_service(org, index)
+    assert _list_query_count(url) == baseline
+
+
+@pytest.mark.django_db
+def test_list_query_count_is_independent_of_page_size() -> None:
+    """A larger page costs the same number of queries as a smaller one."""
+
+    org = Organization.objects.create(name="Org", description="Desc")
+    for index in range(6):
+        _create_nested_service(org, index)
+    url = reverse("service-list")
+    assert _list_query_count(f"{url}?page_size=2") == _list_query_count(f"{url}?page_size=6")
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_walks_all_pages_with_link_headers() -> None:
+    """Following ``rel="next"`` links visits every row once, in name order."""
+
+    for index in range(5):
+        Organization.objects.create(name="Same" if index < 3 else f"Org {index}", description="d")
+
+    client = APIClient()
+    url = f"{reverse('organization-list')}?page_size=2"
+    seen: list[str] = []
+    pages = 0
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        assert len(response.data) <= 2
+        seen.extend(row["id"] for row in response.data)
+        links = response.headers.get("Link", "")
+        url = next(
+            (part.split(";")[0].strip("<> ") for part in links.split(",") if 'rel="next"' in part),
+            None,
+        )
+        pages += 1
+
+    expected = list(Organization.objects.order_by("name", "id").values_list("id", flat=True))
+    assert seen == [str(pk) for pk in expected]
+    assert pages == 3
+
+    links = response.headers["Link"]
+    assert 'rel="first"' in links
+    prev_url = next(
+        part.split(";")[0].strip("<> ") for part in links.split(",") if 'rel="prev"' in part
+    )
+    assert [row["id"] for row in client.get(prev_url).data] == seen[2:4]
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_rejects_malformed_cursor() -> None:
+    """A garbled cursor yields 404 rather than a server error."""
+
+    response = APIClient().get(reverse("organization-list"), {"cursor": "not-a-cursor"})
+    assert response.status_code == 404
@@ -2,12 +2,17 @@
 from __future__ import annotations
 
 import csv
+import gzip
+import io
 import json
+import zipfile
 
 import pytest
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
 
-from hsds.models import Location, Organization, Service, ServiceAtLocation
+from hsds import parallel
+from hsds.management.commands import import_hsds
+from hsds.models import Location, Organization, Phone, Service, ServiceAtLocation
 
 
 @pytest.mark.django_db
@@ -21,6 +26,22 @@ def test_export_hsds_json(tmp_path) -> None:
     assert data["organizations"][0]["name"] == "Org"
 
 
+@pytest.mark.django_db
+def test_export_hsds_json_streams_in_chunks_to_gzip(tmp_path) -> None:
+    """Chunked export writes every row and supports gzip output."""
+
+    for i in range(5):
+        org = Organization.objects.create(name=f"Org {i}", description="Desc")
+        Service.objects.create(organization=org, name=f"Svc {i}", status="active")
+    output = tmp_path / "export.json.gz"
+    call_command("export_hsds_json", str(output), "--chunk-size", "2")
+    with gzip.open(output, "rt", encoding="utf-8") as fh:
+        data = json.load(fh)
+    assert sorted(o["name"] for o in data["organizations"]) == [f"Org {i}" for i in range(5)]
+    assert len(data["services"]) == 5
+    assert data["locations"] == []
+
+
 @pytest.mark.django_db
 def test_export_hsds_csv(tmp_path) -> None:
     """Command exports data to CSV files."""
@@ -34,6 +55,47 @@ def test_export_hsds_csv(tmp_path) -> None:
     assert rows[0]["name"] == "Org"
 
 
+@pytest.mark.django_db
+def test_export_hsds_csv_zip_is_flat_and_reimportable(tmp_path) -> None:
+    """Related tables get their own flat files that import_hsds reads back."""
+
+    org = Organization.objects.create(name="Org", description="Desc")
+    service = Service.objects.create(organization=org, name="Svc", status="active")
+    Phone.objects.create(service=service, number="555-010-0100")
+    output = tmp_path / "hsds.zip"
+    call_command("export_hsds_csv", str(output))
+
+    with zipfile.ZipFile(output) as archive:
+        package = json.loads(archive.read("datapackage.json"))
+        phones = list(csv.DictReader(io.TextIOWrapper(archive.open("phones.csv"))))
+    assert "phones" in [r["name"] for r in package["resources"]]
+    assert phones[0]["service_id"] == str(service.pk)
+    assert "number_digits" not in phones[0]
+
+    Phone.objects.all().delete()
+    call_command("import_hsds", str(output))
+    assert Phone.objects.get().number_digits == "15550100100"
+
+
+@pytest.mark.django_db
+def test_exports_with_jobs_match_sequential_output(tmp_path, monkeypatch) -> None:
+    """``--jobs`` assembles the same files; the pool maps calls in order."""
+
+    org = Organization.objects.create(name="Org", description="Desc")
+    Service.objects.create(organization=org, name="Svc", status="active")
+    for jobs in ("1", "3"):
+        call_command("export_hsds_csv", str(tmp_path / f"csv{jobs}"), "--jobs", jobs)
+        call_command("export_hsds_json", str(tmp_path / f"{jobs}.json"), "--jobs", jobs)
+    for name in ("organizations.csv", "services.csv", "datapackage.json"):
+        assert (tmp_path / "csv1" / name).read_text() == (tmp_path / "csv3" / name).read_text()
+    assert json.loads((tmp_path / "1.json").read_text()) == json.loads(
+        (tmp_path / "3.json").read_text()
+    )
+
+    monkeypatch.setattr(parallel, "can_fork_workers", lambda: True)
+    assert parallel.run_parallel(pow, [(2, 3), (3, 2), (2, 0)], 2) == [8, 9, 1]
+
+
 @pytest.mark.django_db
 def test_seed_examples_creates_resources() -> None:
     """Command seeds full HSDS resource records."""
@@ -44,3 +106,87 @@ def test_seed_examples_creates_resources() -> None:
     assert Location.objects.count() == 3
     assert Service.objects.count() == 3
     assert ServiceAtLocation.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_normalize_phone_numbers_backfills_digits() -> None:
+    org = Organization.objects.create(name="Org", description="d")
+    phone = Phone.objects.create(organization=org, number="(555) 010-0100 ext. 4")
+    Phone.objects.filter(pk=phone.pk).update(number_digits="", number_digits_reversed="")
+
+    call_command("normalize_phone_numbers", "--batch-size", "1")
+
+    phone.refresh_from_db()
+    assert phone.number_digits == "15550100100"
+    assert phone.number_digits_reversed == "00100105551"
+
+
+@pytest.mark.django_db
+def test_import_hsds_round_trips_json_export(tmp_path) -> None:
+    """Importing an export upserts rows by id, including nested children."""
+
+    org = Organization.objects.create(name="Org", description="Desc")
+    service = Service.objects.create(organization=org, name="Svc", status="active")
+    Phone.objects.create(service=service, number="555-010-0100")
+    output = tmp_path / "export.json.gz"
+    call_command("export_hsds_json", str(output))
+    Phone.objects.all().delete()
+    Service.objects.filter(pk=service.pk).update(name="Changed")
+
+    call_command("import_hsds", str(output), "--batch-size", "1")
+
+    service.refresh_from_db()
+    assert service.name == "Svc"
+    phone = Phone.objects.get(service=service)
+    assert phone.number_digits == "15550100100"
+    assert Organization.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_import_hsds_reads_json_incrementally(tmp_path, monkeypatch) -> None:
+    """Records are decoded one at a time, across reads of any size."""
+
+    org = Organization.objects.create(name="Org \u00e9", description="Desc")
+    for i in range(3):
+        service = Service.objects.create(organization=org, name=f"Svc {i}", status="active")
+        Phone.objects.create(service=service, number=f"555-010-010{i}")
+    output = tmp_path / "export.json"
+    call_command("export_hsds_json", str(output))
+    document = json.loads(output.read_text())
+    expected = [(table, record) for table, records in document.items() for record in records]
+
+    monkeypatch.setattr(import_hsds, "READ_SIZE", 7)
+    records = import_hsds.read_json(output)
+    model, first = next(records)
+    assert (model, first) == (import_hsds.TABLE_MODELS[expected[0][0]], expected[0][1])
+    assert [record for _, record in records] == [record for _, record in expected[1:]]
+
+    for text, message in (
+        ("[]", "must be an object"),
+        ('{"bogus": []}', "Unknown HSDS table"),
+        ('{"organizations": {}}', "must be a list"),
+        ('{"organizations": [{"id": 1}', "unterminated"),
+    ):
+        output.write_text(text)
+        with pytest.raises(CommandError, match=message):
+            list(import_hsds.read_json(output))
+
+
+@pytest.mark.django_db
+def test_import_hsds_reads_csv_directory(tmp_path) -> None:
+    """Per-table CSV files are imported in dependency order."""
+
+    org_id = "00000000-0000-0000-0000-000000000001"
+    service_id = "00000000-0000-0000-0000-000000000002"
+    (tmp_path / "services.csv").write_text(
+        f"id,organization_id,name,status,email\n{service_id},{org_id},Svc,active,\n"
+    )
+    (tmp_path / "organizations.csv").write_text(
+        f"id,name,description\n{org_id},Org,Desc\n"
+    )
+
+    call_command("import_hsds", str(tmp_path))
+
+    service = Service.objects.get(pk=service_id)
+    assert service.organization.name == "Org"
+    assert service.email is None
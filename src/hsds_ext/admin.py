@@ -4,8 +4,12 @@ from __future__ import annotations
 from django.contrib import admin
 
 from .models.bulk_ops import BulkOperation
+from .models.change_log import ChangeLogEntry
 from .models.change_requests import ChangeRequest
 from .models.drafts import DraftResource
+from .models.health import HealthMetric
+from .models.jobs import Job
+from .models.search import SearchDocument
 from .models.sensitive import SensitiveOverlay
 from .models.shelves import Shelf, ShelfMember
 from .models.worklists import Worklist
@@ -135,3 +139,36 @@ class TaxonomyExtensionAdmin(admin.ModelAdmin):
     list_display = ("entity_type", "entity_id", "namespace", "key")
     list_filter = ("entity_type", "namespace")
     search_fields = ("key",)
+
+
+@admin.register(ChangeLogEntry)
+class ChangeLogEntryAdmin(admin.ModelAdmin):
+    """Admin configuration for change log entries."""
+
+    list_display = ("id", "entity_type", "entity_id", "action", "changed_at")
+    list_filter = ("entity_type", "action")
+    search_fields = ("entity_id",)
+
+
+@admin.register(HealthMetric)
+class HealthMetricAdmin(admin.ModelAdmin):
+    """Admin configuration for materialized health metrics."""
+
+    list_display = ("key", "count", "computed_at", "updated_at")
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """Admin configuration for background jobs."""
+
+    list_display = ("id", "kind", "status", "progress_done", "progress_total", "created_at")
+    list_filter = ("kind", "status")
+
+
+@admin.register(SearchDocument)
+class SearchDocumentAdmin(admin.ModelAdmin):
+    """Admin configuration for search documents."""
+
+    list_display = ("entity_type", "entity_id", "name", "updated_at")
+    list_filter = ("entity_type",)
+    search_fields = ("name", "text")
@@ -8,3 +8,9 @@ class HsdsExtConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "hsds_ext"
     verbose_name = "HSDS Extensions"
+
+    def ready(self) -> None:  # pragma: no cover - side effects only
+        # Record writes to HSDS models in the change log.
+        from . import signals
+
+        signals.connect()
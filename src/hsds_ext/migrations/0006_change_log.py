@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-18 05:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds_ext', '0005_change_request_note'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogEntry',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('entity_type', models.CharField(help_text='HSDS model name, e.g. ``service`` or ``phone``.', max_length=64)),
+                ('entity_id', models.UUIDField()),
+                ('action', models.CharField(choices=[('upsert', 'Upsert'), ('delete', 'Delete')], max_length=8)),
+                ('changed_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'hsds_ext_change_log',
+                'indexes': [models.Index(fields=['entity_type', 'entity_id'], name='hsds_ext_ch_entity__fd878f_idx')],
+            },
+        ),
+    ]
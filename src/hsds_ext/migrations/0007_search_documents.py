@@ -0,0 +1,139 @@
+# Generated by Django 5.2.5 on 2026-10-18 05:57
+
+import django.contrib.postgres.search
+import uuid
+from django.db import migrations, models
+
+
+def create_search_indexes(apps, schema_editor):
+    """Add GIN full-text and trigram indexes when using PostgreSQL."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS hsds_ext_search_vector_gin "
+        "ON hsds_ext_search_documents USING gin (search_vector);"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS hsds_ext_search_text_trgm "
+        "ON hsds_ext_search_documents USING gin (text gin_trgm_ops);"
+    )
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _document(SearchDocument, entity_type, entity_id, name, addresses, phones, extra=()):
+    """Return an unsaved document, as ``resources.utils.search_index`` builds it."""
+    labels = [f"{a.address_1}, {a.city}" for a in addresses]
+    address = labels[0] if labels else ""
+    parts = [name, address, *phones, *extra, *labels[1:]]
+    return SearchDocument(
+        entity_type=entity_type,
+        entity_id=entity_id,
+        name=name,
+        address=address,
+        phones=phones,
+        text=" ".join(part for part in parts if part).lower(),
+    )
+
+
+def backfill_search_documents(apps, schema_editor):
+    """Index the existing organizations, locations and services.
+
+    Uses the historical models, so it mirrors the document builders rather
+    than importing them; ``rebuild_search_index`` produces the same rows.
+    """
+    SearchDocument = apps.get_model("hsds_ext", "SearchDocument")
+    Organization = apps.get_model("hsds", "Organization")
+    Location = apps.get_model("hsds", "Location")
+    Service = apps.get_model("hsds", "Service")
+
+    def documents():
+        for org in Organization.objects.prefetch_related("phones").iterator(
+            chunk_size=BACKFILL_BATCH_SIZE
+        ):
+            yield _document(
+                SearchDocument,
+                "organization",
+                org.id,
+                org.name or "",
+                [],
+                [p.number for p in org.phones.all()],
+            )
+        for loc in Location.objects.prefetch_related("addresses", "phones").iterator(
+            chunk_size=BACKFILL_BATCH_SIZE
+        ):
+            yield _document(
+                SearchDocument,
+                "location",
+                loc.id,
+                loc.name or "",
+                list(loc.addresses.all()),
+                [p.number for p in loc.phones.all()],
+            )
+        services = Service.objects.select_related("organization").prefetch_related(
+            "phones", "locations__addresses"
+        )
+        for svc in services.iterator(chunk_size=BACKFILL_BATCH_SIZE):
+            yield _document(
+                SearchDocument,
+                "service",
+                svc.id,
+                svc.name or "",
+                [a for loc in svc.locations.all() for a in loc.addresses.all()],
+                [p.number for p in svc.phones.all()],
+                [svc.organization.name or ""],
+            )
+
+    batch = []
+    for document in documents():
+        batch.append(document)
+        if len(batch) == BACKFILL_BATCH_SIZE:
+            SearchDocument.objects.bulk_create(batch)
+            batch = []
+    SearchDocument.objects.bulk_create(batch)
+    if schema_editor.connection.vendor == "postgresql":
+        vector = django.contrib.postgres.search.SearchVector
+        SearchDocument.objects.update(
+            search_vector=vector("name", weight="A", config="simple")
+            + vector("text", weight="B", config="simple")
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    """Reverse operation: drop the GIN indexes if they exist."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS hsds_ext_search_vector_gin;")
+    schema_editor.execute("DROP INDEX IF EXISTS hsds_ext_search_text_trgm;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds', '0004_service_keyset_index'),
+        ('hsds_ext', '0006_change_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('entity_type', models.CharField(choices=[('organization', 'Organization'), ('location', 'Location'), ('service', 'Service')], max_length=32)),
+                ('entity_id', models.UUIDField()),
+                ('name', models.TextField(blank=True, default='')),
+                ('address', models.TextField(blank=True, default='')),
+                ('phones', models.JSONField(default=list)),
+                ('text', models.TextField(help_text='Lower-cased concatenation of all searchable values.')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'hsds_ext_search_documents',
+                'unique_together': {('entity_type', 'entity_id')},
+            },
+        ),
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.5 on 2026-10-18 06:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds_ext', '0007_search_documents'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HealthMetric',
+            fields=[
+                ('key', models.CharField(choices=[('no_phone', 'No phone'), ('no_hours', 'No hours'), ('not_geocoded', 'Not geocoded'), ('stale', 'Stale')], max_length=32, primary_key=True, serialize=False)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('computed_at', models.DateTimeField(blank=True, help_text='Time of the last full reconciliation; null until first computed.', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'hsds_ext_health_metrics',
+            },
+        ),
+        migrations.CreateModel(
+            name='HealthFlag',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('metric', models.CharField(choices=[('no_phone', 'No phone'), ('no_hours', 'No hours'), ('not_geocoded', 'Not geocoded'), ('stale', 'Stale')], max_length=32)),
+                ('entity_id', models.UUIDField()),
+            ],
+            options={
+                'db_table': 'hsds_ext_health_flags',
+                'indexes': [models.Index(fields=['entity_id'], name='hsds_ext_he_entity__f88222_idx')],
+                'unique_together': {('metric', 'entity_id')},
+            },
+        ),
+    ]
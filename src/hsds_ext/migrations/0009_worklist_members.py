@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-18 06:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds_ext', '0008_health_metrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='worklist',
+            name='snapshot_at',
+            field=models.DateTimeField(blank=True, help_text='When the ordered membership snapshot was last taken.', null=True),
+        ),
+        migrations.CreateModel(
+            name='WorklistMember',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('position', models.PositiveIntegerField()),
+                ('service_id', models.UUIDField()),
+                ('worklist', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='members', to='hsds_ext.worklist')),
+            ],
+            options={
+                'db_table': 'hsds_ext_worklist_members',
+                'ordering': ['position'],
+                'indexes': [models.Index(fields=['worklist', 'service_id'], name='hsds_ext_wo_worklis_ab325d_idx')],
+                'unique_together': {('worklist', 'position')},
+            },
+        ),
+    ]
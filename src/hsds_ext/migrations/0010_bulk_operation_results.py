@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-18 06:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds_ext', '0009_worklist_members'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bulkoperation',
+            name='results',
+            field=models.JSONField(blank=True, help_text='Per-target outcome recorded at commit.', null=True),
+        ),
+        migrations.AddField(
+            model_name='bulkoperation',
+            name='stats',
+            field=models.JSONField(blank=True, help_text='Outcome counts and throughput of the commit.', null=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-18 06:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds_ext', '0011_jobs'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='changerequest',
+            name='diff',
+            field=models.JSONField(blank=True, help_text='Field-level before/after values computed at submit time.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='changerequest',
+            index=models.Index(fields=['status', '-submitted_at', '-id'], name='hsds_ext_cr_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.5 on 2026-10-18 06:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds_ext', '0012_change_request_diff'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='changerequest',
+            name='claimed_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='change_requests_claimed', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='changerequest',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='draftresource',
+            name='claimed_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='draft_resources_claimed', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='draftresource',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='changerequest',
+            index=models.Index(fields=['status', 'claimed_until'], name='hsds_ext_cr_lease_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='draftresource',
+            index=models.Index(fields=['status', 'claimed_until'], name='hsds_ext_draft_lease_idx'),
+        ),
+    ]
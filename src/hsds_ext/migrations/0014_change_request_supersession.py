@@ -0,0 +1,67 @@
+# Generated by Django 5.2.5 on 2026-10-18 06:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_paths(apps, schema_editor):
+    """Record the field paths written by existing change requests."""
+    ChangeRequest = apps.get_model("hsds_ext", "ChangeRequest")
+    for change_request in ChangeRequest.objects.all().only("id", "patch"):
+        paths = set()
+        for op in change_request.patch or []:
+            if isinstance(op, dict) and op.get("op") != "test":
+                parts = str(op.get("path", "")).lstrip("/").split("/")
+                paths.add(".".join(parts[:2]))
+        change_request.paths = sorted(paths)
+        change_request.save(update_fields=["paths"])
+
+
+def create_paths_gin_index(apps, schema_editor):
+    """Index the path set for containment lookups on PostgreSQL."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS hsds_ext_cr_paths_gin "
+        "ON hsds_ext_change_requests USING gin (paths jsonb_path_ops);"
+    )
+
+
+def drop_paths_gin_index(apps, schema_editor):
+    """Drop the path set index if it exists."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS hsds_ext_cr_paths_gin;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds_ext', '0013_review_leases'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='changerequest',
+            name='paths',
+            field=models.JSONField(blank=True, default=list, help_text='Sorted field paths (e.g. ``service.name``) the patch writes.'),
+        ),
+        migrations.AddField(
+            model_name='changerequest',
+            name='superseded_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='supersedes', to='hsds_ext.changerequest'),
+        ),
+        migrations.AlterField(
+            model_name='changerequest',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('superseded', 'Superseded')], default='pending', max_length=16),
+        ),
+        migrations.AddIndex(
+            model_name='changerequest',
+            index=models.Index(fields=['target_entity_id', 'status'], name='hsds_ext_cr_target_idx'),
+        ),
+        migrations.RunPython(backfill_paths, migrations.RunPython.noop),
+        migrations.RunPython(create_paths_gin_index, drop_paths_gin_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 07:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds_ext', '0014_change_request_supersession'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bulkoperation',
+            name='status',
+            field=models.CharField(choices=[('staged', 'Staged'), ('committing', 'Committing'), ('committed', 'Committed'), ('undone', 'Undone')], default='staged', max_length=16),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-18 07:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hsds_ext', '0015_bulk_operation_committing'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='changerequest',
+            name='contributors',
+            field=models.ManyToManyField(blank=True, help_text='Earlier submitters whose coalesced edits this request carries.', related_name='change_requests_contributed', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -1,10 +1,14 @@
 """HSDS extension models package."""
 from .bulk_ops import BulkOperation
+from .change_log import ChangeLogEntry
 from .change_requests import ChangeRequest
 from .drafts import DraftResource
+from .health import HealthFlag, HealthMetric
+from .jobs import Job
+from .search import SearchDocument
 from .sensitive import SensitiveOverlay
 from .shelves import Shelf, ShelfMember
-from .worklists import Worklist
+from .worklists import Worklist, WorklistMember
 from .taxonomy_ext import TaxonomyExtension
 from .verification import VerificationEvent
 from .versions import FieldVersion
@@ -13,11 +17,17 @@ __all__ = [
     "VerificationEvent",
     "FieldVersion",
     "SensitiveOverlay",
+    "SearchDocument",
     "DraftResource",
     "ChangeRequest",
     "Shelf",
     "ShelfMember",
     "Worklist",
+    "WorklistMember",
     "BulkOperation",
+    "Job",
+    "ChangeLogEntry",
+    "HealthMetric",
+    "HealthFlag",
     "TaxonomyExtension",
 ]
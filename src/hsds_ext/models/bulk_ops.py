@@ -20,6 +20,7 @@ class BulkOperation(models.Model):
         """Lifecycle status of the operation."""
 
         STAGED = "staged", "Staged"
+        COMMITTING = "committing", "Committing"
         COMMITTED = "committed", "Committed"
         UNDONE = "undone", "Undone"
 
@@ -34,12 +35,26 @@ class BulkOperation(models.Model):
     targets = models.JSONField(help_text="Target entities for the operation.")
     patch = models.JSONField(help_text="RFC6902 patch to apply to targets.")
     preview = models.JSONField(blank=True, null=True, help_text="Precomputed preview data.")
+    results = models.JSONField(
+        blank=True, null=True, help_text="Per-target outcome recorded at commit."
+    )
+    stats = models.JSONField(
+        blank=True, null=True, help_text="Outcome counts and throughput of the commit."
+    )
     status = models.CharField(
         max_length=16, choices=Status.choices, default=Status.STAGED
     )
     undo_token = models.TextField(blank=True, null=True)
     committed_at = models.DateTimeField(blank=True, null=True)
     undone_at = models.DateTimeField(blank=True, null=True)
+    job = models.ForeignKey(
+        "hsds_ext.Job",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="bulk_operations",
+        help_text="Most recent background job committing or undoing this operation.",
+    )
 
     class Meta:
         """Model metadata."""
@@ -0,0 +1,59 @@
+"""Models for the append-only HSDS change log."""
+from __future__ import annotations
+
+from typing import Iterable
+from uuid import UUID
+
+from django.db import models
+
+
+class ChangeLogEntry(models.Model):
+    """A single create/update or delete of an HSDS row.
+
+    Entries are only ever appended; the auto-incrementing primary key is the
+    cursor handed to change feed consumers.
+    """
+
+    class Action(models.TextChoices):
+        """Kind of change recorded."""
+
+        UPSERT = "upsert", "Upsert"
+        DELETE = "delete", "Delete"
+
+    id = models.BigAutoField(primary_key=True)
+    entity_type = models.CharField(
+        max_length=64, help_text="HSDS model name, e.g. ``service`` or ``phone``."
+    )
+    entity_id = models.UUIDField()
+    action = models.CharField(max_length=8, choices=Action.choices)
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Model metadata."""
+
+        db_table = "hsds_ext_change_log"
+        indexes = [
+            models.Index(fields=["entity_type", "entity_id"]),
+        ]
+
+    @classmethod
+    def record(
+        cls, model: type[models.Model], entity_ids: Iterable[UUID | str], action: str
+    ) -> None:
+        """Append one entry per id in ``entity_ids`` for rows of ``model``.
+
+        Bulk writes (``QuerySet.update``, ``bulk_create``) bypass model signals
+        and must call this explicitly.
+        """
+
+        entity_type = model._meta.model_name
+        cls.objects.bulk_create(
+            [
+                cls(entity_type=entity_type, entity_id=entity_id, action=action)
+                for entity_id in entity_ids
+            ]
+        )
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        """Return string representation for admin."""
+        return f"#{self.id} {self.action} {self.entity_type}:{self.entity_id}"
@@ -24,11 +24,22 @@ class ChangeRequest(models.Model):
         PENDING = "pending", "Pending"
         APPROVED = "approved", "Approved"
         REJECTED = "rejected", "Rejected"
+        SUPERSEDED = "superseded", "Superseded"
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     target_entity_type = models.CharField(max_length=32, choices=EntityType.choices)
     target_entity_id = models.UUIDField()
     patch = models.JSONField(help_text="RFC6902 patch against canonical HSDS JSON.")
+    diff = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Field-level before/after values computed at submit time.",
+    )
+    paths = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Sorted field paths (e.g. ``service.name``) the patch writes.",
+    )
     note = models.TextField(blank=True, null=True)
     status = models.CharField(
         max_length=16, choices=Status.choices, default=Status.PENDING
@@ -38,6 +49,12 @@ class ChangeRequest(models.Model):
         on_delete=models.CASCADE,
         related_name="change_requests_submitted",
     )
+    contributors = models.ManyToManyField(
+        settings.AUTH_USER_MODEL,
+        related_name="change_requests_contributed",
+        blank=True,
+        help_text="Earlier submitters whose coalesced edits this request carries.",
+    )
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -47,6 +64,21 @@ class ChangeRequest(models.Model):
         null=True,
     )
     reviewed_at = models.DateTimeField(blank=True, null=True)
+    claimed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name="change_requests_claimed",
+        blank=True,
+        null=True,
+    )
+    claimed_until = models.DateTimeField(blank=True, null=True)
+    superseded_by = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        related_name="supersedes",
+        blank=True,
+        null=True,
+    )
 
     class Meta:
         """Model metadata."""
@@ -55,6 +87,13 @@ class ChangeRequest(models.Model):
         indexes = [
             models.Index(fields=["status"]),
             models.Index(fields=["target_entity_type", "target_entity_id"]),
+            models.Index(
+                fields=["status", "-submitted_at", "-id"], name="hsds_ext_cr_queue_idx"
+            ),
+            models.Index(fields=["status", "claimed_until"], name="hsds_ext_cr_lease_idx"),
+            models.Index(
+                fields=["target_entity_id", "status"], name="hsds_ext_cr_target_idx"
+            ),
         ]
 
     def __str__(self) -> str:  # pragma: no cover - simple representation
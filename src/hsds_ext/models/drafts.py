@@ -29,11 +29,22 @@ class DraftResource(models.Model):
     )
     payload = models.JSONField(help_text="Composite HSDS payload for review.")
     review_note = models.TextField(blank=True, null=True)
+    claimed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name="draft_resources_claimed",
+        blank=True,
+        null=True,
+    )
+    claimed_until = models.DateTimeField(blank=True, null=True)
 
     class Meta:
         """Model metadata."""
 
         db_table = "hsds_ext_draft_resources"
+        indexes = [
+            models.Index(fields=["status", "claimed_until"], name="hsds_ext_draft_lease_idx")
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple representation
         """Return string representation for admin."""
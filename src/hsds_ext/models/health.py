@@ -0,0 +1,64 @@
+"""Materialized data-health metrics for the Pulse dashboard."""
+from __future__ import annotations
+
+from django.db import models
+
+
+class HealthMetric(models.Model):
+    """Running count of entities failing one data-health check.
+
+    Counts are adjusted incrementally by ``resources.signals`` as the
+    underlying rows change and recomputed from scratch by the
+    ``reconcile_health_metrics`` command, which also stamps ``computed_at``.
+    """
+
+    class Key(models.TextChoices):
+        """Health checks tracked on the dashboard."""
+
+        NO_PHONE = "no_phone", "No phone"
+        NO_HOURS = "no_hours", "No hours"
+        NOT_GEOCODED = "not_geocoded", "Not geocoded"
+        STALE = "stale", "Stale"
+
+    key = models.CharField(max_length=32, choices=Key.choices, primary_key=True)
+    count = models.PositiveIntegerField(default=0)
+    computed_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="Time of the last full reconciliation; null until first computed.",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Model metadata."""
+
+        db_table = "hsds_ext_health_metrics"
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        """Return string representation for admin."""
+        return f"{self.key}={self.count}"
+
+
+class HealthFlag(models.Model):
+    """Membership of one entity in a :class:`HealthMetric` count.
+
+    Keeping the failing entities lets signal handlers work out whether a
+    write moved an entity into or out of a metric without rescanning.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    metric = models.CharField(max_length=32, choices=HealthMetric.Key.choices)
+    entity_id = models.UUIDField()
+
+    class Meta:
+        """Model metadata."""
+
+        db_table = "hsds_ext_health_flags"
+        unique_together = ("metric", "entity_id")
+        indexes = [
+            models.Index(fields=["entity_id"]),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        """Return string representation for admin."""
+        return f"{self.metric}:{self.entity_id}"
@@ -0,0 +1,70 @@
+"""Models for the database-backed background job queue."""
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import models
+
+
+class Job(models.Model):
+    """A unit of background work claimed by a ``run_workers`` process.
+
+    Workers claim queued rows with ``SELECT ... FOR UPDATE SKIP LOCKED`` so
+    any number of worker processes can poll the table without contention.
+    """
+
+    class Status(models.TextChoices):
+        """Lifecycle status of a job."""
+
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    id = models.BigAutoField(primary_key=True)
+    kind = models.CharField(max_length=64, help_text="Name of the registered handler.")
+    payload = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=16, choices=Status.choices, default=Status.QUEUED
+    )
+    progress_done = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(default=0)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True, default="")
+    worker = models.CharField(max_length=128, blank=True, default="")
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="jobs",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    heartbeat_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        """Model metadata."""
+
+        db_table = "hsds_ext_jobs"
+        indexes = [
+            models.Index(fields=["status", "id"]),
+        ]
+
+    @property
+    def is_active(self) -> bool:
+        """Return whether the job is still waiting or running."""
+
+        return self.status in {self.Status.QUEUED, self.Status.RUNNING}
+
+    @property
+    def percent(self) -> int:
+        """Return completion as a whole percentage."""
+
+        if not self.progress_total:
+            return 100 if self.status == self.Status.DONE else 0
+        return min(100, self.progress_done * 100 // self.progress_total)
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        """Return string representation for admin."""
+        return f"Job {self.id} {self.kind} ({self.status})"
@@ -0,0 +1,43 @@
+"""Denormalized search documents for duplicate hints and worklists."""
+from __future__ import annotations
+
+import uuid
+
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """Flattened searchable text for an organization, service, or location.
+
+    Rows are maintained on write by ``resources.signals``. On PostgreSQL the
+    ``search_vector`` column carries a GIN full-text index and ``text`` a
+    ``gin_trgm_ops`` trigram index (see migration ``0007_search_documents``).
+    """
+
+    class EntityType(models.TextChoices):
+        """HSDS entity types that are indexed."""
+
+        ORGANIZATION = "organization", "Organization"
+        LOCATION = "location", "Location"
+        SERVICE = "service", "Service"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    entity_type = models.CharField(max_length=32, choices=EntityType.choices)
+    entity_id = models.UUIDField()
+    name = models.TextField(blank=True, default="")
+    address = models.TextField(blank=True, default="")
+    phones = models.JSONField(default=list)
+    text = models.TextField(help_text="Lower-cased concatenation of all searchable values.")
+    search_vector = SearchVectorField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Model metadata."""
+
+        db_table = "hsds_ext_search_documents"
+        unique_together = ("entity_type", "entity_id")
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        """Return string representation for admin."""
+        return f"{self.entity_type}:{self.name}"
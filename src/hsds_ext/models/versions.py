@@ -2,9 +2,31 @@
 from __future__ import annotations
 
 import uuid
+from typing import Iterable
+from uuid import UUID
 
 from django.conf import settings
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from hsds.signals import versions_bumped
+
+_UPSERT_SQL = """
+INSERT INTO {table} (id, entity_type, entity_id, field_path, version, updated_at, updated_by_id)
+VALUES {rows}
+ON CONFLICT (entity_type, entity_id, field_path) DO UPDATE SET
+    version = {table}.version + 1,
+    updated_at = EXCLUDED.updated_at,
+    updated_by_id = EXCLUDED.updated_by_id
+RETURNING entity_type, entity_id, field_path, version
+"""
+
+UPSERT_BATCH_SIZE = 500
+"""Maximum rows per upsert statement, keeping within SQLite's bind limit."""
+
+VersionKey = tuple[str, str, str]
+"""``(entity_type, entity_id, field_path)`` identifying one versioned field."""
 
 
 class FieldVersion(models.Model):
@@ -42,3 +64,129 @@ class FieldVersion(models.Model):
     def __str__(self) -> str:  # pragma: no cover - simple representation
         """Return string representation for admin."""
         return f"{self.entity_type}:{self.field_path} v{self.version}"
+
+    @classmethod
+    def bump(
+        cls,
+        entity_type: str,
+        entity_id: UUID | str,
+        field_paths: Iterable[str],
+        user: settings.AUTH_USER_MODEL,
+    ) -> dict[str, int]:
+        """Increment the versions of ``field_paths`` and return the new values.
+
+        Missing rows start at version 1. On PostgreSQL and SQLite 3.35+ all
+        paths are bumped by a single ``INSERT ... ON CONFLICT DO UPDATE ...
+        RETURNING`` statement; other backends lock and update the existing
+        rows and bulk-create the rest.
+        """
+
+        keys = [(entity_type, entity_id, path) for path in field_paths]
+        return {path: version for (_, _, path), version in cls.bump_many(keys, user).items()}
+
+    @classmethod
+    def bump_many(
+        cls,
+        keys: Iterable[VersionKey],
+        user: settings.AUTH_USER_MODEL,
+    ) -> dict[VersionKey, int]:
+        """Bump ``(entity_type, entity_id, field_path)`` keys across entities.
+
+        Behaves like :meth:`bump` but accepts paths of many entities, issuing
+        one upsert per :data:`UPSERT_BATCH_SIZE` keys. Returned keys carry the
+        entity id as a string. Sends :data:`hsds.signals.versions_bumped`
+        since the upsert bypasses model signals.
+        """
+
+        unique = sorted({(t, str(i), p) for t, i, p in keys})
+        if not unique:
+            return {}
+        if not cls._supports_upsert_returning():
+            versions = cls._bump_fallback(unique, user)
+        else:
+            versions = {}
+            for start in range(0, len(unique), UPSERT_BATCH_SIZE):
+                versions.update(
+                    cls._bump_upsert(unique[start : start + UPSERT_BATCH_SIZE], user)
+                )
+        versions_bumped.send(sender=cls, keys=list(versions))
+        return versions
+
+    @staticmethod
+    def _supports_upsert_returning() -> bool:
+        """Return whether the backend has ``ON CONFLICT`` and ``RETURNING``."""
+
+        if connection.vendor == "postgresql":
+            return True
+        if connection.vendor == "sqlite":
+            return connection.Database.sqlite_version_info >= (3, 35)
+        return False
+
+    @classmethod
+    def _bump_upsert(cls, keys: list[VersionKey], user) -> dict[VersionKey, int]:
+        """Bump ``keys`` with one upsert statement."""
+
+        opts = cls._meta
+        qn = connection.ops.quote_name
+        prep = {
+            name: opts.get_field(name)
+            for name in ("id", "entity_id", "updated_at", "updated_by")
+        }
+        now = prep["updated_at"].get_db_prep_value(timezone.now(), connection)
+        user_id = prep["updated_by"].get_db_prep_value(user.pk, connection)
+        params: list = []
+        for entity_type, entity_id, path in keys:
+            params.extend(
+                [
+                    prep["id"].get_db_prep_value(uuid.uuid4(), connection),
+                    entity_type,
+                    prep["entity_id"].get_db_prep_value(entity_id, connection),
+                    path,
+                    1,
+                    now,
+                    user_id,
+                ]
+            )
+        rows = ", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(keys))
+        sql = _UPSERT_SQL.format(table=qn(opts.db_table), rows=rows)
+        to_uuid = prep["entity_id"].to_python
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return {
+                (entity_type, str(to_uuid(entity_id)), path): version
+                for entity_type, entity_id, path, version in cursor.fetchall()
+            }
+
+    @classmethod
+    def _bump_fallback(cls, keys: list[VersionKey], user) -> dict[VersionKey, int]:
+        """Bump ``keys`` per entity with a locked update plus a bulk insert."""
+
+        by_entity: dict[tuple[str, str], list[str]] = {}
+        for entity_type, entity_id, path in keys:
+            by_entity.setdefault((entity_type, entity_id), []).append(path)
+
+        result: dict[VersionKey, int] = {}
+        with transaction.atomic():
+            for (entity_type, entity_id), paths in by_entity.items():
+                existing = cls.objects.select_for_update().filter(
+                    entity_type=entity_type, entity_id=entity_id, field_path__in=paths
+                )
+                existing.update(
+                    version=F("version") + 1, updated_by=user, updated_at=timezone.now()
+                )
+                versions = dict(existing.values_list("field_path", "version"))
+                cls.objects.bulk_create(
+                    [
+                        cls(
+                            entity_type=entity_type,
+                            entity_id=entity_id,
+                            field_path=path,
+                            updated_by=user,
+                        )
+                        for path in paths
+                        if path not in versions
+                    ]
+                )
+                for path in paths:
+                    result[(entity_type, entity_id, path)] = versions.get(path, 1)
+        return result
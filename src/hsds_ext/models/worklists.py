@@ -20,9 +20,41 @@ class Worklist(models.Model):
     query = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     is_shared = models.BooleanField(default=False)
+    snapshot_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the ordered membership snapshot was last taken.",
+    )
 
     class Meta:
         db_table = "hsds_ext_worklists"
 
     def __str__(self) -> str:  # pragma: no cover - representation
         return self.name
+
+
+class WorklistMember(models.Model):
+    """A service at a fixed position in a worklist's result snapshot.
+
+    Navigation looks rows up by ``(worklist, position)`` or
+    ``(worklist, service_id)`` so the search is not re-run per keypress and
+    the order stays put until the snapshot is refreshed.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    worklist = models.ForeignKey(
+        Worklist, on_delete=models.CASCADE, related_name="members"
+    )
+    position = models.PositiveIntegerField()
+    service_id = models.UUIDField()
+
+    class Meta:
+        db_table = "hsds_ext_worklist_members"
+        unique_together = ("worklist", "position")
+        indexes = [
+            models.Index(fields=["worklist", "service_id"]),
+        ]
+        ordering = ["position"]
+
+    def __str__(self) -> str:  # pragma: no cover - representation
+        return f"{self.worklist_id}#{self.position}"
@@ -0,0 +1,89 @@
+"""Signal handlers that append HSDS writes to the change log."""
+from __future__ import annotations
+
+from typing import Any
+
+from django.apps import apps
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from hsds.signals import bulk_written
+
+from .models.change_log import ChangeLogEntry
+
+
+def _record_save(sender: type[Model], instance: Model, raw: bool = False, **kwargs: Any) -> None:
+    """Record an upsert for a saved HSDS row (fixture loading is ignored)."""
+
+    if raw:
+        return
+    ChangeLogEntry.record(sender, [instance.pk], ChangeLogEntry.Action.UPSERT)
+
+
+def _record_delete(sender: type[Model], instance: Model, **kwargs: Any) -> None:
+    """Record a tombstone for a deleted HSDS row."""
+
+    ChangeLogEntry.record(sender, [instance.pk], ChangeLogEntry.Action.DELETE)
+
+
+def _record_m2m(
+    sender: type[Model],
+    instance: Model,
+    action: str,
+    model: type[Model],
+    pk_set: set | None,
+    **kwargs: Any,
+) -> None:
+    """Record a ``Service.locations`` change: both sides and the link rows.
+
+    Added ``ServiceAtLocation`` rows are recorded as upserts once written;
+    removed ones as tombstones before they are deleted, while their ids can
+    still be read.
+    """
+
+    if action in {"pre_remove", "pre_clear", "post_add"}:
+        links = sender.objects.filter(**{_m2m_side(sender, instance): instance.pk})
+        if pk_set is not None:
+            links = links.filter(**{f"{_m2m_side(sender, model)}__in": pk_set})
+        ChangeLogEntry.record(
+            sender,
+            links.values_list("pk", flat=True),
+            ChangeLogEntry.Action.UPSERT if action == "post_add" else ChangeLogEntry.Action.DELETE,
+        )
+    if action not in {"post_add", "post_remove", "post_clear"}:
+        return
+    ChangeLogEntry.record(type(instance), [instance.pk], ChangeLogEntry.Action.UPSERT)
+    if pk_set:
+        ChangeLogEntry.record(model, pk_set, ChangeLogEntry.Action.UPSERT)
+
+
+def _m2m_side(through: type[Model], model: Model | type[Model]) -> str:
+    """Return the name of the ``through`` foreign key pointing at ``model``."""
+
+    target = model if isinstance(model, type) else type(model)
+    return next(
+        f.name
+        for f in through._meta.concrete_fields
+        if f.is_relation and f.related_model is target
+    )
+
+
+def _record_bulk(sender: type[Model], ids: list, **kwargs: Any) -> None:
+    """Record upserts for rows written by a bulk operation."""
+
+    ChangeLogEntry.record(sender, ids, ChangeLogEntry.Action.UPSERT)
+
+
+def connect() -> None:
+    """Connect change-log receivers for every model in the ``hsds`` app."""
+
+    for model in apps.get_app_config("hsds").get_models():
+        post_save.connect(_record_save, sender=model, dispatch_uid=f"changelog-save-{model}")
+        post_delete.connect(
+            _record_delete, sender=model, dispatch_uid=f"changelog-delete-{model}"
+        )
+    service = apps.get_model("hsds", "Service")
+    m2m_changed.connect(
+        _record_m2m, sender=service.locations.through, dispatch_uid="changelog-m2m"
+    )
+    bulk_written.connect(_record_bulk, dispatch_uid="changelog-bulk")
@@ -0,0 +1,50 @@
+"""Tests for data migrations of the HSDS extension tables."""
+from __future__ import annotations
+
+import importlib
+from types import SimpleNamespace
+
+import pytest
+from django.apps import apps
+from django.db import connection
+
+from hsds.models import Address, Location, Organization, Phone, Service
+from hsds_ext.models import SearchDocument
+
+
+def _documents():
+    return sorted(
+        SearchDocument.objects.values_list(
+            "entity_type", "entity_id", "name", "address", "phones", "text"
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_search_document_backfill_matches_the_index_builders():
+    """Migration 0007 indexes existing rows the same way the signals do."""
+    migration = importlib.import_module("hsds_ext.migrations.0007_search_documents")
+    org = Organization.objects.create(name="Food Bank", description="d")
+    Phone.objects.create(number="555-0100", organization=org)
+    location = Location.objects.create(
+        name="Main", location_type=Location.LocationType.PHYSICAL, organization=org
+    )
+    for street in ("1 First St", "2 Second St"):
+        Address.objects.create(
+            location=location,
+            address_1=street,
+            city="City",
+            state_province="State",
+            postal_code="12345",
+            country="US",
+            address_type=Address.AddressType.PHYSICAL,
+        )
+    service = Service.objects.create(organization=org, name="Pantry", status=Service.Status.ACTIVE)
+    service.locations.add(location)
+    Phone.objects.create(number="555-0199", service=service)
+    expected = _documents()
+    assert len(expected) == 3
+
+    SearchDocument.objects.all().delete()
+    migration.backfill_search_documents(apps, SimpleNamespace(connection=connection))
+    assert _documents() == expected
@@ -51,6 +51,33 @@ def test_field_version_unique_constraint(django_user_model):
         )
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize("upsert", [True, False])
+def test_field_version_bump_increments_in_one_statement(
+    django_user_model, django_assert_num_queries, monkeypatch, upsert
+):
+    """Bumping inserts missing paths at 1 and increments existing ones."""
+    user = django_user_model.objects.create_user(username="bump", password="pw")
+    eid = uuid.uuid4()
+    monkeypatch.setattr(FieldVersion, "_supports_upsert_returning", staticmethod(lambda: upsert))
+    FieldVersion.bump(FieldVersion.EntityType.SERVICE, eid, ["service.name"], user)
+
+    if upsert:
+        with django_assert_num_queries(1):
+            versions = FieldVersion.bump(
+                FieldVersion.EntityType.SERVICE, eid, ["service.name", "service.url"], user
+            )
+    else:
+        versions = FieldVersion.bump(
+            FieldVersion.EntityType.SERVICE, eid, ["service.name", "service.url"], user
+        )
+
+    assert versions == {"service.name": 2, "service.url": 1}
+    assert dict(
+        FieldVersion.objects.filter(entity_id=eid).values_list("field_path", "version")
+    ) == versions
+
+
 @pytest.mark.django_db
 def test_sensitive_overlay_unique_constraint():
     """SensitiveOverlay is unique per entity."""
@@ -11,7 +11,16 @@ class BulkOperationPreview(Component):
     template_file = "bulk_operation_preview.html"
 
     def get_template_data(self, args, kwargs, slots, context):  # pragma: no cover - simple
-        """Provide the bulk operation to the template."""
+        """Provide the bulk operation and one page of preview rows."""
 
-        return {"operation": kwargs.get("operation")}
+        page = kwargs.get("page", 1)
+        pages = kwargs.get("pages", 1)
+        return {
+            "operation": kwargs.get("operation"),
+            "rows": kwargs.get("rows", []),
+            "page": page,
+            "pages": pages,
+            "previous_page": page - 1 if page > 1 else None,
+            "next_page": page + 1 if page < pages else None,
+        }
 
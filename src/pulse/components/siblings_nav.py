@@ -24,6 +24,8 @@ class SiblingsNav(Component):
         return {
             "loc_siblings": kwargs.get("loc_siblings", []),
             "org_siblings": kwargs.get("org_siblings", []),
+            "loc_page": kwargs.get("loc_page", {}),
+            "org_page": kwargs.get("org_page", {}),
             "prev_id": kwargs.get("prev_id", ""),
             "next_id": kwargs.get("next_id", ""),
             "first_loc": kwargs.get("first_loc", ""),
@@ -18,6 +18,7 @@ class HealthIndexView(TemplateView):
         ctx = super().get_context_data(**kwargs)
         stats = get_health_stats()
         worklist_base = reverse("pulse:worklists-index")
+        ctx["computed_at"] = stats["computed_at"]
         ctx["stats"] = [
             {
                 "label": "No phone",
@@ -8,16 +8,16 @@ from django.shortcuts import get_object_or_404, render
 from django.views import View
 
 from hsds.models import Service
-from hsds_ext.models import FieldVersion, VerificationEvent, SensitiveOverlay
-from resources.serializers.resource import ResourceSerializer
+from hsds_ext.models import VerificationEvent
+from resources.utils import resource_cache
 from resources.utils.siblings import get_sibling_data
 
 
 class ResourceDetailView(View):
     """Render the Resource detail shell with tabs.
 
-    The view assembles the composite HSDS resource using the existing
-    ``ResourceSerializer`` and passes it to the template for initial rendering.
+    The view reads the composite HSDS resource from the resource cache and
+    passes it to the template for initial rendering.
     Subsequent tab content is loaded via HTMX requests handled by
     :func:`section`.
     """
@@ -27,24 +27,7 @@ class ResourceDetailView(View):
     def _serialize(self, service: Service) -> Dict[str, Any]:
         """Return serialized resource data and verification metadata."""
 
-        versions = {
-            fv.field_path: fv.version
-            for fv in FieldVersion.objects.filter(
-                entity_type=FieldVersion.EntityType.SERVICE, entity_id=service.id
-            )
-        }
-        overlay = SensitiveOverlay.objects.filter(
-            entity_type=SensitiveOverlay.EntityType.SERVICE, entity_id=service.id
-        ).first()
-        serializer = ResourceSerializer(
-            {
-                "service": service,
-                "organization": service.organization,
-                "location": service.locations.first(),
-            },
-            context={"versions": versions, "sensitive_overlay": overlay},
-        )
-        data: Dict[str, Any] = serializer.data
+        data: Dict[str, Any] = dict(resource_cache.fetch(service.id).data)
 
         events = VerificationEvent.objects.filter(
             entity_type=VerificationEvent.EntityType.SERVICE, entity_id=service.id
@@ -63,6 +46,30 @@ class ResourceDetailView(View):
         data["verifications"] = verifications
         return data
 
+    def _siblings(self, request: HttpRequest, service: Service) -> Dict[str, Any]:
+        """Return sibling windows with links to the neighbouring windows.
+
+        ``org_start``/``loc_start`` in the query string select a window; the
+        links keep the other group's window in place.
+        """
+
+        starts = {}
+        for param in ("org_start", "loc_start"):
+            value = request.GET.get(param, "")
+            starts[param] = int(value) if value.isdigit() else None
+        siblings = get_sibling_data(service, **starts)
+        for key, param in (("organization_page", "org_start"), ("location_page", "loc_start")):
+            page = siblings[key]
+            for link in ("previous", "next"):
+                start = page[f"{link}_start"]
+                if start is None:
+                    page[f"{link}_url"] = ""
+                    continue
+                query = request.GET.copy()
+                query[param] = str(start)
+                page[f"{link}_url"] = f"?{query.urlencode()}"
+        return siblings
+
     def get(self, request: HttpRequest, id: str) -> HttpResponse:
         service = get_object_or_404(
             Service.objects.select_related("organization").prefetch_related("locations"),
@@ -70,7 +77,7 @@ class ResourceDetailView(View):
         )
         context = {
             "resource": self._serialize(service),
-            "siblings": get_sibling_data(service),
+            "siblings": self._siblings(request, service),
         }
         return render(request, self.template_name, context)
 
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 from django.contrib.auth.decorators import login_required
-from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseForbidden
 from django.shortcuts import get_object_or_404, render
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
 
-from hsds.models import Service
+from hsds.pagination import KeysetPagination
 from hsds_ext.models import ChangeRequest, DraftResource
-from resources.serializers.resource import ServiceSerializer
-from resources.utils.json_patch import apply_patch
+from resources.utils.change_review import QUEUE_ORDERING, status_counts, stored_diff
 from users.models import User
 
 
@@ -28,37 +29,40 @@ def draft_list(request: HttpRequest) -> HttpResponse:
 
 @login_required
 def change_request_queue(request: HttpRequest) -> HttpResponse:
-    """Render pending ChangeRequests for review."""
+    """Render one keyset page of pending ChangeRequests with status counts."""
 
     if request.user.role not in {User.Role.EDITOR, User.Role.ADMIN}:
         return HttpResponseForbidden()
-    requests = (
-        ChangeRequest.objects.filter(status=ChangeRequest.Status.PENDING)
-        .select_related("submitted_by")
-        .order_by("-submitted_at")
-    )
-    return render(request, "pulse/review/queue.html", {"requests": requests})
+    paginator = KeysetPagination()
+    paginator.ordering = QUEUE_ORDERING
+    try:
+        requests = paginator.paginate_queryset(
+            ChangeRequest.objects.filter(status=ChangeRequest.Status.PENDING)
+            .select_related("submitted_by")
+            .prefetch_related("contributors"),
+            Request(request),
+        )
+    except NotFound as exc:
+        raise Http404(str(exc.detail)) from exc
+    context = {
+        "requests": requests,
+        "counts": status_counts(),
+        "next_url": (
+            paginator.encode_cursor(paginator.last_key, False) if paginator.has_next else None
+        ),
+        "previous_url": (
+            paginator.encode_cursor(paginator.first_key, True) if paginator.has_previous else None
+        ),
+    }
+    return render(request, "pulse/review/queue.html", context)
 
 
 @login_required
 def change_request_detail(request: HttpRequest, id: str) -> HttpResponse:
-    """Render a single ``ChangeRequest`` with a field-level diff."""
+    """Render a single ``ChangeRequest`` with its stored field-level diff."""
 
     if request.user.role not in {User.Role.EDITOR, User.Role.ADMIN}:
         return HttpResponseForbidden()
     cr = get_object_or_404(ChangeRequest, id=id)
-    service = get_object_or_404(Service, id=cr.target_entity_id)
-
-    original = {"service": ServiceSerializer(service).data}
-    patched = apply_patch(original, cr.patch)
-    changes = []
-    for op in cr.patch:
-        field = op.get("path", "").lstrip("/").replace("/", ".")
-        before = original
-        after = patched
-        for part in field.split("."):
-            before = before.get(part) if isinstance(before, dict) else None
-            after = after.get(part) if isinstance(after, dict) else None
-        changes.append({"field": field, "before": before, "after": after})
-    context = {"change_request": cr, "changes": changes}
+    context = {"change_request": cr, "changes": stored_diff(cr)}
     return render(request, "pulse/review/detail.html", context)
@@ -8,3 +8,9 @@ class ResourcesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "resources"
     verbose_name = "Resource APIs"
+
+    def ready(self) -> None:  # pragma: no cover - side effects only
+        # Keep search documents in step with HSDS writes.
+        from . import signals
+
+        signals.connect()
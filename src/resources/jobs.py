@@ -0,0 +1,139 @@
+"""Enqueue, claim and run background :class:`Job` rows."""
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import Any, Callable, Dict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from hsds_ext.models import BulkOperation, Job
+from resources.utils.bulk_engine import commit_operation, undo_operation
+
+logger = logging.getLogger(__name__)
+
+LEASE_TIMEOUT = timedelta(minutes=10)
+"""Running jobs without a heartbeat for this long are reclaimed."""
+
+MAX_ATTEMPTS = 3
+"""Reclaimed jobs are not retried more than this many times."""
+
+Handler = Callable[[Job], None]
+
+HANDLERS: Dict[str, Handler] = {}
+
+
+def handler(kind: str) -> Callable[[Handler], Handler]:
+    """Register the decorated function to run jobs of ``kind``."""
+
+    def register(func: Handler) -> Handler:
+        HANDLERS[kind] = func
+        return func
+
+    return register
+
+
+def enqueue(kind: str, payload: Dict[str, Any], user=None) -> Job:
+    """Queue a job, running it immediately when ``JOB_QUEUE_EAGER`` is set."""
+
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown job kind: {kind}")
+    job = Job.objects.create(kind=kind, payload=payload, created_by=user)
+    if getattr(settings, "JOB_QUEUE_EAGER", False):
+        job.status = Job.Status.RUNNING
+        job.attempts = 1
+        job.started_at = timezone.now()
+        job.save(update_fields=["status", "attempts", "started_at"])
+        run(job)
+    return job
+
+
+def claim(worker: str) -> Job | None:
+    """Lock and mark running the oldest available job, skipping locked rows.
+
+    Jobs left running by a worker that stopped heart-beating are reclaimed
+    until they reach :data:`MAX_ATTEMPTS`, then marked failed so their
+    progress stops being polled.
+    """
+
+    now = timezone.now()
+    lapsed = Q(status=Job.Status.RUNNING, heartbeat_at__lt=now - LEASE_TIMEOUT)
+    available = Q(status=Job.Status.QUEUED) | (lapsed & Q(attempts__lt=MAX_ATTEMPTS))
+    with transaction.atomic():
+        Job.objects.filter(lapsed, attempts__gte=MAX_ATTEMPTS).update(
+            status=Job.Status.FAILED,
+            error="Worker stopped responding",
+            finished_at=now,
+        )
+        job = (
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(available)
+            .order_by("id")
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = Job.Status.RUNNING
+        job.attempts += 1
+        job.worker = worker
+        job.started_at = job.heartbeat_at = now
+        job.save(update_fields=["status", "attempts", "worker", "started_at", "heartbeat_at"])
+    return job
+
+
+def report_progress(job: Job, done: int, total: int) -> None:
+    """Record progress and refresh the job's heartbeat."""
+
+    job.progress_done, job.progress_total = done, total
+    Job.objects.filter(pk=job.pk).update(
+        progress_done=done, progress_total=total, heartbeat_at=timezone.now()
+    )
+
+
+def run(job: Job) -> None:
+    """Execute a claimed ``job`` and record its final status."""
+
+    try:
+        HANDLERS[job.kind](job)
+    except Exception as exc:
+        logger.exception("Job %s (%s) failed", job.pk, job.kind)
+        job.status = Job.Status.FAILED
+        job.error = str(exc) or exc.__class__.__name__
+    else:
+        job.status = Job.Status.DONE
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "error", "finished_at"])
+
+
+@handler("bulk_commit")
+def _bulk_commit(job: Job) -> None:
+    """Commit a staged operation; a second run of the same commit is a no-op.
+
+    The operation is locked and moved to ``COMMITTING`` before any chunk is
+    written, so a duplicate or reclaimed job cannot apply it again and
+    overwrite the stored inverse patches.
+    """
+
+    with transaction.atomic():
+        op = BulkOperation.objects.select_for_update().get(id=job.payload["operation_id"])
+        if op.status == BulkOperation.Status.COMMITTING:
+            raise RuntimeError("Commit was interrupted; undo the chunks it applied.")
+        if op.status != BulkOperation.Status.STAGED:
+            return
+        op.status = BulkOperation.Status.COMMITTING
+        op.save(update_fields=["status"])
+    commit_operation(op, job.created_by, progress=lambda done, total: report_progress(job, done, total))
+
+
+@handler("bulk_undo")
+def _bulk_undo(job: Job) -> None:
+    """Undo a committed operation unless it was already undone."""
+
+    with transaction.atomic():
+        op = BulkOperation.objects.select_for_update().get(id=job.payload["operation_id"])
+        if op.status not in {BulkOperation.Status.COMMITTED, BulkOperation.Status.COMMITTING}:
+            return
+    undo_operation(op, job.created_by, progress=lambda done, total: report_progress(job, done, total))
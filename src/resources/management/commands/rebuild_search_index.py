@@ -0,0 +1,48 @@
+"""Management command to rebuild the denormalized search index."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from hsds.models import Location, Organization, Service
+from hsds_ext.models import SearchDocument
+from resources.utils.search_index import refresh_documents
+
+
+class Command(BaseCommand):
+    """Rebuild every :class:`SearchDocument` from the HSDS tables."""
+
+    help = "Rebuild search documents for organizations, locations and services"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of entities rebuilt per batch",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        models = [
+            (SearchDocument.EntityType.ORGANIZATION, Organization),
+            (SearchDocument.EntityType.LOCATION, Location),
+            (SearchDocument.EntityType.SERVICE, Service),
+        ]
+        for entity_type, model in models:
+            ids = model.objects.order_by("pk").values_list("pk", flat=True)
+            SearchDocument.objects.filter(entity_type=entity_type).exclude(
+                entity_id__in=ids
+            ).delete()
+            total = 0
+            batch: list = []
+            for pk in ids.iterator(chunk_size=batch_size):
+                batch.append(pk)
+                if len(batch) == batch_size:
+                    refresh_documents(entity_type, batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                refresh_documents(entity_type, batch)
+                total += len(batch)
+            self.stdout.write(f"Indexed {total} {entity_type} documents")
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt"))
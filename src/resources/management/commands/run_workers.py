@@ -0,0 +1,91 @@
+"""Management command running background job workers."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import socket
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from resources import jobs
+
+
+def work(name: str, poll_interval: float, once: bool) -> int:
+    """Claim and run jobs until the queue is empty (``once``) or forever.
+
+    Returns the number of jobs executed.
+    """
+
+    processed = 0
+    while True:
+        job = jobs.claim(name)
+        if job is None:
+            if once:
+                return processed
+            time.sleep(poll_interval)
+            continue
+        jobs.run(job)
+        processed += 1
+
+
+def _child(index: int, poll_interval: float, once: bool) -> None:
+    """Entry point of a forked worker process."""
+
+    connections.close_all()
+    work(f"{socket.gethostname()}:{os.getpid()}:{index}", poll_interval, once)
+
+
+class Command(BaseCommand):
+    """Poll the job table and execute queued jobs.
+
+    Start as many processes (``--concurrency``) or separate commands as
+    needed; rows are claimed with ``FOR UPDATE SKIP LOCKED`` so workers
+    never block on each other.
+    """
+
+    help = "Run background job workers"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of worker processes to run",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait between polls when the queue is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no job is available instead of polling",
+        )
+
+    def handle(self, *args, **options):
+        concurrency = max(1, options["concurrency"])
+        poll_interval = options["poll_interval"]
+        once = options["once"]
+        if concurrency == 1:
+            name = f"{socket.gethostname()}:{os.getpid()}"
+            processed = work(name, poll_interval, once)
+            self.stdout.write(self.style.SUCCESS(f"Processed {processed} jobs"))
+            return
+
+        # Forked children inherit the configured Django process; spawn and
+        # forkserver children would start without ``django.setup()``.
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=_child, args=(index, poll_interval, once))
+            for index in range(concurrency)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.stdout.write(self.style.SUCCESS(f"{concurrency} workers exited"))
@@ -0,0 +1,243 @@
+"""Signal handlers keeping derived tables in step with HSDS writes.
+
+Search documents and the materialized health metrics are both refreshed
+here for the rows a write touches; cached composite resources are
+invalidated for the services whose payload embeds the written row.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+
+from hsds.models import (
+    Address,
+    Location,
+    Organization,
+    Phone,
+    Schedule,
+    Service,
+    ServiceAtLocation,
+)
+from hsds.signals import bulk_written, versions_bumped
+from hsds_ext.models import FieldVersion, SearchDocument, SensitiveOverlay, VerificationEvent
+from resources.utils import health_metrics, resource_cache
+from resources.utils.search_index import refresh_documents, services_at_locations
+
+ORG = SearchDocument.EntityType.ORGANIZATION
+LOC = SearchDocument.EntityType.LOCATION
+SVC = SearchDocument.EntityType.SERVICE
+
+
+def _organization_changed(sender, instance: Organization, **kwargs: Any) -> None:
+    refresh_documents(ORG, [instance.pk])
+    if kwargs.get("signal") is post_save:
+        refresh_documents(SVC, instance.services.values_list("id", flat=True))
+
+
+def _service_changed(sender, instance: Service, **kwargs: Any) -> None:
+    refresh_documents(SVC, [instance.pk])
+
+
+def _location_changed(sender, instance: Location, **kwargs: Any) -> None:
+    refresh_documents(LOC, [instance.pk])
+    refresh_documents(SVC, services_at_locations([instance.pk]))
+
+
+def _address_changed(sender, instance: Address, **kwargs: Any) -> None:
+    if instance.location_id:
+        _location_changed(Location, Location(pk=instance.location_id))
+
+
+def _phone_changed(sender, instance: Phone, **kwargs: Any) -> None:
+    refresh_documents(ORG, [instance.organization_id])
+    refresh_documents(LOC, [instance.location_id])
+    refresh_documents(SVC, [instance.service_id])
+
+
+def _service_at_location_changed(sender, instance: ServiceAtLocation, **kwargs: Any) -> None:
+    refresh_documents(SVC, [instance.service_id])
+
+
+def _service_locations_changed(sender, instance, action: str, model, pk_set, **kwargs: Any) -> None:
+    if action not in {"post_add", "post_remove", "post_clear"}:
+        return
+    if isinstance(instance, Service):
+        refresh_documents(SVC, [instance.pk])
+    else:
+        refresh_documents(SVC, pk_set or services_at_locations([instance.pk]))
+
+
+def _service_health_changed(sender, instance: Service, **kwargs: Any) -> None:
+    health_metrics.refresh_services([instance.pk])
+
+
+def _location_health_changed(sender, instance: Location, **kwargs: Any) -> None:
+    health_metrics.refresh_locations([instance.pk])
+
+
+def _remember_previous_service(sender, instance: Phone | Schedule, **kwargs: Any) -> None:
+    """Note the service a saved Phone or Schedule belonged to before the save."""
+
+    instance._previous_service_id = (
+        None
+        if instance._state.adding
+        else sender.objects.filter(pk=instance.pk).values_list("service_id", flat=True).first()
+    )
+
+
+def _service_child_health_changed(sender, instance: Phone | Schedule, **kwargs: Any) -> None:
+    ids = {instance.service_id, getattr(instance, "_previous_service_id", None)}
+    health_metrics.refresh_services([service_id for service_id in ids if service_id])
+
+
+def _verification_health_changed(sender, instance: VerificationEvent, **kwargs: Any) -> None:
+    if instance.entity_type == VerificationEvent.EntityType.SERVICE:
+        health_metrics.refresh_services([instance.entity_id])
+
+
+def _bulk_written(sender, ids, **kwargs: Any) -> None:
+    """Refresh derived rows for a batch written without model signals."""
+
+    ids = list(ids)
+    if sender is Organization:
+        refresh_documents(ORG, ids)
+        refresh_documents(
+            SVC, Service.objects.filter(organization_id__in=ids).values_list("id", flat=True)
+        )
+    elif sender is Service:
+        refresh_documents(SVC, ids)
+        health_metrics.refresh_services(ids)
+    elif sender is Location:
+        refresh_documents(LOC, ids)
+        refresh_documents(SVC, services_at_locations(ids))
+        health_metrics.refresh_locations(ids)
+    elif sender is Address:
+        location_ids = set(
+            Address.objects.filter(id__in=ids).values_list("location_id", flat=True)
+        )
+        _bulk_written(Location, ids=[i for i in location_ids if i])
+    elif sender is Phone:
+        owners = list(
+            Phone.objects.filter(id__in=ids).values_list(
+                "organization_id", "location_id", "service_id"
+            )
+        )
+        refresh_documents(ORG, {org for org, _, _ in owners})
+        refresh_documents(LOC, {loc for _, loc, _ in owners})
+        svc_ids = {svc for _, _, svc in owners}
+        refresh_documents(SVC, svc_ids)
+        health_metrics.refresh_services(svc_ids)
+    elif sender is Schedule:
+        health_metrics.refresh_services(
+            Schedule.objects.filter(id__in=ids).values_list("service_id", flat=True)
+        )
+    elif sender is ServiceAtLocation:
+        refresh_documents(
+            SVC, ServiceAtLocation.objects.filter(id__in=ids).values_list("service_id", flat=True)
+        )
+
+
+def _cached_resource_changed(sender, instance, **kwargs: Any) -> None:
+    """Invalidate cached resources embedding ``instance``."""
+
+    if isinstance(instance, Service):
+        ids = [instance.pk]
+    elif isinstance(instance, Organization):
+        ids = instance.services.values_list("id", flat=True)
+    elif isinstance(instance, Location):
+        ids = services_at_locations([instance.pk])
+    elif isinstance(instance, ServiceAtLocation):
+        ids = [instance.service_id]
+    elif (
+        isinstance(instance, SensitiveOverlay)
+        and instance.entity_type == SensitiveOverlay.EntityType.SERVICE
+    ):
+        ids = [instance.entity_id]
+    else:
+        return
+    resource_cache.invalidate(ids)
+
+
+def _cached_locations_changed(sender, instance, action: str, model, pk_set, **kwargs: Any) -> None:
+    if action not in {"post_add", "post_remove", "post_clear"}:
+        return
+    if isinstance(instance, Service):
+        resource_cache.invalidate([instance.pk])
+    else:
+        resource_cache.invalidate(pk_set or services_at_locations([instance.pk]))
+
+
+def _cached_versions_bumped(sender, keys, **kwargs: Any) -> None:
+    resource_cache.invalidate(
+        entity_id
+        for entity_type, entity_id, _ in keys
+        if entity_type == FieldVersion.EntityType.SERVICE
+    )
+
+
+def _cached_bulk_written(sender, ids, **kwargs: Any) -> None:
+    ids = list(ids)
+    if sender is Service:
+        resource_cache.invalidate(ids)
+    elif sender is Organization:
+        resource_cache.invalidate(
+            Service.objects.filter(organization_id__in=ids).values_list("id", flat=True)
+        )
+    elif sender is Location:
+        resource_cache.invalidate(services_at_locations(ids))
+    elif sender is ServiceAtLocation:
+        resource_cache.invalidate(
+            ServiceAtLocation.objects.filter(id__in=ids).values_list("service_id", flat=True)
+        )
+
+
+def connect() -> None:
+    """Connect search index and health metric receivers."""
+
+    handlers = [
+        (Organization, _organization_changed),
+        (Service, _service_changed),
+        (Location, _location_changed),
+        (Address, _address_changed),
+        (Phone, _phone_changed),
+        (ServiceAtLocation, _service_at_location_changed),
+    ]
+    for model, handler in handlers:
+        post_save.connect(handler, sender=model, dispatch_uid=f"search-save-{model}")
+        post_delete.connect(handler, sender=model, dispatch_uid=f"search-delete-{model}")
+    m2m_changed.connect(
+        _service_locations_changed,
+        sender=Service.locations.through,
+        dispatch_uid="search-m2m",
+    )
+
+    health_handlers = [
+        (Service, _service_health_changed),
+        (Location, _location_health_changed),
+        (Phone, _service_child_health_changed),
+        (Schedule, _service_child_health_changed),
+        (VerificationEvent, _verification_health_changed),
+    ]
+    for model, handler in health_handlers:
+        post_save.connect(handler, sender=model, dispatch_uid=f"health-save-{model}")
+        post_delete.connect(handler, sender=model, dispatch_uid=f"health-delete-{model}")
+    for model in (Phone, Schedule):
+        pre_save.connect(
+            _remember_previous_service, sender=model, dispatch_uid=f"health-pre-save-{model}"
+        )
+    bulk_written.connect(_bulk_written, dispatch_uid="resources-bulk")
+
+    for model in (Service, Organization, Location, ServiceAtLocation, SensitiveOverlay):
+        uid = f"resource-cache-{model._meta.label_lower}"
+        post_save.connect(_cached_resource_changed, sender=model, dispatch_uid=f"{uid}-save")
+        post_delete.connect(
+            _cached_resource_changed, sender=model, dispatch_uid=f"{uid}-delete"
+        )
+    m2m_changed.connect(
+        _cached_locations_changed,
+        sender=Service.locations.through,
+        dispatch_uid="resource-cache-m2m",
+    )
+    bulk_written.connect(_cached_bulk_written, dispatch_uid="resource-cache-bulk")
+    versions_bumped.connect(_cached_versions_bumped, dispatch_uid="resource-cache-versions")
@@ -3,11 +3,17 @@ from __future__ import annotations
 
 import json
 import uuid
+from datetime import timedelta
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
 
-from hsds_ext.models import BulkOperation, Shelf, ShelfMember
+from hsds.models import Organization, Service
+from hsds_ext.models import BulkOperation, FieldVersion, Job, Shelf, ShelfMember
+from resources import jobs
+from resources.utils import bulk_engine
 
 User = get_user_model()
 
@@ -58,3 +64,309 @@ def test_bulk_operation_flow(client) -> None:
     assert resp.status_code == 200
     op.refresh_from_db()
     assert op.status == BulkOperation.Status.UNDONE
+
+
+@pytest.mark.django_db
+def test_bulk_commit_applies_patch_in_chunks(client, settings, django_assert_max_num_queries) -> None:
+    """Commit writes every target with a bounded number of queries per chunk."""
+
+    settings.BULK_OPERATION_CHUNK_SIZE = 2
+    user = User.objects.create_user(username="bob", password="pw")
+    client.force_login(user)
+    org = Organization.objects.create(name="Org", description="d")
+    services = [
+        Service.objects.create(organization=org, name=f"Svc {i}", status=Service.Status.ACTIVE)
+        for i in range(5)
+    ]
+    services[0].url = "https://new.example.org"
+    services[0].save()
+    shelf = Shelf.objects.create(owner=user, name="Shelf")
+    for svc in services:
+        ShelfMember.objects.create(shelf=shelf, entity_type="service", entity_id=svc.id, added_by=user)
+    ShelfMember.objects.create(shelf=shelf, entity_type="service", entity_id=uuid.uuid4(), added_by=user)
+
+    patch = [{"op": "replace", "path": "/url", "value": "https://new.example.org"}]
+    client.post("/api/bulk-ops/", {"scope": "shelf", "shelf_id": str(shelf.id), "patch": json.dumps(patch)})
+    op = BulkOperation.objects.get()
+
+    with django_assert_max_num_queries(75):
+        resp = client.post(f"/api/bulk-ops/{op.id}/commit/")
+    assert resp.status_code == 200
+
+    op.refresh_from_db()
+    assert {k: op.stats[k] for k in ("targets", "applied", "unchanged", "missing", "failed")} == {
+        "targets": 6,
+        "applied": 4,
+        "unchanged": 1,
+        "missing": 1,
+        "failed": 0,
+    }
+    assert set(Service.objects.values_list("url", flat=True)) == {"https://new.example.org"}
+    applied = [r for r in op.results if r["outcome"] == "applied"]
+    assert all(r["versions"] == {"service.url": 1} for r in applied)
+    assert FieldVersion.objects.filter(field_path="service.url").count() == 4
+
+
+@pytest.mark.django_db
+def test_bulk_commit_runs_on_background_worker(client, settings) -> None:
+    """Commit queues a job that a worker executes; progress HTML polls until done."""
+
+    settings.JOB_QUEUE_EAGER = False
+    user = User.objects.create_user(username="carol", password="pw")
+    client.force_login(user)
+    org = Organization.objects.create(name="Org", description="d")
+    svc = Service.objects.create(organization=org, name="Svc", status=Service.Status.ACTIVE)
+    shelf = Shelf.objects.create(owner=user, name="Shelf")
+    ShelfMember.objects.create(shelf=shelf, entity_type="service", entity_id=svc.id, added_by=user)
+    patch = [{"op": "replace", "path": "/email", "value": "info@example.org"}]
+    client.post("/api/bulk-ops/", {"scope": "shelf", "shelf_id": str(shelf.id), "patch": json.dumps(patch)})
+    op = BulkOperation.objects.get()
+
+    resp = client.post(f"/api/bulk-ops/{op.id}/commit/")
+    assert resp.status_code == 200
+    assert "hx-trigger" in resp.content.decode()
+    op.refresh_from_db()
+    assert op.status == BulkOperation.Status.STAGED
+    assert op.job.status == Job.Status.QUEUED
+    assert client.post(f"/api/bulk-ops/{op.id}/commit/").status_code == 400
+
+    call_command("run_workers", "--once")
+
+    op.refresh_from_db()
+    assert op.status == BulkOperation.Status.COMMITTED
+    assert (op.job.status, op.job.progress_done, op.job.progress_total) == (Job.Status.DONE, 1, 1)
+    svc.refresh_from_db()
+    assert svc.email == "info@example.org"
+    html = client.get(f"/api/bulk-ops/{op.id}/progress/").content.decode()
+    assert "hx-trigger" not in html
+    assert "undo" in html
+
+
+@pytest.mark.django_db
+def test_bulk_undo_replays_inverse_patches_with_version_checks(client) -> None:
+    """Undo restores touched fields and skips targets edited since commit."""
+
+    user = User.objects.create_user(username="dave", password="pw")
+    client.force_login(user)
+    org = Organization.objects.create(name="Org", description="d")
+    kept = Service.objects.create(
+        organization=org, name="Kept", status=Service.Status.ACTIVE, url="https://old.example.org"
+    )
+    edited = Service.objects.create(organization=org, name="Edited", status=Service.Status.ACTIVE)
+    shelf = Shelf.objects.create(owner=user, name="Shelf")
+    for svc in (kept, edited):
+        ShelfMember.objects.create(shelf=shelf, entity_type="service", entity_id=svc.id, added_by=user)
+    patch = [{"op": "replace", "path": "/url", "value": "https://new.example.org"}]
+    client.post("/api/bulk-ops/", {"scope": "shelf", "shelf_id": str(shelf.id), "patch": json.dumps(patch)})
+    op = BulkOperation.objects.get()
+    client.post(f"/api/bulk-ops/{op.id}/commit/")
+    op.refresh_from_db()
+    results = {r["entity_id"]: r for r in op.results}
+    assert results[str(kept.id)]["inverse"] == [
+        {"op": "replace", "path": "/url", "value": "https://old.example.org"}
+    ]
+
+    FieldVersion.bump(FieldVersion.EntityType.SERVICE, edited.id, ["service.url"], user)
+    Service.objects.filter(id=edited.id).update(url="https://manual.example.org")
+    kept.refresh_from_db()
+    committed_at = kept.last_modified
+
+    resp = client.post(f"/api/bulk-ops/{op.id}/undo/", {"undo_token": op.undo_token})
+    assert resp.status_code == 200
+
+    op.refresh_from_db()
+    assert op.status == BulkOperation.Status.UNDONE
+    assert {r["entity_id"]: r["undo"] for r in op.results} == {
+        str(kept.id): "reverted",
+        str(edited.id): "conflict",
+    }
+    assert op.stats["undo"]["reverted"] == 1
+    kept.refresh_from_db()
+    edited.refresh_from_db()
+    assert kept.url == "https://old.example.org"
+    assert kept.last_modified > committed_at
+    assert edited.url == "https://manual.example.org"
+    assert FieldVersion.objects.get(entity_id=kept.id, field_path="service.url").version == 2
+
+
+@pytest.mark.django_db
+def test_bulk_stage_previews_first_page_and_paginates_lazily(
+    client, monkeypatch, django_assert_max_num_queries
+) -> None:
+    """Staging diffs only the first page; later pages are computed on request."""
+
+    monkeypatch.setattr(bulk_engine, "PREVIEW_PAGE_SIZE", 2)
+    user = User.objects.create_user(username="erin", password="pw")
+    client.force_login(user)
+    org = Organization.objects.create(name="Org", description="d")
+    shelf = Shelf.objects.create(owner=user, name="Shelf")
+    for i in range(5):
+        svc = Service.objects.create(organization=org, name=f"Svc {i}", status=Service.Status.ACTIVE)
+        ShelfMember.objects.create(shelf=shelf, entity_type="service", entity_id=svc.id, added_by=user)
+
+    patch = [{"op": "replace", "path": "/email", "value": "info@example.org"}]
+    with django_assert_max_num_queries(10):
+        resp = client.post(
+            "/api/bulk-ops/",
+            {"scope": "shelf", "shelf_id": str(shelf.id), "patch": json.dumps(patch)},
+        )
+    assert resp.status_code == 201
+    assert "Page 1 of 3" in resp.content.decode()
+    op = BulkOperation.objects.get()
+    assert list(op.preview["pages"]) == ["1"]
+    first = op.preview["pages"]["1"][0]
+    assert first["status"] == "change"
+    assert first["changes"] == {"email": [None, "info@example.org"]}
+
+    resp = client.get(f"/api/bulk-ops/{op.id}/preview/", {"page": 3})
+    assert "Page 3 of 3" in resp.content.decode()
+    op.refresh_from_db()
+    assert sorted(op.preview["pages"]) == ["1", "3"]
+    assert len(op.preview["pages"]["3"]) == 1
+
+
+@pytest.mark.django_db
+def test_bulk_commit_failing_part_way_keeps_applied_chunks_undoable(client, monkeypatch) -> None:
+    """Each chunk saves its results, so an interrupted commit can be undone."""
+
+    user = User.objects.create_user(username="fay", password="pw")
+    client.force_login(user)
+    org = Organization.objects.create(name="Org", description="d")
+    first, second = (
+        Service.objects.create(organization=org, name=f"Svc {i}", status=Service.Status.ACTIVE)
+        for i in range(2)
+    )
+    stamped = first.last_modified
+    shelf = Shelf.objects.create(owner=user, name="Shelf")
+    for svc in (first, second):
+        ShelfMember.objects.create(shelf=shelf, entity_type="service", entity_id=svc.id, added_by=user)
+    patch = [{"op": "replace", "path": "/name", "value": "Renamed"}]
+    client.post("/api/bulk-ops/", {"scope": "shelf", "shelf_id": str(shelf.id), "patch": json.dumps(patch)})
+    op = BulkOperation.objects.get()
+
+    commit_chunk = bulk_engine._commit_chunk
+    calls = []
+
+    def failing_chunk(*args, **kwargs):
+        calls.append(args)
+        if len(calls) > 1:
+            raise RuntimeError("worker lost")
+        return commit_chunk(*args, **kwargs)
+
+    monkeypatch.setattr(bulk_engine, "_commit_chunk", failing_chunk)
+    with pytest.raises(RuntimeError):
+        bulk_engine.commit_operation(op, user, size=1)
+
+    op.refresh_from_db()
+    assert op.status == BulkOperation.Status.COMMITTING
+    assert [r["outcome"] for r in op.results] == ["applied"]
+    assert op.results[0]["inverse"]
+    changed = Service.objects.get(id=op.results[0]["entity_id"])
+    assert changed.name == "Renamed"
+    assert changed.last_modified > stamped
+
+    resp = client.post(f"/api/bulk-ops/{op.id}/undo/", {"undo_token": op.undo_token})
+    assert resp.status_code == 200
+    op.refresh_from_db()
+    assert op.status == BulkOperation.Status.UNDONE
+    assert set(Service.objects.values_list("name", flat=True)) == {"Svc 0", "Svc 1"}
+
+
+@pytest.mark.django_db
+def test_bulk_commit_job_runs_once_and_exhausted_jobs_fail(client) -> None:
+    """A rerun commit job leaves results alone; lapsed jobs stop being retried."""
+
+    user = User.objects.create_user(username="gus", password="pw")
+    client.force_login(user)
+    org = Organization.objects.create(name="Org", description="d")
+    svc = Service.objects.create(organization=org, name="Svc", status=Service.Status.ACTIVE)
+    shelf = Shelf.objects.create(owner=user, name="Shelf")
+    ShelfMember.objects.create(shelf=shelf, entity_type="service", entity_id=svc.id, added_by=user)
+    patch = [{"op": "replace", "path": "/name", "value": "Renamed"}]
+    client.post("/api/bulk-ops/", {"scope": "shelf", "shelf_id": str(shelf.id), "patch": json.dumps(patch)})
+    op = BulkOperation.objects.get()
+    client.post(f"/api/bulk-ops/{op.id}/commit/")
+    op.refresh_from_db()
+    results = op.results
+
+    jobs.run(op.job)
+    op.refresh_from_db()
+    assert op.results == results
+    assert op.results[0]["inverse"] == [{"op": "replace", "path": "/name", "value": "Svc"}]
+
+    stale = timezone.now() - jobs.LEASE_TIMEOUT - timedelta(minutes=1)
+    lapsed = Job.objects.create(
+        kind="bulk_commit",
+        payload={"operation_id": str(op.id)},
+        status=Job.Status.RUNNING,
+        attempts=jobs.MAX_ATTEMPTS,
+        heartbeat_at=stale,
+    )
+    assert jobs.claim("worker") is None
+    lapsed.refresh_from_db()
+    assert lapsed.status == Job.Status.FAILED
+    assert not lapsed.is_active
+
+
+@pytest.mark.django_db
+def test_bulk_commit_and_undo_refresh_cached_resources(client) -> None:
+    """Renaming an organization in bulk reaches the cached resources embedding it."""
+
+    user = User.objects.create_user(username="erin", password="pw")
+    client.force_login(user)
+    org = Organization.objects.create(name="Old Org", description="d")
+    svc = Service.objects.create(organization=org, name="Svc", status=Service.Status.ACTIVE)
+    shelf = Shelf.objects.create(owner=user, name="Shelf")
+    ShelfMember.objects.create(
+        shelf=shelf, entity_type="organization", entity_id=org.id, added_by=user
+    )
+    url = f"/api/resource/{svc.id}/"
+    assert client.get(url).json()["organization"]["name"] == "Old Org"
+
+    patch = [{"op": "replace", "path": "/name", "value": "New Org"}]
+    client.post("/api/bulk-ops/", {"scope": "shelf", "shelf_id": str(shelf.id), "patch": json.dumps(patch)})
+    op = BulkOperation.objects.get()
+    assert client.post(f"/api/bulk-ops/{op.id}/commit/").status_code == 200
+    assert client.get(url).json()["organization"]["name"] == "New Org"
+
+    op.refresh_from_db()
+    client.post(f"/api/bulk-ops/{op.id}/undo/", {"undo_token": op.undo_token})
+    assert client.get(url).json()["organization"]["name"] == "Old Org"
+
+
+@pytest.mark.django_db
+def test_bulk_undo_interrupted_part_way_resumes_without_conflicts(client, monkeypatch) -> None:
+    """A retried undo skips the chunks it already reverted."""
+
+    user = User.objects.create_user(username="hal", password="pw")
+    client.force_login(user)
+    org = Organization.objects.create(name="Org", description="d")
+    shelf = Shelf.objects.create(owner=user, name="Shelf")
+    for i in range(2):
+        svc = Service.objects.create(organization=org, name=f"Svc {i}", status=Service.Status.ACTIVE)
+        ShelfMember.objects.create(shelf=shelf, entity_type="service", entity_id=svc.id, added_by=user)
+    patch = [{"op": "replace", "path": "/name", "value": "Renamed"}]
+    client.post("/api/bulk-ops/", {"scope": "shelf", "shelf_id": str(shelf.id), "patch": json.dumps(patch)})
+    op = BulkOperation.objects.get()
+    client.post(f"/api/bulk-ops/{op.id}/commit/")
+    op.refresh_from_db()
+
+    undo_chunk = bulk_engine._undo_chunk
+    calls = []
+
+    def failing_chunk(*args, **kwargs):
+        calls.append(args)
+        if len(calls) > 1:
+            raise RuntimeError("worker lost")
+        return undo_chunk(*args, **kwargs)
+
+    monkeypatch.setattr(bulk_engine, "_undo_chunk", failing_chunk)
+    with pytest.raises(RuntimeError):
+        bulk_engine.undo_operation(op, user, size=1)
+    op.refresh_from_db()
+    assert [r.get("undo") for r in op.results] == ["reverted", None]
+
+    monkeypatch.setattr(bulk_engine, "_undo_chunk", undo_chunk)
+    report = bulk_engine.undo_operation(op, user, size=1)
+    assert (report.reverted, report.conflict) == (2, 0)
+    assert set(Service.objects.values_list("name", flat=True)) == {"Svc 0", "Svc 1"}
@@ -0,0 +1,103 @@
+"""Tests for the incremental change feed endpoint."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from hsds.models import Location, Organization, Phone, Service, ServiceAtLocation
+from hsds_ext.models import ChangeLogEntry
+
+
+@pytest.mark.django_db
+def test_change_feed_reports_upserts_and_tombstones(client) -> None:
+    """Feed returns the latest change per entity and deletes as tombstones."""
+
+    url = reverse("resources:change-feed")
+    org = Organization.objects.create(name="Org", description="d")
+    svc = Service.objects.create(organization=org, name="Svc", status="active")
+    svc.name = "Renamed"
+    svc.save()
+    phone = Phone.objects.create(service=svc, number="555-0100")
+    phone_id = phone.id
+    phone.delete()
+
+    resp = client.get(url, {"since": 0})
+    assert resp.status_code == 200
+    body = resp.json()
+    changes = {(c["entity_type"], c["entity_id"]): c["action"] for c in body["changes"]}
+    assert changes[("organization", str(org.id))] == "upsert"
+    assert changes[("service", str(svc.id))] == "upsert"
+    assert changes[("phone", str(phone_id))] == "delete"
+    assert len(body["changes"]) == 3
+    assert body["has_more"] is False
+
+    resp = client.get(url, {"since": body["next"]})
+    assert resp.json()["changes"] == []
+
+    loc = Location.objects.create(location_type="physical", name="Loc")
+    svc.locations.add(loc)
+    resp = client.get(url, {"since": body["next"], "entity_type": "service"})
+    assert [c["entity_id"] for c in resp.json()["changes"]] == [str(svc.id)]
+
+
+@pytest.mark.django_db
+def test_change_feed_reports_links_changed_through_service_locations(client) -> None:
+    """``Service.locations`` adds and removes reach the feed as link rows."""
+
+    url = reverse("resources:change-feed")
+    org = Organization.objects.create(name="Org", description="d")
+    svc = Service.objects.create(organization=org, name="Svc", status="active")
+    loc = Location.objects.create(location_type="physical", name="Loc")
+    since = client.get(url).json()["next"]
+
+    svc.locations.add(loc)
+    link = ServiceAtLocation.objects.get()
+    added = client.get(url, {"since": since, "entity_type": "serviceatlocation"}).json()
+    assert [(c["entity_id"], c["action"]) for c in added["changes"]] == [(str(link.id), "upsert")]
+
+    loc.services.remove(svc)
+    removed = client.get(url, {"since": added["next"], "entity_type": "serviceatlocation"}).json()
+    assert [(c["entity_id"], c["action"]) for c in removed["changes"]] == [(str(link.id), "delete")]
+
+    svc.locations.add(loc)
+    relinked = ServiceAtLocation.objects.get()
+    svc.locations.clear()
+    cleared = client.get(url, {"since": removed["next"], "entity_type": "serviceatlocation"}).json()
+    assert [(c["entity_id"], c["action"]) for c in cleared["changes"]] == [
+        (str(relinked.id), "delete")
+    ]
+
+
+@pytest.mark.django_db
+def test_change_feed_pages_by_limit(client) -> None:
+    """``limit`` bounds the page and ``has_more`` signals another poll."""
+
+    for i in range(3):
+        Organization.objects.create(name=f"Org {i}", description="d")
+    url = reverse("resources:change-feed")
+    first = client.get(url, {"limit": 2}).json()
+    assert len(first["changes"]) == 2 and first["has_more"] is True
+    second = client.get(url, {"since": first["next"], "limit": 2}).json()
+    assert len(second["changes"]) == 1 and second["has_more"] is False
+
+    assert client.get(url, {"since": "abc"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_change_feed_holds_back_entries_younger_than_the_settle_time(client, settings) -> None:
+    """The cursor never passes an entry that may still have lower ids committing."""
+
+    url = reverse("resources:change-feed")
+    old = Organization.objects.create(name="Old", description="d")
+    ChangeLogEntry.objects.update(changed_at=timezone.now() - timedelta(minutes=1))
+    Organization.objects.create(name="New", description="d")
+    settings.CHANGE_FEED_SETTLE_SECONDS = 30
+
+    body = client.get(url).json()
+    assert [c["entity_id"] for c in body["changes"]] == [str(old.id)]
+
+    ChangeLogEntry.objects.update(changed_at=timezone.now() - timedelta(minutes=1))
+    assert len(client.get(url, {"since": body["next"]}).json()["changes"]) == 1
@@ -0,0 +1,78 @@
+"""Tests for the streaming NDJSON export endpoint."""
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from hsds.models import Organization, Phone, Service
+from resources.views.export import accepts_gzip
+
+
+@pytest.mark.django_db
+def test_ndjson_export_streams_nested_records(client) -> None:
+    """Each line is one serialized record; gzip and ``since`` are honoured."""
+
+    url = reverse("resources:export-ndjson")
+    org = Organization.objects.create(name="Org", description="d")
+    old = Service.objects.create(organization=org, name="Old", status="active")
+    new = Service.objects.create(organization=org, name="New", status="active")
+    Phone.objects.create(service=new, number="555-0100")
+    Service.objects.filter(pk=old.pk).update(last_modified=timezone.now() - timedelta(days=2))
+
+    resp = client.get(url, {"entity": "service"})
+    assert resp.status_code == 200
+    assert resp["Content-Type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in b"".join(resp.streaming_content).splitlines()]
+    assert {r["name"] for r in records} == {"Old", "New"}
+
+    since = (timezone.now() - timedelta(days=1)).isoformat()
+    resp = client.get(
+        url, {"entity": "service", "since": since}, HTTP_ACCEPT_ENCODING="gzip"
+    )
+    assert resp["Content-Encoding"] == "gzip"
+    lines = gzip.decompress(b"".join(resp.streaming_content)).splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [r["name"] for r in records] == ["New"]
+    assert records[0]["phones"][0]["number"] == "555-0100"
+
+    assert client.get(url, {"entity": "bogus"}).status_code == 400
+    assert client.get(url, {"entity": "organization", "since": since}).status_code == 400
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip", True),
+        ("deflate, gzip;q=0.5", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, identity", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("gzip;q=0, *", False),
+        ("br, identity", False),
+        ("", False),
+    ],
+)
+def test_accepts_gzip_respects_q_values(header, expected) -> None:
+    """A q-value of 0 refuses gzip, explicitly or through ``*``."""
+
+    assert accepts_gzip(header) is expected
+
+
+@pytest.mark.django_db
+def test_ndjson_export_is_plain_when_gzip_is_refused(client) -> None:
+    """``gzip;q=0`` gets an uncompressed body."""
+
+    Organization.objects.create(name="Org", description="d")
+    resp = client.get(
+        reverse("resources:export-ndjson"),
+        {"entity": "organization"},
+        HTTP_ACCEPT_ENCODING="gzip;q=0, identity",
+    )
+    assert "Content-Encoding" not in resp
+    assert json.loads(b"".join(resp.streaming_content))["name"] == "Org"
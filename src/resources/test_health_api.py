@@ -2,7 +2,9 @@ import pytest
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
-from hsds.models import Location, Organization, Service, ServiceAtLocation
+from hsds.models import Location, Organization, Phone, Schedule, Service, ServiceAtLocation
+from hsds_ext.models import HealthFlag, HealthMetric, VerificationEvent
+from resources.utils import health_metrics
 
 User = get_user_model()
 
@@ -27,3 +29,86 @@ def test_health_stats_endpoint(client) -> None:
     assert data["no_hours"]["count"] == 1
     assert data["not_geocoded"]["count"] == 1
     assert data["stale"]["count"] == 1
+    assert data["computed_at"]
+
+
+@pytest.mark.django_db
+def test_health_metrics_follow_writes(client, django_assert_max_num_queries) -> None:
+    """Writes adjust the materialized counts without a reconciliation."""
+
+    user = User.objects.create_user(username="vol", password="pw")
+    client.login(username="vol", password="pw")
+    url = reverse("resources:health-stats")
+
+    org = Organization.objects.create(name="Org", description="d")
+    svc = Service.objects.create(organization=org, name="Svc", status="active")
+    loc = Location.objects.create(location_type="physical", organization=org, name="Loc")
+    computed_at = client.get(url).json()["computed_at"]
+
+    Phone.objects.create(service=svc, number="555-0100")
+    Schedule.objects.create(service=svc)
+    VerificationEvent.objects.create(
+        entity_type=VerificationEvent.EntityType.SERVICE,
+        entity_id=svc.id,
+        field_path="service.name",
+        method=VerificationEvent.Method.CALLED,
+        verified_by=user,
+    )
+    loc.latitude, loc.longitude = 47.6, -122.3
+    loc.save()
+    Service.objects.create(organization=org, name="Svc 2", status="active")
+
+    with django_assert_max_num_queries(3):
+        data = client.get(url).json()
+    assert {key: value["count"] for key, value in data.items() if key != "computed_at"} == {
+        "no_phone": 1,
+        "no_hours": 1,
+        "not_geocoded": 0,
+        "stale": 1,
+    }
+    assert data["computed_at"] == computed_at
+    assert HealthMetric.objects.get(key="no_phone").count == 1
+
+
+@pytest.mark.django_db
+def test_health_refresh_counts_flags_once_after_a_stale_read(monkeypatch) -> None:
+    """Counts follow the flags read under the lock, not the unlocked pre-check."""
+
+    org = Organization.objects.create(name="Org", description="d")
+    svc = Service.objects.create(organization=org, name="Svc", status="active")
+    health_metrics.reconcile()
+    assert HealthMetric.objects.get(key="no_phone").count == 1
+
+    existing = health_metrics._existing
+    reads = []
+
+    def stale_first_read(metrics, ids):
+        reads.append(ids)
+        return set() if len(reads) == 1 else existing(metrics, ids)
+
+    monkeypatch.setattr(health_metrics, "_existing", stale_first_read)
+    health_metrics.refresh_services([svc.id])
+    assert len(reads) == 2
+    assert HealthMetric.objects.get(key="no_phone").count == 1
+
+
+@pytest.mark.django_db
+def test_health_metrics_follow_phones_and_schedules_moved_between_services() -> None:
+    """Moving a Phone or Schedule re-evaluates the service it left."""
+
+    org = Organization.objects.create(name="Org", description="d")
+    first = Service.objects.create(organization=org, name="First", status="active")
+    second = Service.objects.create(organization=org, name="Second", status="active")
+    phone = Phone.objects.create(service=first, number="555-0100")
+    schedule = Schedule.objects.create(service=first)
+    health_metrics.reconcile()
+    assert HealthMetric.objects.get(key="no_phone").count == 1
+    assert HealthMetric.objects.get(key="no_hours").count == 1
+
+    phone.service = schedule.service = second
+    phone.save()
+    schedule.save()
+    assert HealthMetric.objects.get(key="no_phone").count == 1
+    assert HealthMetric.objects.get(key="no_hours").count == 1
+    flagged = HealthFlag.objects.filter(entity_id=first.id).values_list("metric", flat=True)
+    assert {"no_phone", "no_hours"} <= set(flagged)
@@ -7,9 +7,11 @@ from typing import Any
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from hsds.models import Location, Organization, Service
-from hsds_ext.models import FieldVersion
+from hsds_ext.models import FieldVersion, SensitiveOverlay
 
 User = get_user_model()
 
@@ -71,6 +73,117 @@ def test_patch_autopublish_field_updates_service(user_client, service):
     assert FieldVersion.objects.filter(entity_id=service.id, field_path="service.url").exists()
 
 
+@pytest.mark.django_db
+def test_patch_loads_resource_state_once(user_client, service):
+    """PATCH reads versions and overlay once and returns the post-write ETag."""
+
+    user, client = user_client
+    etag = client.get(f"/api/resource/{service.id}/").headers["ETag"]
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.patch(
+            f"/api/resource/{service.id}/",
+            data=json.dumps({"service": {"url": "https://example.com"}}),
+            content_type="application/json",
+            HTTP_IF_MATCH=etag,
+        )
+    assert response.status_code == 200
+    selects = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+    assert sum("hsds_ext_field_versions" in sql for sql in selects) == 1
+    assert sum("hsds_ext_sensitive_overlays" in sql for sql in selects) == 1
+    assert response.json()["etags"]["service.url"] == "v1"
+    assert response.headers["ETag"] == client.get(f"/api/resource/{service.id}/").headers["ETag"]
+
+
+@pytest.mark.django_db
+def test_get_answers_304_until_resource_changes(user_client, service):
+    """Matching validators get 304; a write or overlay change yields 200."""
+
+    user, client = user_client
+    url = f"/api/resource/{service.id}/"
+    first = client.get(url)
+    validators = {
+        "HTTP_IF_NONE_MATCH": first.headers["ETag"],
+        "HTTP_IF_MODIFIED_SINCE": first.headers["Last-Modified"],
+    }
+
+    response = client.get(url, **validators)
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == first.headers["ETag"]
+
+    SensitiveOverlay.objects.create(
+        entity_type=SensitiveOverlay.EntityType.SERVICE,
+        entity_id=service.id,
+        sensitive=True,
+        visibility_rules={"service.email": "hidden"},
+    )
+    assert client.get(url, **validators).status_code == 200
+
+
+@pytest.mark.django_db
+def test_get_validators_cover_embedded_organization_and_locations(user_client, service):
+    """Edits outside the resource API to embedded rows also yield 200."""
+
+    user, client = user_client
+    url = f"/api/resource/{service.id}/"
+
+    def validators():
+        response = client.get(url)
+        return {
+            "HTTP_IF_NONE_MATCH": response.headers["ETag"],
+            "HTTP_IF_MODIFIED_SINCE": response.headers["Last-Modified"],
+        }
+
+    current = validators()
+    org = service.organization
+    org.name = "Renamed"
+    org.save()
+    response = client.get(url, **current)
+    assert response.status_code == 200
+    assert response.json()["organization"]["name"] == "Renamed"
+
+    current = validators()
+    location = service.locations.get()
+    location.name = "Moved"
+    location.save()
+    assert client.get(url, **current).status_code == 200
+
+    etag = client.get(url).headers["ETag"]
+    Service.objects.get(pk=service.pk).save()
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_get_serves_cached_payload_until_invalidated(
+    user_client, service, django_capture_on_commit_callbacks
+):
+    """Repeat GETs skip the ORM; writes to the resource and version bumps refresh them."""
+
+    user, client = user_client
+    url = f"/api/resource/{service.id}/"
+    client.get(url)
+    other = Service.objects.create(
+        organization=Organization.objects.create(name="Other"), name="Other", status="active"
+    )
+    other.save()
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    assert response.status_code == 200
+    assert not any("hsds_service" in q["sql"] for q in ctx.captured_queries)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        Service.objects.get(pk=service.pk).save()
+    assert callbacks, "the generation is bumped again on commit"
+
+    Organization.objects.filter(pk=service.organization_id).update(name="Renamed")
+    Service.objects.get(pk=service.pk).save()
+    assert client.get(url).json()["organization"]["name"] == "Renamed"
+
+    FieldVersion.bump(FieldVersion.EntityType.SERVICE, service.id, ["service.url"], user)
+    assert client.get(url).json()["etags"]["service.url"] == "v1"
+
+
 @pytest.mark.django_db
 def test_patch_accepts_dotted_form_keys(user_client, service):
     user, client = user_client
@@ -5,8 +5,10 @@ from typing import Any
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 
-from hsds.models import Location, Organization, Phone, Service
+from hsds.models import Address, Location, Organization, Phone, Service
+from hsds_ext.models import SearchDocument
 
 User = get_user_model()
 
@@ -58,3 +60,71 @@ def test_search_by_phone_returns_service(user_client) -> None:
     assert resp.status_code == 200
     payload = resp.json()["results"]
     assert any(r["id"] == str(svc.id) and r.get("phone") == "555-1234" for r in payload)
+
+
+@pytest.mark.django_db
+def test_search_by_phone_ignores_formatting(user_client) -> None:
+    """Phone-like queries match on normalized digits, exactly or by suffix."""
+
+    user, client = user_client
+    org = Organization.objects.create(name="Epsilon Org", description="d")
+    svc = Service.objects.create(
+        organization=org, name="Epsilon Service", status=Service.Status.ACTIVE
+    )
+    Phone.objects.create(service=svc, number="+1 (206) 555-0142")
+
+    for query in ["206.555.0142", "1-206-555-0142", "555 0142"]:
+        results = client.get("/api/search/", {"q": query}).json()["results"]
+        assert [(r["id"], r.get("phone")) for r in results] == [
+            (str(svc.id), "+1 (206) 555-0142")
+        ], query
+
+
+@pytest.mark.django_db
+def test_search_documents_follow_writes(user_client) -> None:
+    """Address edits and deletions are reflected without a rebuild."""
+
+    user, client = user_client
+    org = Organization.objects.create(name="Gamma Org", description="d")
+    loc = Location.objects.create(location_type="physical", organization=org, name="Gamma Hall")
+    svc = Service.objects.create(
+        organization=org, name="Gamma Pantry", status=Service.Status.ACTIVE
+    )
+    svc.locations.add(loc)
+    Address.objects.create(
+        location=loc,
+        address_1="12 Harbor Rd",
+        city="Porttown",
+        state_province="CA",
+        postal_code="90000",
+        country="US",
+        address_type="physical",
+    )
+
+    results = client.get("/api/search/", {"q": "harbor"}).json()["results"]
+    assert {(r["type"], r["id"]) for r in results} == {
+        ("location", str(loc.id)),
+        ("service", str(svc.id)),
+    }
+    assert next(r for r in results if r["type"] == "location")["address"] == "12 Harbor Rd, Porttown"
+
+    svc.delete()
+    results = client.get("/api/search/", {"q": "harbor"}).json()["results"]
+    assert [r["type"] for r in results] == ["location"]
+
+
+@pytest.mark.django_db
+def test_rebuild_search_index_command() -> None:
+    """The rebuild command recreates documents for every entity."""
+
+    org = Organization.objects.create(name="Delta Org", description="d")
+    Service.objects.create(organization=org, name="Delta Svc", status=Service.Status.ACTIVE)
+    SearchDocument.objects.all().delete()
+
+    call_command("rebuild_search_index", "--batch-size", "1")
+
+    assert set(SearchDocument.objects.values_list("entity_type", flat=True)) == {
+        "organization",
+        "service",
+    }
+    assert "delta org" in SearchDocument.objects.get(entity_type="service").text
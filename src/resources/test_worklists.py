@@ -1,10 +1,15 @@
 """Tests for worklist API endpoints."""
 from __future__ import annotations
 
+from datetime import timedelta
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 from hsds.models import Organization, Service
+from hsds_ext.models import Worklist, WorklistMember
+from resources.views.worklists import SNAPSHOT_MAX_AGE
 
 User = get_user_model()
 
@@ -40,3 +45,52 @@ def test_create_list_and_navigate_worklist(client) -> None:
     resp = client.get(f"/api/worklists/{worklist_id}/next/", {"current": str(svc1.id)})
     assert resp.status_code == 200
     assert resp.json()["id"] == str(svc2.id)
+
+
+@pytest.mark.django_db
+def test_navigation_walks_a_stable_snapshot(client, django_assert_max_num_queries) -> None:
+    """Navigation uses the snapshot; new matches appear only after a refresh."""
+
+    user = User.objects.create_user(username="vol", password="pw")
+    client.force_login(user)
+    org = Organization.objects.create(name="Org", description="d")
+    first = Service.objects.create(organization=org, name="Pantry A", status=Service.Status.ACTIVE)
+    second = Service.objects.create(organization=org, name="Pantry B", status=Service.Status.ACTIVE)
+
+    worklist_id = client.post("/api/worklists/", {"name": "L", "query": "pantry"}).json()["id"]
+    assert client.get(f"/api/worklists/{worklist_id}/").json()["snapshot_at"]
+    Service.objects.create(organization=org, name="Pantry C", status=Service.Status.ACTIVE)
+
+    step = client.get(f"/api/worklists/{worklist_id}/next/").json()
+    assert step == {"id": str(first.id), "position": 0}
+    with django_assert_max_num_queries(4):
+        step = client.get(
+            f"/api/worklists/{worklist_id}/next/", {"position": step["position"]}
+        ).json()
+    assert step == {"id": str(second.id), "position": 1}
+    resp = client.get(f"/api/worklists/{worklist_id}/next/", {"position": 1})
+    assert resp.status_code == 404
+    resp = client.get(f"/api/worklists/{worklist_id}/prev/", {"current": str(second.id)})
+    assert resp.json()["id"] == str(first.id)
+
+
+@pytest.mark.django_db
+def test_navigation_refreshes_a_stale_snapshot(client) -> None:
+    """A stale snapshot is retaken on navigation and the step anchors on ``current``."""
+
+    user = User.objects.create_user(username="vol", password="pw")
+    client.force_login(user)
+    org = Organization.objects.create(name="Org", description="d")
+    first = Service.objects.create(organization=org, name="Pantry A", status=Service.Status.ACTIVE)
+    worklist_id = client.post("/api/worklists/", {"name": "L", "query": "pantry"}).json()["id"]
+    assert client.get(f"/api/worklists/{worklist_id}/next/").json()["id"] == str(first.id)
+
+    added = Service.objects.create(organization=org, name="Pantry B", status=Service.Status.ACTIVE)
+    Worklist.objects.filter(id=worklist_id).update(
+        snapshot_at=timezone.now() - SNAPSHOT_MAX_AGE - timedelta(minutes=1)
+    )
+    step = client.get(
+        f"/api/worklists/{worklist_id}/next/", {"position": 0, "current": str(first.id)}
+    ).json()
+    assert step == {"id": str(added.id), "position": 1}
+    assert WorklistMember.objects.filter(worklist_id=worklist_id).count() == 2
@@ -4,9 +4,12 @@ from django.urls import path
 from resources.views.bulk_ops import (
     BulkOperationCommitView,
     BulkOperationPreviewView,
+    BulkOperationProgressView,
     BulkOperationStageView,
     BulkOperationUndoView,
 )
+from resources.views.changes import ChangeFeedView
+from resources.views.export import NDJSONExportView
 from resources.views.drafts import DraftCreateView, DraftListView
 from resources.views.drafts_review import (
     DraftApproveView,
@@ -38,14 +41,17 @@ from resources.views.worklists import (
     WorklistSearchView,
 )
 from resources.views.change_requests import (
+    ChangeRequestCountsView,
     ChangeRequestQueueView,
     ChangeRequestSubmitView,
 )
 from resources.views.change_requests_review import (
     ChangeRequestApproveView,
+    ChangeRequestBatchApproveView,
     ChangeRequestRejectView,
 )
 from resources.views.health import HealthStatsView
+from resources.views.review_leases import ReviewClaimView, ReviewReleaseView
 
 app_name = "resources"
 
@@ -108,6 +114,11 @@ urlpatterns = [
         BulkOperationUndoView.as_view(),
         name="bulk-op-undo",
     ),
+    path(
+        "bulk-ops/<uuid:id>/progress/",
+        BulkOperationProgressView.as_view(),
+        name="bulk-op-progress",
+    ),
     path("merge/", MergeView.as_view(), name="merge"),
     path("worklists/", WorklistListCreateView.as_view(), name="worklist-list"),
     path("worklists/<uuid:id>/", WorklistDetailView.as_view(), name="worklist-detail"),
@@ -118,6 +129,18 @@ urlpatterns = [
     ),
     path("worklists/search/", WorklistSearchView.as_view(), name="worklist-search"),
     path("review-queue/", ChangeRequestQueueView.as_view(), name="change-request-list"),
+    path(
+        "review-queue/counts/",
+        ChangeRequestCountsView.as_view(),
+        name="change-request-counts",
+    ),
+    path("review-queue/claim/", ReviewClaimView.as_view(), name="review-claim"),
+    path("review-queue/release/", ReviewReleaseView.as_view(), name="review-release"),
+    path(
+        "review-queue/approve/",
+        ChangeRequestBatchApproveView.as_view(),
+        name="change-request-batch-approve",
+    ),
     path(
         "review-queue/<uuid:id>/approve/",
         ChangeRequestApproveView.as_view(),
@@ -129,4 +152,6 @@ urlpatterns = [
         name="change-request-reject",
     ),
     path("health/", HealthStatsView.as_view(), name="health-stats"),
+    path("changes/", ChangeFeedView.as_view(), name="change-feed"),
+    path("export.ndjson", NDJSONExportView.as_view(), name="export-ndjson"),
 ]
@@ -0,0 +1,139 @@
+"""Load a composite resource once and serialize it on demand."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from django.db.models import Q
+from django.shortcuts import get_object_or_404
+from django.utils.translation import get_language
+
+from hsds.models import Location, Organization, Service
+from hsds_ext.models import ChangeLogEntry, FieldVersion, SensitiveOverlay
+from resources.serializers.resource import ResourceSerializer
+from resources.utils.etags import resource_etag
+
+
+class ResourceAssembler:
+    """Gather everything needed to render a composite resource.
+
+    The service with its organization, its locations, the field-version map,
+    the sensitive overlay and the newest change-log entry of the embedded
+    rows are loaded in five queries when the assembler is created.
+    Precondition checks, error bodies and the final response all read from
+    the same snapshot; after a write, :meth:`refresh` applies the bumped
+    versions and re-reads only the change-log entry.
+    """
+
+    def __init__(self, service_id: str) -> None:
+        self.service: Service = get_object_or_404(
+            Service.objects.select_related("organization").prefetch_related("locations"),
+            id=service_id,
+        )
+        self.versions: Dict[str, int] = dict(
+            FieldVersion.objects.filter(
+                entity_type=FieldVersion.EntityType.SERVICE, entity_id=self.service.id
+            ).values_list("field_path", "version")
+        )
+        self.overlay: SensitiveOverlay | None = SensitiveOverlay.objects.filter(
+            entity_type=SensitiveOverlay.EntityType.SERVICE,
+            entity_id=self.service.id,
+        ).first()
+        self.change: Tuple[int, datetime | None] = self._latest_change()
+        self._data: Dict[str, Any] | None = None
+
+    def _latest_change(self) -> Tuple[int, datetime | None]:
+        """Return the id and time of the newest change to an embedded row.
+
+        Field versions only move for edits made through this API; the change
+        log also sees HSDS API and admin writes to the service, its
+        organization and its locations.
+        """
+
+        rows = (
+            Q(entity_type=Service._meta.model_name, entity_id=self.service.id)
+            | Q(entity_type=Organization._meta.model_name, entity_id=self.service.organization_id)
+            | Q(
+                entity_type=Location._meta.model_name,
+                entity_id__in=[location.id for location in self.service.locations.all()],
+            )
+        )
+        latest = (
+            ChangeLogEntry.objects.filter(rows)
+            .order_by("-id")
+            .values_list("id", "changed_at")
+            .first()
+        )
+        return latest or (0, None)
+
+    @property
+    def instance(self) -> Dict[str, Any]:
+        """Return the object graph consumed by :class:`ResourceSerializer`."""
+
+        return {
+            "service": self.service,
+            "organization": self.service.organization,
+            "location": next(iter(self.service.locations.all()), None),
+        }
+
+    @property
+    def context(self) -> Dict[str, Any]:
+        """Return serializer context sharing this assembler's version map."""
+
+        return {"versions": self.versions, "sensitive_overlay": self.overlay}
+
+    @property
+    def redactions(self) -> List[str] | None:
+        """Return the paths the sensitive overlay removes, or ``None``."""
+
+        if self.overlay and self.overlay.sensitive:
+            return sorted(self.overlay.visibility_rules)
+        return None
+
+    @property
+    def etag(self) -> str:
+        """Return the weak ETag of the version map, embedded rows, redactions and language."""
+
+        return resource_etag(
+            self.versions,
+            {
+                "change": self.change[0],
+                "redactions": self.redactions,
+                "language": get_language(),
+            },
+        )
+
+    @property
+    def last_modified(self) -> datetime:
+        """Return when the service or an embedded row was last written."""
+
+        changed_at = self.change[1]
+        if changed_at is None:
+            return self.service.last_modified
+        return max(self.service.last_modified, changed_at)
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Return the serialized resource, computed at most once per state."""
+
+        if self._data is None:
+            self._data = ResourceSerializer(self.instance, context=self.context).data
+        return self._data
+
+    def serializer(self, data: Any, **context: Any) -> ResourceSerializer:
+        """Return a partial-update serializer bound to this resource."""
+
+        return ResourceSerializer(
+            self.instance,
+            data=data,
+            partial=True,
+            context={**self.context, **context},
+        )
+
+    def refresh(self, bumped: Dict[str, int] | None = None) -> None:
+        """Apply ``bumped`` versions and drop the cached representation."""
+
+        if bumped:
+            self.versions.update(bumped)
+        self.change = self._latest_change()
+        self._data = None
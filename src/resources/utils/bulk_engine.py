@@ -0,0 +1,479 @@
+"""Apply a :class:`BulkOperation` patch to its targets in chunks."""
+from __future__ import annotations
+
+import secrets
+import time
+from dataclasses import asdict, dataclass, field
+from itertools import groupby
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import jsonpatch
+import jsonpointer
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Model
+from django.utils import timezone
+
+from hsds.models import Location, Organization, Service
+from hsds.signals import bulk_written
+from hsds_ext.models import BulkOperation, FieldVersion
+from resources.utils.json_patch import JSONPatch, apply_patch, inverse
+
+DEFAULT_CHUNK_SIZE = 500
+
+PREVIEW_PAGE_SIZE = 50
+"""Targets diffed per preview page; staging computes only the first page."""
+
+PREVIEW_VALUE_LIMIT = 200
+"""Longer preview values are truncated to keep stored previews compact."""
+
+Progress = Callable[[int, int], None]
+
+BULK_FIELDS: Dict[str, Tuple[type[Model], Tuple[str, ...]]] = {
+    "organization": (
+        Organization,
+        ("name", "alternate_name", "description", "email", "website"),
+    ),
+    "location": (
+        Location,
+        ("name", "alternate_name", "description", "url", "transportation"),
+    ),
+    "service": (
+        Service,
+        (
+            "name",
+            "alternate_name",
+            "description",
+            "url",
+            "email",
+            "status",
+            "application_process",
+            "eligibility_description",
+            "fees_description",
+            "wait_time",
+        ),
+    ),
+}
+"""Model and patchable fields per target type.
+
+Patches address a flat document of these fields, e.g. ``/url``.
+"""
+
+
+class Outcome:
+    """Per-target results recorded by the engine."""
+
+    APPLIED = "applied"
+    UNCHANGED = "unchanged"
+    MISSING = "missing"
+    FAILED = "failed"
+    REVERTED = "reverted"
+    CONFLICT = "conflict"
+
+
+@dataclass
+class Evaluation:
+    """Result of applying a patch to one target in memory."""
+
+    changes: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+    error: str | None = None
+
+
+def _inverse_patch(changes: Dict[str, Tuple[Any, Any]]) -> JSONPatch:
+    """Return the patch reverting ``changes``, touching only changed fields."""
+
+    forward = [
+        {"op": "replace", "path": f"/{name}", "value": after}
+        for name, (_, after) in changes.items()
+    ]
+    return inverse(forward, {name: before for name, (before, _) in changes.items()})
+
+
+@dataclass
+class CommitReport:
+    """Counts and throughput of one commit run."""
+
+    targets: int = 0
+    applied: int = 0
+    unchanged: int = 0
+    missing: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        """Return targets processed per second."""
+
+        return round(self.targets / self.seconds, 1) if self.seconds else float(self.targets)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-safe summary for ``BulkOperation.stats``."""
+
+        return {**asdict(self), "seconds": round(self.seconds, 3), "per_second": self.per_second}
+
+
+def chunk_size() -> int:
+    """Return the configured number of targets written per transaction."""
+
+    return max(1, getattr(settings, "BULK_OPERATION_CHUNK_SIZE", DEFAULT_CHUNK_SIZE))
+
+
+def evaluate(instance: Model, fields: Sequence[str], patch: JSONPatch) -> Evaluation:
+    """Apply ``patch`` to the ``fields`` document of ``instance`` in memory.
+
+    Returns the cleaned ``(before, after)`` value of every changed field, or
+    an error message if the patch does not apply or a value is invalid.
+    """
+
+    before = {name: getattr(instance, name) for name in fields}
+    try:
+        after = apply_patch(before, patch)
+    except (jsonpatch.JsonPatchException, jsonpointer.JsonPointerException) as exc:
+        return Evaluation(error=str(exc))
+    unknown = sorted(set(after) - set(fields))
+    if unknown:
+        return Evaluation(error=f"Unsupported field(s): {', '.join(unknown)}")
+
+    changes: Dict[str, Tuple[Any, Any]] = {}
+    for name in fields:
+        value = after.get(name)
+        if value == before[name]:
+            continue
+        try:
+            value = instance._meta.get_field(name).clean(value, instance)
+        except ValidationError as exc:
+            return Evaluation(error=f"{name}: {' '.join(exc.messages)}")
+        changes[name] = (before[name], value)
+    return Evaluation(changes=changes)
+
+
+def _chunks(targets: List[Dict[str, str]], size: int) -> Iterator[Tuple[str, List[str]]]:
+    """Yield ``(entity_type, ids)`` runs of at most ``size`` targets."""
+
+    for entity_type, group in groupby(targets, key=lambda t: t["entity_type"]):
+        ids = [t["entity_id"] for t in group]
+        for start in range(0, len(ids), size):
+            yield entity_type, ids[start : start + size]
+
+
+def _preview_value(value: Any) -> Any:
+    """Return a compact, JSON-safe rendering of ``value``."""
+
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    text = str(value)
+    return text if len(text) <= PREVIEW_VALUE_LIMIT else text[: PREVIEW_VALUE_LIMIT - 1] + "…"
+
+
+def preview_targets(targets: List[Dict[str, str]], patch: JSONPatch) -> List[Dict[str, Any]]:
+    """Return the before/after diff ``patch`` would make to each target.
+
+    Targets are loaded with one query per entity type and the patch is
+    applied in memory; nothing is written.
+    """
+
+    entries: List[Dict[str, Any]] = []
+    for entity_type, ids in _chunks(targets, len(targets) or 1):
+        spec = BULK_FIELDS.get(entity_type)
+        rows = {}
+        if spec is not None:
+            model, fields = spec
+            rows = {str(pk): obj for pk, obj in model.objects.in_bulk(ids).items()}
+        for entity_id in ids:
+            entry: Dict[str, Any] = {"entity_type": entity_type, "entity_id": entity_id}
+            entries.append(entry)
+            if spec is None:
+                entry.update(status=Outcome.FAILED, error="Unsupported entity type")
+                continue
+            instance = rows.get(entity_id)
+            if instance is None:
+                entry["status"] = Outcome.MISSING
+                continue
+            entry["name"] = _preview_value(getattr(instance, "name", "") or "")
+            evaluation = evaluate(instance, fields, patch)
+            if evaluation.error:
+                entry.update(status=Outcome.FAILED, error=evaluation.error)
+            elif not evaluation.changes:
+                entry["status"] = Outcome.UNCHANGED
+            else:
+                entry["status"] = "change"
+                entry["changes"] = {
+                    name: [_preview_value(before), _preview_value(after)]
+                    for name, (before, after) in evaluation.changes.items()
+                }
+    return entries
+
+
+def preview_page(op: BulkOperation, page: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Return preview rows for 1-based ``page`` of ``op`` and the page count.
+
+    Pages are computed on first request and stored on ``op.preview`` so very
+    large shelves only pay for the pages someone looks at.
+    """
+
+    total = len(op.targets)
+    pages = max(1, -(-total // PREVIEW_PAGE_SIZE))
+    page = min(max(1, page), pages)
+    preview = op.preview if isinstance(op.preview, dict) else {}
+    computed = preview.setdefault("pages", {})
+    key = str(page)
+    if key not in computed:
+        start = (page - 1) * PREVIEW_PAGE_SIZE
+        computed[key] = preview_targets(op.targets[start : start + PREVIEW_PAGE_SIZE], op.patch)
+        preview.update(total=total, page_size=PREVIEW_PAGE_SIZE)
+        op.preview = preview
+        if not op._state.adding:
+            op.save(update_fields=["preview"])
+    return computed[key], pages
+
+
+def _touch(model: type[Model], instances: List[Model]) -> List[str]:
+    """Stamp the ``auto_now`` fields of ``instances`` and return their names.
+
+    ``bulk_update`` does not set ``auto_now`` fields itself, so without this
+    ``Service.last_modified`` would keep answering conditional GETs with the
+    pre-update validators.
+    """
+
+    now = timezone.now()
+    names = [f.name for f in model._meta.concrete_fields if getattr(f, "auto_now", False)]
+    for instance in instances:
+        for name in names:
+            setattr(instance, name, now)
+    return names
+
+
+def _commit_chunk(
+    entity_type: str, ids: List[str], patch: JSONPatch, user
+) -> List[Dict[str, Any]]:
+    """Apply ``patch`` to one chunk of targets and return their results."""
+
+    spec = BULK_FIELDS.get(entity_type)
+    if spec is None:
+        return [
+            {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "outcome": Outcome.FAILED,
+                "error": "Unsupported entity type",
+            }
+            for entity_id in ids
+        ]
+    model, fields = spec
+
+    results: List[Dict[str, Any]] = []
+    with transaction.atomic():
+        rows = model.objects.select_for_update().in_bulk(ids)
+        rows = {str(pk): obj for pk, obj in rows.items()}
+        changed: List[Model] = []
+        changed_fields: set[str] = set()
+        version_keys = []
+        for entity_id in ids:
+            result: Dict[str, Any] = {"entity_type": entity_type, "entity_id": entity_id}
+            results.append(result)
+            instance = rows.get(entity_id)
+            if instance is None:
+                result["outcome"] = Outcome.MISSING
+                continue
+            evaluation = evaluate(instance, fields, patch)
+            if evaluation.error:
+                result.update(outcome=Outcome.FAILED, error=evaluation.error)
+                continue
+            if not evaluation.changes:
+                result["outcome"] = Outcome.UNCHANGED
+                continue
+            for name, (_, value) in evaluation.changes.items():
+                setattr(instance, name, value)
+            changed.append(instance)
+            changed_fields.update(evaluation.changes)
+            version_keys.extend(
+                (entity_type, entity_id, f"{entity_type}.{name}") for name in evaluation.changes
+            )
+            result.update(
+                outcome=Outcome.APPLIED,
+                fields=sorted(evaluation.changes),
+                inverse=_inverse_patch(evaluation.changes),
+            )
+
+        if changed:
+            changed_fields.update(_touch(model, changed))
+            model.objects.bulk_update(changed, sorted(changed_fields))
+            versions: Dict[str, Dict[str, int]] = {}
+            for (_, entity_id, path), version in FieldVersion.bump_many(
+                version_keys, user
+            ).items():
+                versions.setdefault(entity_id, {})[path] = version
+            for result in results:
+                if result["outcome"] == Outcome.APPLIED:
+                    result["versions"] = versions.get(result["entity_id"], {})
+            bulk_written.send(sender=model, ids=[obj.pk for obj in changed])
+    return results
+
+
+def _tally(report: Any, outcomes: Iterable[str]) -> None:
+    """Add one to the ``report`` counter of each of ``outcomes``."""
+
+    for outcome in outcomes:
+        setattr(report, outcome, getattr(report, outcome) + 1)
+
+
+def commit_operation(
+    op: BulkOperation,
+    user,
+    size: int | None = None,
+    progress: Progress | None = None,
+) -> CommitReport:
+    """Apply ``op.patch`` to every target and mark ``op`` committed.
+
+    Targets are processed in chunks of ``size`` (default
+    :func:`chunk_size`), each in its own transaction with one
+    ``bulk_update`` and one field-version upsert. Per-target outcomes are
+    stored on ``op.results`` and the counts and throughput on ``op.stats``.
+    ``progress`` is called with ``(done, total)`` after every chunk.
+
+    The results are saved in the same transaction as each chunk and ``op``
+    stays ``COMMITTING`` until the last one, so a commit that fails part
+    way keeps the inverse patches of every applied chunk and can be undone.
+    """
+
+    size = size or chunk_size()
+    report = CommitReport(targets=len(op.targets))
+    started = time.perf_counter()
+    results: List[Dict[str, Any]] = []
+    op.status = BulkOperation.Status.COMMITTING
+    op.undo_token = secrets.token_urlsafe(32)
+    for entity_type, ids in _chunks(op.targets, size):
+        with transaction.atomic():
+            chunk = _commit_chunk(entity_type, ids, op.patch, user)
+            results.extend(chunk)
+            _tally(report, (result["outcome"] for result in chunk))
+            report.seconds = time.perf_counter() - started
+            op.results = results
+            op.stats = report.as_dict()
+            op.save(update_fields=["results", "stats", "status", "undo_token"])
+        if progress:
+            progress(len(results), report.targets)
+
+    op.results = results
+    op.stats = report.as_dict()
+    op.status = BulkOperation.Status.COMMITTED
+    op.committed_at = timezone.now()
+    op.save(update_fields=["results", "stats", "status", "committed_at", "undo_token"])
+    return report
+
+
+@dataclass
+class UndoReport:
+    """Counts and throughput of one undo run."""
+
+    targets: int = 0
+    reverted: int = 0
+    conflict: int = 0
+    missing: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-safe summary for ``BulkOperation.stats``."""
+
+        per_second = round(self.targets / self.seconds, 1) if self.seconds else float(self.targets)
+        return {**asdict(self), "seconds": round(self.seconds, 3), "per_second": per_second}
+
+
+def _undo_chunk(entity_type: str, entries: List[Dict[str, Any]], user) -> None:
+    """Replay the inverse patches of one chunk of applied ``entries``.
+
+    A target whose touched fields were edited since the commit (its field
+    versions moved on) is left alone and marked as a conflict. The outcome
+    is written to each entry's ``undo`` key.
+    """
+
+    model, fields = BULK_FIELDS[entity_type]
+    ids = [entry["entity_id"] for entry in entries]
+    with transaction.atomic():
+        rows = {str(pk): obj for pk, obj in model.objects.select_for_update().in_bulk(ids).items()}
+        current = {
+            (str(entity_id), path): version
+            for entity_id, path, version in FieldVersion.objects.filter(
+                entity_type=entity_type,
+                entity_id__in=ids,
+                field_path__in={p for e in entries for p in e.get("versions", {})},
+            ).values_list("entity_id", "field_path", "version")
+        }
+        reverted: List[Model] = []
+        reverted_fields: set[str] = set()
+        version_keys = []
+        for entry in entries:
+            entity_id = entry["entity_id"]
+            instance = rows.get(entity_id)
+            if instance is None:
+                entry["undo"] = Outcome.MISSING
+                continue
+            versions = entry.get("versions", {})
+            if any(current.get((entity_id, path)) != v for path, v in versions.items()):
+                entry["undo"] = Outcome.CONFLICT
+                continue
+            evaluation = evaluate(instance, fields, entry["inverse"])
+            if evaluation.error:
+                entry.update(undo=Outcome.FAILED, undo_error=evaluation.error)
+                continue
+            for name, (_, value) in evaluation.changes.items():
+                setattr(instance, name, value)
+            reverted.append(instance)
+            reverted_fields.update(evaluation.changes)
+            version_keys.extend((entity_type, entity_id, path) for path in versions)
+            entry["undo"] = Outcome.REVERTED
+
+        if reverted:
+            reverted_fields.update(_touch(model, reverted))
+            model.objects.bulk_update(reverted, sorted(reverted_fields))
+            FieldVersion.bump_many(version_keys, user)
+            bulk_written.send(sender=model, ids=[obj.pk for obj in reverted])
+
+
+def undo_operation(
+    op: BulkOperation,
+    user,
+    size: int | None = None,
+    progress: Progress | None = None,
+) -> UndoReport:
+    """Revert a committed ``op`` by replaying its stored inverse patches.
+
+    An interrupted ``COMMITTING`` operation is reverted from the results of
+    the chunks it did apply.
+
+    Only targets the commit actually changed are touched, in chunks of
+    ``size`` with one ``bulk_update`` each; no resource is re-serialized.
+    Undo outcomes are added to ``op.results`` and summarized under
+    ``op.stats["undo"]``.
+
+    Each chunk's outcomes are saved in the chunk's transaction, and entries
+    that already have one are skipped, so an undo retried after its worker
+    died resumes where it stopped instead of reporting its own reverts as
+    conflicts.
+    """
+
+    size = size or chunk_size()
+    applied = [r for r in op.results or [] if r.get("outcome") == Outcome.APPLIED]
+    report = UndoReport(targets=len(applied))
+    started = time.perf_counter()
+    done = sum(1 for entry in applied if "undo" in entry)
+    pending = [entry for entry in applied if "undo" not in entry]
+    for entity_type, group in groupby(pending, key=lambda r: r["entity_type"]):
+        group = list(group)
+        for start in range(0, len(group), size):
+            with transaction.atomic():
+                _undo_chunk(entity_type, group[start : start + size], user)
+                op.save(update_fields=["results"])
+            done += len(group[start : start + size])
+            if progress:
+                progress(done, report.targets)
+    report.seconds = time.perf_counter() - started
+    _tally(report, (entry["undo"] for entry in applied))
+
+    op.stats = {**(op.stats or {}), "undo": report.as_dict()}
+    op.status = BulkOperation.Status.UNDONE
+    op.undone_at = timezone.now()
+    op.save(update_fields=["results", "stats", "status", "undone_at"])
+    return report
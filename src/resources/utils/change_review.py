@@ -0,0 +1,297 @@
+"""Diff, coalesce and batch-apply change requests for review."""
+from __future__ import annotations
+
+import operator
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import reduce
+from typing import Any, Dict, Iterable, List, Tuple
+from uuid import UUID
+
+import jsonpatch
+import jsonpointer
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from hsds.models import Service
+from hsds.signals import bulk_written
+from hsds_ext.models import ChangeRequest, FieldVersion, VerificationEvent
+from resources.serializers.resource import ServiceSerializer
+from resources.utils.json_patch import apply_patch
+from resources.utils.review_leases import held_by_other
+
+QUEUE_ORDERING = ("-submitted_at", "-id")
+"""Keyset ordering of review queues: newest first, ``id`` breaking ties."""
+
+
+@dataclass
+class ApprovalReport:
+    """Outcome of :func:`approve_change_requests` per change request id."""
+
+    approved: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the report as a JSON-serializable dict."""
+
+        return {"approved": self.approved, "failed": self.failed, "skipped": self.skipped}
+
+
+def field_diff(service: Service, patch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return the ``before``/``after`` value of each field ``patch`` touches.
+
+    A field written by several operations is listed once.
+
+    Raises ``jsonpatch.JsonPatchException`` or
+    ``jsonpointer.JsonPointerException`` if the patch does not apply.
+    """
+
+    original = {"service": ServiceSerializer(service).data}
+    patched = apply_patch(original, patch)
+    changes = []
+    seen = set()
+    for op in patch:
+        path = op.get("path", "").lstrip("/").replace("/", ".")
+        if path in seen:
+            continue
+        seen.add(path)
+        before: Any = original
+        after: Any = patched
+        for part in path.split("."):
+            before = before.get(part) if isinstance(before, dict) else None
+            after = after.get(part) if isinstance(after, dict) else None
+        changes.append({"field": path, "before": before, "after": after})
+    return changes
+
+
+def patch_paths(patch: List[Dict[str, Any]]) -> List[str]:
+    """Return the sorted ``entity.field`` paths that ``patch`` writes.
+
+    ``test`` operations only read, so they are left out.
+    """
+
+    paths = set()
+    for op in patch:
+        if op.get("op") != "test":
+            parts = str(op.get("path", "")).lstrip("/").split("/")
+            paths.add(".".join(parts[:2]))
+    return sorted(paths)
+
+
+def submit_change_request(
+    service: Service, patch: List[Dict[str, Any]], note: str | None, user
+) -> Tuple[ChangeRequest, List[ChangeRequest]]:
+    """Create a pending change request, coalescing pending ones it overlaps.
+
+    Pending, unleased requests on ``service`` that write any of the same
+    paths are folded into the new request: their patches are prepended in
+    submit order, the path sets are merged, their submitters (and earlier
+    contributors) become ``contributors`` of the new request, and they are
+    marked superseded by it. The queue therefore holds at most one open request per field and
+    approving it applies the combined edit once. If the combined patch no
+    longer applies, the new request is stored on its own. Returns the new
+    request and the requests it superseded.
+
+    Raises ``jsonpatch.JsonPatchException`` or
+    ``jsonpointer.JsonPointerException`` if ``patch`` does not apply.
+    """
+
+    paths = patch_paths(patch)
+    with transaction.atomic():
+        candidates = (
+            ChangeRequest.objects.select_for_update()
+            .filter(
+                target_entity_type=ChangeRequest.EntityType.SERVICE,
+                target_entity_id=service.id,
+                status=ChangeRequest.Status.PENDING,
+            )
+            .exclude(claimed_until__gt=timezone.now())
+            .order_by("submitted_at", "id")
+        )
+        if connection.vendor == "postgresql" and paths:
+            candidates = candidates.filter(
+                reduce(operator.or_, (Q(paths__contains=[path]) for path in paths))
+            )
+        older = [cr for cr in candidates if set(cr.paths) & set(paths)]
+
+        combined = [op for cr in older for op in cr.patch] + patch
+        try:
+            diff = field_diff(service, combined)
+        except (jsonpatch.JsonPatchException, jsonpointer.JsonPointerException):
+            older, combined = [], patch
+            diff = field_diff(service, patch)
+
+        change_request = ChangeRequest.objects.create(
+            target_entity_type=ChangeRequest.EntityType.SERVICE,
+            target_entity_id=service.id,
+            patch=combined,
+            paths=sorted({path for cr in older for path in cr.paths} | set(paths)),
+            diff=diff,
+            note=note or None,
+            submitted_by=user,
+        )
+        if older:
+            change_request.contributors.set(
+                get_user_model()
+                .objects.filter(
+                    Q(change_requests_submitted__in=older)
+                    | Q(change_requests_contributed__in=older)
+                )
+                .exclude(pk=user.pk)
+                .distinct()
+            )
+        ChangeRequest.objects.filter(id__in=[cr.id for cr in older]).update(
+            status=ChangeRequest.Status.SUPERSEDED, superseded_by=change_request
+        )
+    return change_request, older
+
+
+def stored_diff(change_request: ChangeRequest) -> List[Dict[str, Any]]:
+    """Return the diff saved at submit time, computing it for older requests."""
+
+    if change_request.diff is None:
+        service = Service.objects.filter(id=change_request.target_entity_id).first()
+        try:
+            diff = field_diff(service, change_request.patch) if service else []
+        except (jsonpatch.JsonPatchException, jsonpointer.JsonPointerException):
+            diff = []
+        change_request.diff = diff
+        change_request.save(update_fields=["diff"])
+    return change_request.diff
+
+
+def status_counts() -> Dict[str, int]:
+    """Return the number of change requests per status, zeros included."""
+
+    counts = dict.fromkeys(ChangeRequest.Status.values, 0)
+    rows = ChangeRequest.objects.order_by().values_list("status").annotate(n=Count("id"))
+    counts.update(dict(rows))
+    return counts
+
+
+def compose(
+    service: Service, change_requests: Iterable[ChangeRequest]
+) -> Tuple[Dict[str, Any], List[ChangeRequest], Dict[str, str]]:
+    """Apply ``change_requests`` to ``service`` in order, in memory.
+
+    Each patch is applied to the document produced by the previous one. A
+    request whose patch does not apply, or leaves an invalid value, is
+    reported as failed and the document continues from the state before
+    it. Returns the cleaned changed field values, the requests that
+    applied, and the failures keyed by request id.
+    """
+
+    original = {"service": ServiceSerializer(service).data}
+    document = original
+    applied: List[ChangeRequest] = []
+    failed: Dict[str, str] = {}
+    changes: Dict[str, Any] = {}
+    for change_request in change_requests:
+        try:
+            patched = apply_patch(document, change_request.patch)
+            candidate = _cleaned_changes(service, patched.get("service", {}))
+        except (jsonpatch.JsonPatchException, jsonpointer.JsonPointerException) as exc:
+            failed[str(change_request.id)] = str(exc)
+            continue
+        except ValidationError as exc:
+            failed[str(change_request.id)] = " ".join(exc.messages)
+            continue
+        document, changes = patched, candidate
+        applied.append(change_request)
+    return changes, applied, failed
+
+
+def _cleaned_changes(service: Service, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the cleaned values in ``values`` that differ from ``service``."""
+
+    changes: Dict[str, Any] = {}
+    for name, value in values.items():
+        if name == "id" or getattr(service, name) == value:
+            continue
+        try:
+            changes[name] = service._meta.get_field(name).clean(value, service)
+        except ValidationError as exc:
+            raise ValidationError(f"{name}: {' '.join(exc.messages)}") from exc
+    return changes
+
+
+def approve_change_requests(ids: Iterable[UUID | str], user) -> ApprovalReport:
+    """Approve the pending change requests in ``ids`` as one batch.
+
+    Requests are grouped by target and composed in submit order, so each
+    service is written once however many requests touch it. All targets
+    are written with one ``bulk_update``, one field-version upsert and one
+    ``VerificationEvent`` insert inside a single transaction. Ids that are
+    unknown, no longer pending or leased to another reviewer are reported
+    as skipped.
+    """
+
+    requested = [str(i) for i in ids]
+    report = ApprovalReport()
+    with transaction.atomic():
+        pending = list(
+            ChangeRequest.objects.select_for_update()
+            .filter(id__in=requested, status=ChangeRequest.Status.PENDING)
+            .exclude(held_by_other(user))
+            .order_by("submitted_at", "id")
+        )
+        by_target: Dict[UUID, List[ChangeRequest]] = defaultdict(list)
+        for change_request in pending:
+            by_target[change_request.target_entity_id].append(change_request)
+        services = Service.objects.select_for_update().in_bulk(list(by_target))
+
+        now = timezone.now()
+        changed: List[Service] = []
+        changed_fields = {"last_modified"}
+        version_keys = []
+        events: List[VerificationEvent] = []
+        approved: List[ChangeRequest] = []
+        for target, change_requests in by_target.items():
+            service = services.get(target)
+            if service is None:
+                for change_request in change_requests:
+                    report.failed[str(change_request.id)] = "Target service not found"
+                continue
+            changes, applied, failed = compose(service, change_requests)
+            report.failed.update(failed)
+            approved.extend(applied)
+            if not changes:
+                continue
+            for name, value in changes.items():
+                setattr(service, name, value)
+            service.last_modified = now
+            changed.append(service)
+            changed_fields.update(changes)
+            paths = [f"service.{name}" for name in changes]
+            version_keys.extend(
+                (FieldVersion.EntityType.SERVICE, service.id, path) for path in paths
+            )
+            events.extend(
+                VerificationEvent(
+                    entity_type=VerificationEvent.EntityType.SERVICE,
+                    entity_id=service.id,
+                    field_path=path,
+                    method=VerificationEvent.Method.OTHER,
+                    note="change request approved",
+                    verified_by=user,
+                )
+                for path in paths
+            )
+
+        if changed:
+            Service.objects.bulk_update(changed, sorted(changed_fields))
+            FieldVersion.bump_many(version_keys, user)
+            VerificationEvent.objects.bulk_create(events)
+            bulk_written.send(sender=Service, ids=[service.pk for service in changed])
+        ChangeRequest.objects.filter(id__in=[cr.id for cr in approved]).update(
+            status=ChangeRequest.Status.APPROVED, reviewed_by=user, reviewed_at=now
+        )
+
+    report.approved = [str(cr.id) for cr in approved]
+    seen = {str(cr.id) for cr in pending}
+    report.skipped = [i for i in requested if i not in seen]
+    return report
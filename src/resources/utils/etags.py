@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Dict, Mapping
+from typing import Any, Dict, Mapping
 
 
 def build_etag_map(versions: Mapping[str, int]) -> Dict[str, str]:
@@ -13,14 +13,18 @@ def build_etag_map(versions: Mapping[str, int]) -> Dict[str, str]:
     return {path: f"v{version}" for path, version in versions.items()}
 
 
-def resource_etag(versions: Mapping[str, int]) -> str:
+def resource_etag(
+    versions: Mapping[str, int], context: Mapping[str, Any] | None = None
+) -> str:
     """Compute a weak ETag for an entire resource.
 
     The ETag is derived from the JSON representation of ``versions`` and thus
-    changes whenever any field version changes.
+    changes whenever any field version changes. ``context`` holds anything
+    else the representation depends on, such as redactions or language.
     """
 
-    payload = json.dumps(versions, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    state = versions if context is None else {"versions": versions, **context}
+    payload = json.dumps(state, sort_keys=True, separators=(",", ":")).encode("utf-8")
     digest = hashlib.sha256(payload).hexdigest()
     return f'W/"{digest}"'
 
@@ -0,0 +1,156 @@
+"""Maintain the materialized :class:`HealthMetric` counts."""
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Set, Tuple
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q, QuerySet
+from django.utils import timezone
+
+from hsds.models import Location, Phone, Schedule, Service
+from hsds_ext.models import HealthFlag, HealthMetric, VerificationEvent
+
+Key = HealthMetric.Key
+
+STALE_AFTER = timedelta(days=90)
+"""Services without a verification event in this window count as stale."""
+
+SERVICE_METRICS = (Key.NO_PHONE, Key.NO_HOURS, Key.STALE)
+LOCATION_METRICS = (Key.NOT_GEOCODED,)
+
+Flag = Tuple[str, UUID]
+
+
+def _failing_services(services: QuerySet[Service], now: datetime) -> Dict[str, QuerySet]:
+    """Return, per service metric, the subset of ``services`` failing it."""
+
+    recent = VerificationEvent.objects.filter(
+        entity_type=VerificationEvent.EntityType.SERVICE,
+        entity_id=OuterRef("pk"),
+        verified_at__gte=now - STALE_AFTER,
+    )
+    return {
+        Key.NO_PHONE: services.filter(~Exists(Phone.objects.filter(service=OuterRef("pk")))),
+        Key.NO_HOURS: services.filter(
+            ~Exists(Schedule.objects.filter(service=OuterRef("pk")))
+        ),
+        Key.STALE: services.filter(~Exists(recent)),
+    }
+
+
+def _failing_locations(locations: QuerySet[Location]) -> Dict[str, QuerySet]:
+    """Return, per location metric, the subset of ``locations`` failing it."""
+
+    return {
+        Key.NOT_GEOCODED: locations.filter(
+            Q(latitude__isnull=True) | Q(longitude__isnull=True)
+        ),
+    }
+
+
+def _flags(failing: Dict[str, QuerySet]) -> Set[Flag]:
+    """Return ``(metric, entity_id)`` pairs for the ``failing`` querysets."""
+
+    return {
+        (metric, entity_id)
+        for metric, qs in failing.items()
+        for entity_id in qs.values_list("pk", flat=True)
+    }
+
+
+def _existing(metrics: Iterable[str], ids: Set[UUID]) -> Set[Flag]:
+    """Return the stored flags of ``ids`` for ``metrics``."""
+
+    return set(
+        HealthFlag.objects.filter(metric__in=metrics, entity_id__in=ids).values_list(
+            "metric", "entity_id"
+        )
+    )
+
+
+def _apply(metrics: Iterable[str], ids: Set[UUID], wanted: Set[Flag]) -> None:
+    """Bring the flags of ``ids`` for ``metrics`` to ``wanted`` and adjust counts.
+
+    An unlocked read skips the common case where nothing changes. Otherwise
+    the metric rows are locked and the flags read again, so concurrent
+    refreshes of the same entities count each added or removed flag once.
+    """
+
+    metrics = sorted(metrics)
+    if _existing(metrics, ids) == wanted:
+        return
+    with transaction.atomic():
+        list(HealthMetric.objects.select_for_update().filter(key__in=metrics).order_by("key"))
+        existing = _existing(metrics, ids)
+        added = wanted - existing
+        removed = existing - wanted
+        if removed:
+            condition = Q()
+            for metric, entity_id in removed:
+                condition |= Q(metric=metric, entity_id=entity_id)
+            HealthFlag.objects.filter(condition).delete()
+        HealthFlag.objects.bulk_create(
+            [HealthFlag(metric=m, entity_id=e) for m, e in added], ignore_conflicts=True
+        )
+        delta = Counter(m for m, _ in added)
+        delta.subtract(m for m, _ in removed)
+        for metric, change in delta.items():
+            if change:
+                HealthMetric.objects.filter(key=metric).update(count=F("count") + change)
+
+
+def refresh_services(ids: Iterable[UUID | str | None]) -> None:
+    """Re-evaluate the service metrics for ``ids``; deleted services drop out."""
+
+    ids = {UUID(str(i)) for i in ids if i}
+    if ids:
+        failing = _failing_services(Service.objects.filter(pk__in=ids), timezone.now())
+        _apply(SERVICE_METRICS, ids, _flags(failing))
+
+
+def refresh_locations(ids: Iterable[UUID | str | None]) -> None:
+    """Re-evaluate the location metrics for ``ids``; deleted locations drop out."""
+
+    ids = {UUID(str(i)) for i in ids if i}
+    if ids:
+        _apply(LOCATION_METRICS, ids, _flags(_failing_locations(Location.objects.filter(pk__in=ids))))
+
+
+def reconcile() -> Dict[str, HealthMetric]:
+    """Recompute every flag and count from the HSDS tables.
+
+    Corrects any drift from concurrent writes and ages services into the
+    ``stale`` metric, which no write signals.
+    """
+
+    now = timezone.now()
+    failing = {
+        **_failing_services(Service.objects.all(), now),
+        **_failing_locations(Location.objects.all()),
+    }
+    with transaction.atomic():
+        list(HealthMetric.objects.select_for_update().order_by("key"))
+        HealthFlag.objects.all().delete()
+        metrics = {}
+        for metric, qs in failing.items():
+            ids = list(qs.values_list("pk", flat=True))
+            HealthFlag.objects.bulk_create(
+                [HealthFlag(metric=metric, entity_id=entity_id) for entity_id in ids],
+                batch_size=1000,
+            )
+            metrics[metric], _ = HealthMetric.objects.update_or_create(
+                key=metric, defaults={"count": len(ids), "computed_at": now}
+            )
+    return metrics
+
+
+def current_metrics() -> Dict[str, HealthMetric]:
+    """Return the materialized metrics, reconciling once if never computed."""
+
+    metrics = {m.key: m for m in HealthMetric.objects.all()}
+    if len(metrics) < len(Key.values) or any(m.computed_at is None for m in metrics.values()):
+        metrics = reconcile()
+    return metrics
@@ -0,0 +1,73 @@
+"""Lease review-queue items to one reviewer at a time."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Model, Q
+from django.utils import timezone
+
+from hsds_ext.models import ChangeRequest, DraftResource
+
+LEASE_DURATION = timedelta(minutes=15)
+MAX_CLAIM = 50
+
+REVIEW_ITEMS: Dict[str, Tuple[type[Model], str, str]] = {
+    "change_request": (ChangeRequest, ChangeRequest.Status.PENDING, "submitted_at"),
+    "draft": (DraftResource, DraftResource.Status.DRAFT, "created_at"),
+}
+"""Review item kinds mapped to ``(model, reviewable status, queue order field)``."""
+
+LEASE_CONFLICT = "Claimed by another reviewer"
+
+
+def held_by_other(user) -> Q:
+    """Return a filter matching items under an unexpired lease of another user."""
+
+    return Q(claimed_until__gt=timezone.now()) & ~Q(claimed_by=user)
+
+
+def is_held_by_other(item: Model, user) -> bool:
+    """Return whether ``item`` is under an unexpired lease of another user."""
+
+    return (
+        item.claimed_until is not None
+        and item.claimed_until > timezone.now()
+        and item.claimed_by_id != user.pk
+    )
+
+
+def claim_next(kind: str, user, count: int) -> List[Model]:
+    """Lease up to ``count`` of the oldest reviewable items of ``kind`` to ``user``.
+
+    Items that are unleased, whose lease expired, or that ``user`` already
+    holds are eligible; holding them again extends the lease. Candidate rows
+    are locked with ``FOR UPDATE SKIP LOCKED`` so reviewers claiming at the
+    same moment receive disjoint items instead of waiting on each other.
+    """
+
+    model, status, order = REVIEW_ITEMS[kind]
+    now = timezone.now()
+    available = Q(claimed_until__isnull=True) | Q(claimed_until__lte=now) | Q(claimed_by=user)
+    with transaction.atomic():
+        ids = list(
+            model.objects.select_for_update(skip_locked=True)
+            .filter(available, status=status)
+            .order_by(order, "id")
+            .values_list("id", flat=True)[: min(count, MAX_CLAIM)]
+        )
+        model.objects.filter(id__in=ids).update(
+            claimed_by=user, claimed_until=now + LEASE_DURATION
+        )
+    return list(model.objects.filter(id__in=ids).order_by(order, "id"))
+
+
+def release(kind: str, user, ids: Iterable[UUID | str]) -> int:
+    """End ``user``'s leases on ``ids`` and return how many were released."""
+
+    model, _, _ = REVIEW_ITEMS[kind]
+    return model.objects.filter(id__in=list(ids), claimed_by=user).update(
+        claimed_by=None, claimed_until=None
+    )
@@ -0,0 +1,266 @@
+"""Build and query the denormalized :class:`SearchDocument` index."""
+from __future__ import annotations
+
+import re
+from typing import Iterable, List, Sequence
+from uuid import UUID
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramSimilarity,
+)
+from django.db import connection
+from django.db.models import F, Q, QuerySet
+from django.db.models.functions import Greatest
+
+from hsds.models import (
+    Address,
+    Location,
+    Organization,
+    Phone,
+    Service,
+    normalize_phone_number,
+)
+from hsds_ext.models import SearchDocument
+
+EntityIds = Iterable[UUID | str]
+
+_DOCUMENT_FIELDS = ["name", "address", "phones", "text", "updated_at"]
+
+MIN_PHONE_DIGITS = 4
+"""Shortest digit run treated as a phone-number (suffix) search."""
+
+_PHONE_QUERY_RE = re.compile(r"^\+?[\d\s().\-]+$")
+
+_PHONE_OWNER_FIELDS = {
+    SearchDocument.EntityType.ORGANIZATION: "organization_id",
+    SearchDocument.EntityType.LOCATION: "location_id",
+    SearchDocument.EntityType.SERVICE: "service_id",
+}
+
+
+def _format_address(address: Address | None) -> str:
+    """Return a one-line ``"address_1, city"`` label."""
+
+    return f"{address.address_1}, {address.city}" if address else ""
+
+
+def _document(
+    entity_type: str,
+    entity_id: UUID,
+    name: str,
+    address: str,
+    phones: List[str],
+    extra: Sequence[str] = (),
+) -> SearchDocument:
+    """Return an unsaved document with its lower-cased search text."""
+
+    parts = [name, address, *phones, *extra]
+    text = " ".join(part for part in parts if part).lower()
+    return SearchDocument(
+        entity_type=entity_type,
+        entity_id=entity_id,
+        name=name,
+        address=address,
+        phones=phones,
+        text=text,
+    )
+
+
+def _organization_documents(ids: EntityIds) -> List[SearchDocument]:
+    """Return documents for the organizations in ``ids``."""
+
+    orgs = Organization.objects.filter(id__in=ids).prefetch_related("phones")
+    return [
+        _document(
+            SearchDocument.EntityType.ORGANIZATION,
+            org.id,
+            org.name or "",
+            "",
+            [p.number for p in org.phones.all()],
+        )
+        for org in orgs
+    ]
+
+
+def _location_documents(ids: EntityIds) -> List[SearchDocument]:
+    """Return documents for the locations in ``ids``."""
+
+    locations = Location.objects.filter(id__in=ids).prefetch_related("addresses", "phones")
+    docs = []
+    for loc in locations:
+        addresses = list(loc.addresses.all())
+        address = _format_address(addresses[0] if addresses else None)
+        docs.append(
+            _document(
+                SearchDocument.EntityType.LOCATION,
+                loc.id,
+                loc.name or "",
+                address,
+                [p.number for p in loc.phones.all()],
+                [_format_address(a) for a in addresses[1:]],
+            )
+        )
+    return docs
+
+
+def _service_documents(ids: EntityIds) -> List[SearchDocument]:
+    """Return documents for the services in ``ids``.
+
+    Service text also carries the organization name and the addresses of the
+    service's locations so one query can rank services on all of them.
+    """
+
+    services = (
+        Service.objects.filter(id__in=ids)
+        .select_related("organization")
+        .prefetch_related("phones", "locations__addresses")
+    )
+    docs = []
+    for svc in services:
+        addresses = [a for loc in svc.locations.all() for a in loc.addresses.all()]
+        docs.append(
+            _document(
+                SearchDocument.EntityType.SERVICE,
+                svc.id,
+                svc.name or "",
+                _format_address(addresses[0] if addresses else None),
+                [p.number for p in svc.phones.all()],
+                [svc.organization.name or "", *(_format_address(a) for a in addresses[1:])],
+            )
+        )
+    return docs
+
+
+_BUILDERS = {
+    SearchDocument.EntityType.ORGANIZATION: _organization_documents,
+    SearchDocument.EntityType.LOCATION: _location_documents,
+    SearchDocument.EntityType.SERVICE: _service_documents,
+}
+
+
+def refresh_documents(entity_type: str, ids: EntityIds) -> None:
+    """Rebuild the documents for ``ids`` and drop those whose entity is gone."""
+
+    ids = {str(i) for i in ids if i}
+    if not ids:
+        return
+    docs = _BUILDERS[entity_type](ids)
+    present = {str(doc.entity_id) for doc in docs}
+    missing = ids - present
+    if missing:
+        SearchDocument.objects.filter(entity_type=entity_type, entity_id__in=missing).delete()
+    if not docs:
+        return
+    SearchDocument.objects.bulk_create(
+        docs,
+        update_conflicts=True,
+        unique_fields=["entity_type", "entity_id"],
+        update_fields=_DOCUMENT_FIELDS,
+    )
+    if connection.vendor == "postgresql":
+        SearchDocument.objects.filter(entity_type=entity_type, entity_id__in=present).update(
+            search_vector=SearchVector("name", weight="A", config="simple")
+            + SearchVector("text", weight="B", config="simple")
+        )
+
+
+def services_at_locations(location_ids: EntityIds) -> List[UUID]:
+    """Return ids of services linked to any of ``location_ids``."""
+
+    return list(
+        Service.objects.filter(locations__id__in=list(location_ids))
+        .values_list("id", flat=True)
+        .distinct()
+    )
+
+
+def phone_query_digits(query: str) -> str:
+    """Return the normalized digits of ``query`` if it looks like a phone number.
+
+    Returns an empty string for queries containing anything other than phone
+    punctuation or with fewer than :data:`MIN_PHONE_DIGITS` digits.
+    """
+
+    query = query.strip()
+    if not _PHONE_QUERY_RE.match(query):
+        return ""
+    digits = normalize_phone_number(query)
+    return digits if len(digits) >= MIN_PHONE_DIGITS else ""
+
+
+def phones_matching(digits: str) -> QuerySet[Phone]:
+    """Return phones whose normalized number equals or ends with ``digits``.
+
+    Both branches are served by B-tree indexes: the exact match by
+    ``number_digits`` and the suffix match as a prefix of
+    ``number_digits_reversed``.
+    """
+
+    return Phone.objects.filter(
+        Q(number_digits=digits) | Q(number_digits_reversed__startswith=digits[::-1])
+    )
+
+
+def phone_matches(number: str, digits: str) -> bool:
+    """Return whether ``number`` matches normalized query ``digits``."""
+
+    return normalize_phone_number(number).endswith(digits)
+
+
+def _phone_owner_filter(digits: str) -> Q:
+    """Return a filter selecting documents that own a phone matching ``digits``."""
+
+    phones = phones_matching(digits)
+    condition = Q()
+    for entity_type, owner_field in _PHONE_OWNER_FIELDS.items():
+        condition |= Q(
+            entity_type=entity_type,
+            entity_id__in=phones.filter(**{f"{owner_field}__isnull": False}).values(
+                owner_field
+            ),
+        )
+    return condition
+
+
+def search_documents(
+    query: str, entity_types: Sequence[str] | None = None, limit: int = 20
+) -> QuerySet[SearchDocument]:
+    """Return the best ``limit`` documents matching ``query`` in one query.
+
+    On PostgreSQL rows match on the full-text vector or a substring of the
+    trigram-indexed text and are ranked by the greater of full-text rank and
+    trigram similarity. Other backends fall back to a substring match ordered
+    by name.
+
+    Phone-like queries additionally match documents owning a phone whose
+    normalized digits equal or end with the query's digits, so formatting
+    differences such as ``(555) 010-0100`` versus ``555.010.0100`` do not
+    matter.
+    """
+
+    needle = query.strip().lower()
+    digits = phone_query_digits(query)
+    matches = Q(text__contains=needle)
+    if digits:
+        matches |= _phone_owner_filter(digits)
+    qs = SearchDocument.objects.all()
+    if entity_types:
+        qs = qs.filter(entity_type__in=entity_types)
+    if connection.vendor == "postgresql":
+        ts_query = SearchQuery(query, config="simple", search_type="websearch")
+        qs = (
+            qs.filter(Q(search_vector=ts_query) | matches)
+            .annotate(
+                rank=Greatest(
+                    SearchRank(F("search_vector"), ts_query),
+                    TrigramSimilarity("text", needle),
+                )
+            )
+            .order_by("-rank", "name")
+        )
+    else:
+        qs = qs.filter(matches).order_by("name")
+    return qs[:limit]
@@ -4,56 +4,149 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+from django.db.models import Count, F, QuerySet, Window
+from django.db.models.functions import FirstValue, Lag, Lead, RowNumber
+
 from hsds.models import Service
 
+SIBLING_WINDOW = 20
+"""Default number of services listed around the current one per group."""
+
+MAX_SIBLING_WINDOW = 100
+
+SIBLING_ORDER = (F("name").asc(), F("id").asc())
+
+
+def _ordered(expression) -> Window:
+    """Return ``expression`` as a window over the sibling ordering."""
+
+    return Window(expression, order_by=list(SIBLING_ORDER))
+
+
+def _navigation(siblings: QuerySet, service: Service) -> Dict[str, Any] | None:
+    """Return the position, neighbours and size of ``service`` in ``siblings``.
+
+    One query: ``ROW_NUMBER``, ``LAG``/``LEAD`` and ``FIRST_VALUE`` are
+    evaluated over the whole group and only the current row is returned.
+    A plain ``id`` filter would be applied before the windows and shrink
+    the group, so the row is selected through a per-row window, which
+    Django filters after the windows are computed.
+    """
+
+    return (
+        siblings.annotate(
+            position=_ordered(RowNumber()),
+            prev_id=_ordered(Lag("id")),
+            next_id=_ordered(Lead("id")),
+            first_id=_ordered(FirstValue("id")),
+            total=Window(Count("id")),
+            row_id=Window(FirstValue("id"), partition_by=[F("id")]),
+        )
+        .filter(row_id=service.id)
+        .values("position", "prev_id", "next_id", "first_id", "total")
+        .first()
+    )
+
 
-def get_sibling_data(service: Service) -> Dict[str, Any]:
+def _page(
+    siblings: QuerySet, service: Service, nav: Dict[str, Any], size: int, start: int | None
+) -> Dict[str, Any]:
+    """Return up to ``size`` siblings from ``start``, centred on ``service`` by default.
+
+    ``previous_start``/``next_start`` are the offsets of the neighbouring
+    windows, or ``None`` at either end of the group.
+    """
+
+    total = nav["total"]
+    if start is None:
+        start = nav["position"] - 1 - size // 2
+    start = max(0, min(start, total - size))
+    rows = siblings.order_by(*SIBLING_ORDER).values_list("id", "name")[start : start + size]
+    return {
+        "results": [
+            {"id": str(pk), "name": name} for pk, name in rows if pk != service.id
+        ],
+        "start": start,
+        "size": size,
+        "total": total - 1,
+        "previous_start": max(0, start - size) if start > 0 else None,
+        "next_start": start + size if start + size < total else None,
+    }
+
+
+def _first_other(nav: Dict[str, Any], service: Service) -> str:
+    """Return the first sibling in order that is not ``service`` itself."""
+
+    first = nav["first_id"] if nav["first_id"] != service.id else nav["next_id"]
+    return str(first) if first else ""
+
+
+def get_sibling_data(
+    service: Service,
+    size: int = SIBLING_WINDOW,
+    org_start: int | None = None,
+    loc_start: int | None = None,
+) -> Dict[str, Any]:
     """Return sibling services grouped by organization and location.
 
     Args:
         service: Reference service instance.
+        size: Number of services per group window, including ``service``.
+        org_start: Offset of the organization window; centred on
+            ``service`` when omitted.
+        loc_start: Offset of the location window; centred on ``service``
+            when omitted.
 
     Returns:
         dict: Contains ``organization`` and ``location`` lists of sibling
         services. Each list entry is a dict with ``id`` and ``name``. The
         payload also includes navigation helpers ``prev_id``, ``next_id``,
-        ``first_org`` and ``first_loc`` for keyboard shortcuts.
+        ``first_org`` and ``first_loc`` for keyboard shortcuts, and
+        ``organization_page``/``location_page`` with each window's
+        ``start`` offset, ``size``, the ``total`` number of siblings and the
+        ``previous_start``/``next_start`` offsets of adjacent windows.
     """
 
-    org_qs = (
-        Service.objects.filter(organization=service.organization)
-        .exclude(id=service.id)
-        .order_by("name")
-    )
-    org = [{"id": str(s.id), "name": s.name} for s in org_qs]
+    size = max(1, min(size, MAX_SIBLING_WINDOW))
+    empty_page = {
+        "start": 0,
+        "size": size,
+        "total": 0,
+        "previous_start": None,
+        "next_start": None,
+    }
+
+    org_qs = Service.objects.filter(organization_id=service.organization_id)
+    org: List[Dict[str, Any]] = []
+    org_page = empty_page
+    first_org = ""
+    nav = _navigation(org_qs, service)
+    if nav:
+        page = _page(org_qs, service, nav, size, org_start)
+        org = page.pop("results")
+        org_page = page
+        first_org = _first_other(nav, service)
 
     loc: List[Dict[str, Any]] = []
+    loc_page = empty_page
     prev_id = next_id = first_loc = ""
     location = service.locations.first()
     if location:
-        loc_all = list(location.services.order_by("name"))
-        loc = [
-            {"id": str(s.id), "name": s.name}
-            for s in loc_all
-            if s.id != service.id
-        ]
-        ids = [str(s.id) for s in loc_all]
-        try:
-            idx = ids.index(str(service.id))
-            if idx > 0:
-                prev_id = ids[idx - 1]
-            if idx + 1 < len(ids):
-                next_id = ids[idx + 1]
-        except ValueError:
-            pass
-        if loc:
-            first_loc = loc[0]["id"]
-
-    first_org = org[0]["id"] if org else ""
+        loc_qs = Service.objects.filter(locations=location)
+        nav = _navigation(loc_qs, service)
+        if nav:
+            page = _page(loc_qs, service, nav, size, loc_start)
+            loc = page.pop("results")
+            loc_page = page
+            prev_id = str(nav["prev_id"] or "")
+            next_id = str(nav["next_id"] or "")
+            first_loc = _first_other(nav, service)
 
     return {
         "organization": org,
         "location": loc,
+        "organization_page": org_page,
+        "location_page": loc_page,
         "prev_id": prev_id,
         "next_id": next_id,
         "first_loc": first_loc,
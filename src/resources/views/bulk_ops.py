@@ -2,11 +2,10 @@
 from __future__ import annotations
 
 import json
-import secrets
 from typing import Any
 
+from django.db import transaction
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
 from django_components import component_registry
 from rest_framework import status
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
@@ -15,7 +14,9 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from hsds_ext.models import BulkOperation, Shelf
+from resources import jobs
 from resources.permissions import IsVolunteer
+from resources.utils.bulk_engine import preview_page
 
 
 class BulkOperationStageView(APIView):
@@ -54,97 +55,136 @@ class BulkOperationStageView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        members = list(shelf.members.all())
+        members = shelf.members.order_by("entity_type", "added_at", "id")
         targets = [
             {"entity_type": m.entity_type, "entity_id": str(m.entity_id)} for m in members
         ]
-        preview = [
-            {
-                "entity_type": m.entity_type,
-                "entity_id": str(m.entity_id),
-                "status": "pending",
-            }
-            for m in members
-        ]
-
-        op = BulkOperation.objects.create(
+        op = BulkOperation(
             initiated_by=request.user,
             scope=BulkOperation.Scope.SHELF,
             targets=targets,
             patch=patch,
-            preview=preview,
         )
+        rows, pages = preview_page(op, 1)
+        op.save()
 
-        component_cls = component_registry.registry.get("bulk_operation_preview")
-        html = component_cls.render(
-            kwargs={"operation": op},
-            request=request,
+        return Response(
+            _render_preview(request, op, rows, 1, pages), status=status.HTTP_201_CREATED
         )
-        return Response(html, status=status.HTTP_201_CREATED)
+
+
+def _render_preview(
+    request: Request, op: BulkOperation, rows: list[dict[str, Any]], page: int, pages: int
+) -> str:
+    """Return the ``bulk_operation_preview`` HTML for one page of ``op``."""
+
+    component_cls = component_registry.registry.get("bulk_operation_preview")
+    return component_cls.render(
+        kwargs={"operation": op, "rows": rows, "page": page, "pages": pages},
+        request=request,
+    )
 
 
 class BulkOperationPreviewView(APIView):
-    """Return the preview HTML for an existing :class:`BulkOperation`."""
+    """Return one page of preview HTML for an existing :class:`BulkOperation`.
+
+    Pages beyond the first are diffed on first request (``?page=N``).
+    """
 
     permission_classes = [IsVolunteer]
 
     def get(self, request: Request, id: str) -> Response:
         op = get_object_or_404(BulkOperation, id=id, initiated_by=request.user)
-        component_cls = component_registry.registry.get("bulk_operation_preview")
-        html = component_cls.render(
-            kwargs={"operation": op},
-            request=request,
-        )
-        return Response(html)
+        try:
+            page = int(request.query_params.get("page", 1))
+        except ValueError:
+            page = 1
+        rows, pages = preview_page(op, page)
+        return Response(_render_preview(request, op, rows, min(max(1, page), pages), pages))
+
+
+def _render_result(request: Request, op: BulkOperation) -> str:
+    """Return the ``bulk_operation_result`` HTML for ``op``."""
+
+    component_cls = component_registry.registry.get("bulk_operation_result")
+    return component_cls.render(kwargs={"operation": op}, request=request)
+
+
+def _in_progress(op: BulkOperation) -> bool:
+    """Return whether a background job is still working on ``op``."""
+
+    return op.job is not None and op.job.is_active
 
 
 class BulkOperationCommitView(APIView):
-    """Commit a staged bulk operation and return commit result HTML."""
+    """Queue a staged bulk operation for commit and return progress HTML.
+
+    The patch is applied by a ``run_workers`` process; the returned
+    component polls :class:`BulkOperationProgressView` until it finishes.
+    """
 
     permission_classes = [IsVolunteer]
 
     def post(self, request: Request, id: str) -> Response:
-        op = get_object_or_404(BulkOperation, id=id, initiated_by=request.user)
-        if op.status != BulkOperation.Status.STAGED:
-            return Response(
-                {"detail": "Operation not in staged state."},
-                status=status.HTTP_400_BAD_REQUEST,
+        with transaction.atomic():
+            op = get_object_or_404(
+                BulkOperation.objects.select_for_update(), id=id, initiated_by=request.user
             )
+            if op.status != BulkOperation.Status.STAGED or _in_progress(op):
+                return Response(
+                    {"detail": "Operation not in staged state."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
-        op.status = BulkOperation.Status.COMMITTED
-        op.committed_at = timezone.now()
-        op.undo_token = secrets.token_urlsafe(32)
-        op.save(update_fields=["status", "committed_at", "undo_token"])
-
-        component_cls = component_registry.registry.get("bulk_operation_result")
-        html = component_cls.render(
-            kwargs={"operation": op},
-            request=request,
-        )
-        return Response(html)
+            op.job = jobs.enqueue("bulk_commit", {"operation_id": str(op.id)}, request.user)
+            op.save(update_fields=["job"])
+        op.refresh_from_db()
+        return Response(_render_result(request, op))
 
 
 class BulkOperationUndoView(APIView):
-    """Undo a committed bulk operation when provided with a valid token."""
+    """Queue the undo of a committed bulk operation given a valid token.
+
+    A commit that failed part way (still ``COMMITTING`` with no active job)
+    can be undone too; only its applied chunks are reverted.
+    """
 
     permission_classes = [IsVolunteer]
     parser_classes = [JSONParser, FormParser, MultiPartParser]
 
     def post(self, request: Request, id: str) -> Response:
-        op = get_object_or_404(BulkOperation, id=id, initiated_by=request.user)
-        if op.status != BulkOperation.Status.COMMITTED:
-            return Response(
-                {"detail": "Operation not in committed state."},
-                status=status.HTTP_400_BAD_REQUEST,
+        with transaction.atomic():
+            op = get_object_or_404(
+                BulkOperation.objects.select_for_update(), id=id, initiated_by=request.user
             )
+            undoable = {BulkOperation.Status.COMMITTED, BulkOperation.Status.COMMITTING}
+            if op.status not in undoable or _in_progress(op):
+                return Response(
+                    {"detail": "Operation not in committed state."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            token = request.data.get("undo_token")
+            if token != op.undo_token:
+                return Response(
+                    {"detail": "Invalid undo token."}, status=status.HTTP_400_BAD_REQUEST
+                )
+
+            op.job = jobs.enqueue("bulk_undo", {"operation_id": str(op.id)}, request.user)
+            op.save(update_fields=["job"])
+        op.refresh_from_db()
+        if request.headers.get("HX-Request"):
+            return Response(_render_result(request, op))
+        return Response({"status": op.status, "job": op.job.status})
 
-        token = request.data.get("undo_token")
-        if token != op.undo_token:
-            return Response(
-                {"detail": "Invalid undo token."}, status=status.HTTP_400_BAD_REQUEST
-            )
 
-        op.status = BulkOperation.Status.UNDONE
-        op.undone_at = timezone.now()
-        op.save(update_fields=["status", "undone_at"])
-        return Response({"status": op.status})
+class BulkOperationProgressView(APIView):
+    """Return result HTML for a bulk operation, polled while its job runs."""
+
+    permission_classes = [IsVolunteer]
+
+    def get(self, request: Request, id: str) -> Response:
+        op = get_object_or_404(
+            BulkOperation.objects.select_related("job"), id=id, initiated_by=request.user
+        )
+        return Response(_render_result(request, op))
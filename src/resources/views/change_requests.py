@@ -4,13 +4,22 @@ from __future__ import annotations
 from typing import Any, List
 
 import jsonpatch
+import jsonpointer
+from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from hsds.models import Service
+from hsds.pagination import KeysetPagination
 from hsds_ext.models import ChangeRequest
 from resources.permissions import IsEditor, IsVolunteer
+from resources.utils.change_review import (
+    QUEUE_ORDERING,
+    status_counts,
+    submit_change_request,
+)
 
 
 class ChangeRequestSubmitView(APIView):
@@ -19,7 +28,13 @@ class ChangeRequestSubmitView(APIView):
     permission_classes = [IsVolunteer]
 
     def post(self, request: Request, id: str, *args: Any, **kwargs: Any) -> Response:
-        """Persist an incoming patch and optional note."""
+        """Persist an incoming patch, its field diff and optional note.
+
+        The before/after diff is computed here, once, so review pages never
+        re-serialize the service to display it. Pending requests writing the
+        same fields are coalesced into this one; see
+        :func:`submit_change_request`.
+        """
 
         patch: List[dict] | None = request.data.get("patch")
         note = request.data.get("note")
@@ -36,23 +51,34 @@ class ChangeRequestSubmitView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        cr = ChangeRequest.objects.create(
-            target_entity_type=ChangeRequest.EntityType.SERVICE,
-            target_entity_id=id,
-            patch=patch,
-            note=note or None,
-            submitted_by=request.user,
-        )
+        service = get_object_or_404(Service, id=id)
+        try:
+            cr, superseded = submit_change_request(service, patch, note, request.user)
+        except (jsonpatch.JsonPatchException, jsonpointer.JsonPointerException):
+            return Response(
+                {"detail": "patch does not apply to the resource"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         return Response(
-            {"id": str(cr.id), "status": cr.status},
+            {
+                "id": str(cr.id),
+                "status": cr.status,
+                "supersedes": [str(old.id) for old in superseded],
+            },
             status=status.HTTP_201_CREATED,
         )
 
 
 class ChangeRequestQueueView(APIView):
-    """List ``ChangeRequest`` objects for reviewer queues."""
+    """List ``ChangeRequest`` objects for reviewer queues.
+
+    Results are keyset-paginated newest first with ``Link`` headers, so a
+    page costs the same however many requests are waiting.
+    """
 
     permission_classes = [IsEditor]
+    keyset_ordering = QUEUE_ORDERING
 
     def get(self, request: Request) -> Response:
         """Return change requests filtered by status (default: pending)."""
@@ -71,8 +97,10 @@ class ChangeRequestQueueView(APIView):
         qs = (
             ChangeRequest.objects.filter(status=status_value)
             .select_related("submitted_by")
-            .order_by("-submitted_at")
+            .prefetch_related("contributors")
         )
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(qs, request, view=self)
         data = [
             {
                 "id": str(cr.id),
@@ -80,10 +108,22 @@ class ChangeRequestQueueView(APIView):
                 "target_entity_id": str(cr.target_entity_id),
                 "note": cr.note or "",
                 "submitted_by": cr.submitted_by.username,
+                "contributors": [user.username for user in cr.contributors.all()],
                 "submitted_at": cr.submitted_at,
                 "patch": cr.patch,
+                "diff": cr.diff,
             }
-            for cr in qs
+            for cr in page
         ]
-        return Response(data)
+        return paginator.get_paginated_response(data)
+
+
+class ChangeRequestCountsView(APIView):
+    """Return the number of ``ChangeRequest`` objects in each status."""
+
+    permission_classes = [IsEditor]
+
+    def get(self, request: Request) -> Response:
+        """Return ``{status: count}`` for every status, from one query."""
 
+        return Response(status_counts())
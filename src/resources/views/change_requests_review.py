@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from typing import Any
+from uuid import UUID
 
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
@@ -11,10 +12,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from hsds.models import Service
-from hsds_ext.models import ChangeRequest, FieldVersion, VerificationEvent
+from hsds_ext.models import ChangeRequest
 from resources.permissions import IsEditor
-from resources.serializers.resource import ServiceSerializer
-from resources.utils.json_patch import apply_patch
+from resources.utils.change_review import approve_change_requests
+from resources.utils.review_leases import LEASE_CONFLICT, is_held_by_other
 
 
 class ChangeRequestApproveView(APIView):
@@ -28,44 +29,51 @@ class ChangeRequestApproveView(APIView):
         change_request = get_object_or_404(
             ChangeRequest, id=id, status=ChangeRequest.Status.PENDING
         )
-        service = get_object_or_404(Service, id=change_request.target_entity_id)
-
-        original = {"service": ServiceSerializer(service).data}
-        patched = apply_patch(original, change_request.patch)
-        service_data = patched.get("service", {})
-
-        changed_fields: list[str] = []
-        for field, value in service_data.items():
-            if field == "id":
-                continue
-            if getattr(service, field) != value:
-                setattr(service, field, value)
-                changed_fields.append(field)
-        if changed_fields:
-            service.save(update_fields=changed_fields)
-            for field in changed_fields:
-                path = f"service.{field}"
-                FieldVersion.objects.update_or_create(
-                    entity_type=FieldVersion.EntityType.SERVICE,
-                    entity_id=service.id,
-                    field_path=path,
-                    defaults={"updated_by": request.user},
-                )
-                VerificationEvent.objects.create(
-                    entity_type=VerificationEvent.EntityType.SERVICE,
-                    entity_id=service.id,
-                    field_path=path,
-                    method=VerificationEvent.Method.OTHER,
-                    note="change request approved",
-                    verified_by=request.user,
-                )
-
-        change_request.status = ChangeRequest.Status.APPROVED
-        change_request.reviewed_by = request.user
-        change_request.reviewed_at = timezone.now()
-        change_request.save(update_fields=["status", "reviewed_by", "reviewed_at"])
+        if is_held_by_other(change_request, request.user):
+            return Response({"detail": LEASE_CONFLICT}, status=status.HTTP_409_CONFLICT)
+        get_object_or_404(Service, id=change_request.target_entity_id)
+        report = approve_change_requests([change_request.id], request.user)
+        if report.skipped:
+            # Approved, superseded or claimed by someone else since the check above.
+            return Response(
+                {"detail": "Change request is no longer available for approval"},
+                status=status.HTTP_409_CONFLICT,
+            )
+        if report.failed:
+            return Response(
+                {"detail": report.failed[str(change_request.id)]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response({"status": ChangeRequest.Status.APPROVED}, status=status.HTTP_200_OK)
+
+
+class ChangeRequestBatchApproveView(APIView):
+    """Approve many pending ``ChangeRequest`` objects in one transaction."""
 
-        return Response({"status": change_request.status}, status=status.HTTP_200_OK)
+    permission_classes = [IsEditor]
+
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Apply the requests listed in ``ids`` and report each outcome.
+
+        Requests targeting the same service are composed in submit order
+        and written once; see :func:`approve_change_requests`.
+        """
+
+        ids = request.data.get("ids")
+        if not isinstance(ids, list) or not ids:
+            return Response(
+                {"detail": "ids must be a non-empty list"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            ids = [UUID(str(value)) for value in ids]
+        except ValueError:
+            return Response(
+                {"detail": "ids must be UUIDs"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        report = approve_change_requests(ids, request.user)
+        return Response(report.as_dict(), status=status.HTTP_200_OK)
 
 
 class ChangeRequestRejectView(APIView):
@@ -79,6 +87,8 @@ class ChangeRequestRejectView(APIView):
         change_request = get_object_or_404(
             ChangeRequest, id=id, status=ChangeRequest.Status.PENDING
         )
+        if is_held_by_other(change_request, request.user):
+            return Response({"detail": LEASE_CONFLICT}, status=status.HTTP_409_CONFLICT)
         change_request.status = ChangeRequest.Status.REJECTED
         change_request.reviewed_by = request.user
         change_request.reviewed_at = timezone.now()
@@ -1,6 +1,7 @@
 """Endpoints for approving or rejecting draft resources."""
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
 from django.shortcuts import get_object_or_404
@@ -13,6 +14,7 @@ from hsds.models import Location, Organization, Service
 from hsds_ext.models import DraftResource, FieldVersion, VerificationEvent
 from resources.permissions import IsEditor
 from resources.utils.json_paths import iter_paths
+from resources.utils.review_leases import LEASE_CONFLICT, is_held_by_other
 
 
 class DraftApproveView(APIView):
@@ -26,6 +28,8 @@ class DraftApproveView(APIView):
         draft = get_object_or_404(
             DraftResource, id=id, status=DraftResource.Status.DRAFT
         )
+        if is_held_by_other(draft, request.user):
+            return Response({"detail": LEASE_CONFLICT}, status=status.HTTP_409_CONFLICT)
         payload: dict[str, Any] = draft.payload
 
         # --- Create canonical HSDS objects ---------------------------------
@@ -58,39 +62,33 @@ class DraftApproveView(APIView):
             service.locations.add(location)
 
         # --- Log versions and provenance -----------------------------------
+        entities = {
+            "organization": (FieldVersion.EntityType.ORGANIZATION, organization),
+            "location": (FieldVersion.EntityType.LOCATION, location),
+            "service": (FieldVersion.EntityType.SERVICE, service),
+        }
+        paths_by_root: dict[str, list[str]] = defaultdict(list)
         for path in iter_paths(payload):
             root = path.split(".", 1)[0]
-            entity_id = None
-            entity_type = None
-            if root == "organization":
-                entity_type = FieldVersion.EntityType.ORGANIZATION
-                v_entity = VerificationEvent.EntityType.ORGANIZATION
-                entity_id = organization.id
-            elif root == "location" and location is not None:
-                entity_type = FieldVersion.EntityType.LOCATION
-                v_entity = VerificationEvent.EntityType.LOCATION
-                entity_id = location.id
-            elif root == "service":
-                entity_type = FieldVersion.EntityType.SERVICE
-                v_entity = VerificationEvent.EntityType.SERVICE
-                entity_id = service.id
-            else:
-                continue
-
-            FieldVersion.objects.update_or_create(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                field_path=path,
-                defaults={"updated_by": request.user},
-            )
-            VerificationEvent.objects.create(
-                entity_type=v_entity,
-                entity_id=entity_id,
-                field_path=path,
-                method=VerificationEvent.Method.OTHER,
-                note="draft approved",
-                verified_by=request.user,
+            if root in entities and entities[root][1] is not None:
+                paths_by_root[root].append(path)
+
+        events: list[VerificationEvent] = []
+        for root, paths in paths_by_root.items():
+            entity_type, entity = entities[root]
+            FieldVersion.bump(entity_type, entity.id, paths, request.user)
+            events.extend(
+                VerificationEvent(
+                    entity_type=entity_type,
+                    entity_id=entity.id,
+                    field_path=path,
+                    method=VerificationEvent.Method.OTHER,
+                    note="draft approved",
+                    verified_by=request.user,
+                )
+                for path in paths
             )
+        VerificationEvent.objects.bulk_create(events)
 
         draft.status = DraftResource.Status.APPROVED
         draft.review_note = request.data.get("note", "")
@@ -113,6 +111,8 @@ class DraftRejectView(APIView):
         draft = get_object_or_404(
             DraftResource, id=id, status=DraftResource.Status.DRAFT
         )
+        if is_held_by_other(draft, request.user):
+            return Response({"detail": LEASE_CONFLICT}, status=status.HTTP_409_CONFLICT)
         draft.status = DraftResource.Status.REJECTED
         draft.review_note = request.data.get("note", "")
         draft.save(update_fields=["status", "review_note"])
@@ -0,0 +1,147 @@
+"""Streaming newline-delimited JSON export of HSDS records."""
+from __future__ import annotations
+
+import json
+import zlib
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, QuerySet
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from hsds.api import (
+    ContactSerializer,
+    LocationSerializer,
+    OrganizationSerializer,
+    ServiceSerializer,
+    with_prefetch_plan,
+)
+from hsds.models import Contact, Location, Organization, Service
+
+CHUNK_SIZE = 500
+
+EXPORT_ENTITIES: Dict[str, Tuple[type[Model], type[serializers.Serializer]]] = {
+    "organization": (Organization, OrganizationSerializer),
+    "service": (Service, ServiceSerializer),
+    "location": (Location, LocationSerializer),
+    "contact": (Contact, ContactSerializer),
+}
+
+
+def ndjson_lines(
+    queryset: QuerySet, serializer_class: type[serializers.Serializer], chunk_size: int
+) -> Iterator[bytes]:
+    """Yield one encoded JSON line per row of ``queryset``.
+
+    Rows are fetched with ``iterator(chunk_size)``, which runs the
+    queryset's prefetches once per chunk, and each chunk is serialized
+    before the next is read.
+    """
+
+    rows = queryset.iterator(chunk_size=chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        lines = [
+            json.dumps(record, ensure_ascii=False, cls=DjangoJSONEncoder)
+            for record in serializer_class(chunk, many=True).data
+        ]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip-compress ``chunks`` incrementally."""
+
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Return whether an ``Accept-Encoding`` value allows a gzip response.
+
+    ``gzip`` (or ``x-gzip``) is accepted unless its q-value is 0; without
+    an explicit entry, a ``*`` entry with a non-zero q-value accepts it.
+    """
+
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+class NDJSONExportView(APIView):
+    """Stream every record of one HSDS entity type as NDJSON.
+
+    ``entity`` selects the record type; ``since`` (ISO 8601) limits the dump
+    to rows whose ``last_modified`` is at or after it, for entities that
+    track it. Records are ordered by ``last_modified`` when filtering so a
+    consumer can resume from the last value it saw. The response is
+    gzip-encoded when the client accepts it.
+    """
+
+    def get(
+        self, request: Request, *args: Any, **kwargs: Any
+    ) -> Response | StreamingHttpResponse:
+        """Return a streaming NDJSON dump of ``entity`` records."""
+
+        entity = request.query_params.get("entity", "")
+        if entity not in EXPORT_ENTITIES:
+            return Response(
+                {"detail": f"entity must be one of: {', '.join(EXPORT_ENTITIES)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        model, serializer_class = EXPORT_ENTITIES[entity]
+        queryset = with_prefetch_plan(model.objects.all(), serializer_class).order_by("pk")
+
+        since_param = request.query_params.get("since")
+        if since_param:
+            since = parse_datetime(since_param)
+            if since is None:
+                return Response(
+                    {"detail": "since must be an ISO 8601 datetime"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            if not any(f.name == "last_modified" for f in model._meta.concrete_fields):
+                return Response(
+                    {"detail": f"since is not supported for {entity}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            queryset = queryset.filter(last_modified__gte=since).order_by("last_modified", "pk")
+
+        body: Iterable[bytes] = ndjson_lines(queryset, serializer_class, CHUNK_SIZE)
+        compress = accepts_gzip(request.headers.get("Accept-Encoding", ""))
+        if compress:
+            body = gzip_stream(body)
+        response = StreamingHttpResponse(body, content_type="application/x-ndjson")
+        if compress:
+            response["Content-Encoding"] = "gzip"
+        patch_vary_headers(response, ("Accept-Encoding",))
+        response["Content-Disposition"] = f'attachment; filename="{entity}.ndjson"'
+        return response
@@ -2,48 +2,35 @@ from __future__ import annotations
 
 """Views providing data health statistics for resources."""
 
-from datetime import timedelta
-from typing import Dict
+from typing import Any, Dict
 
-from django.db.models import Exists, OuterRef, Q
-from django.utils import timezone
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from hsds.models import Location, Service
-from hsds_ext.models import VerificationEvent
+from hsds_ext.models import HealthMetric
 from resources.permissions import IsVolunteer
+from resources.utils.health_metrics import current_metrics
 
 
-def get_health_stats() -> Dict[str, int]:
+def get_health_stats() -> Dict[str, Any]:
     """Return counts for basic data quality metrics.
 
+    Counts are read from the materialized ``HealthMetric`` table, which is
+    maintained on write and by ``reconcile_health_metrics``.
+
     Metrics returned:
         - no_phone: Services without any associated phone numbers.
         - no_hours: Services missing schedule entries.
         - not_geocoded: Locations without latitude or longitude.
         - stale: Services with no verification event in the last 90 days.
+        - computed_at: Time of the last full reconciliation.
     """
 
-    no_phone = Service.objects.filter(phones__isnull=True).count()
-    no_hours = Service.objects.filter(schedules__isnull=True).count()
-    not_geocoded = Location.objects.filter(Q(latitude__isnull=True) | Q(longitude__isnull=True)).count()
-
-    threshold = timezone.now() - timedelta(days=90)
-    recent_verifications = VerificationEvent.objects.filter(
-        entity_type=VerificationEvent.EntityType.SERVICE,
-        entity_id=OuterRef("pk"),
-        verified_at__gte=threshold,
-    )
-    stale = Service.objects.annotate(has_recent=Exists(recent_verifications)).filter(has_recent=False).count()
-
-    return {
-        "no_phone": no_phone,
-        "no_hours": no_hours,
-        "not_geocoded": not_geocoded,
-        "stale": stale,
-    }
+    metrics = current_metrics()
+    stats: Dict[str, Any] = {key: metrics[key].count for key in HealthMetric.Key.values}
+    stats["computed_at"] = min(m.computed_at for m in metrics.values())
+    return stats
 
 
 class HealthStatsView(APIView):
@@ -53,7 +40,9 @@ class HealthStatsView(APIView):
 
     def get(self, request: Request) -> Response:
         stats = get_health_stats()
-        data = {
+        computed_at = stats.pop("computed_at")
+        data: Dict[str, Any] = {
             key: {"count": value} for key, value in stats.items()
         }
+        data["computed_at"] = computed_at
         return Response(data)
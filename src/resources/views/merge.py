@@ -14,7 +14,7 @@ from hsds.models import Service
 from hsds_ext.models import FieldVersion
 from resources.permissions import IsVolunteer
 from resources.serializers.resource import ResourceSerializer
-from resources.utils.etags import resource_etag
+from resources.utils.assembler import ResourceAssembler
 from resources.utils.json_paths import get_value, set_value
 
 
@@ -96,15 +96,5 @@ class MergeView(APIView):
         # Remove the duplicate service after successful merge.
         duplicate.delete()
 
-        versions = self._version_map(survivor)
-        data = ResourceSerializer(
-            {
-                "service": survivor,
-                "organization": survivor.organization,
-                "location": survivor.locations.first(),
-            },
-            context={"versions": versions},
-        ).data
-
-        return Response(data, headers={"ETag": resource_etag(versions)})
-
+        resource = ResourceAssembler(survivor.id)
+        return Response(resource.data, headers={"ETag": resource.etag})
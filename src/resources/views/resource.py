@@ -5,18 +5,17 @@ import json
 from typing import Any, Dict
 
 from django.http import QueryDict
-from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.parsers import BaseParser, FormParser, JSONParser, MultiPartParser
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from hsds.models import Service
-from hsds_ext.models import FieldVersion, SensitiveOverlay
+from hsds.conditional import not_modified, set_validators
 from resources.permissions import IsVolunteer
-from resources.serializers.resource import ResourceSerializer
-from resources.utils.etags import assert_versions, resource_etag
+from resources.utils import resource_cache
+from resources.utils.assembler import ResourceAssembler
+from resources.utils.etags import assert_versions
 from resources.utils.json_paths import get_value, iter_paths, set_value
 
 
@@ -42,66 +41,25 @@ class ResourceView(APIView):
     permission_classes = [IsVolunteer]
     parser_classes = [JSONParser, FormParser, MultiPartParser, OctetStreamParser]
 
-    def _get_service(self, id: str) -> Service:
-        """Return the ``Service`` with its related organization and locations."""
-
-        return get_object_or_404(
-            Service.objects.select_related("organization").prefetch_related("locations"),
-            id=id,
-        )
-
-    def _version_map(self, service: Service) -> Dict[str, int]:
-        """Return current field-version map for ``service``."""
-
-        qs = FieldVersion.objects.filter(
-            entity_type=FieldVersion.EntityType.SERVICE, entity_id=service.id
-        )
-        return {fv.field_path: fv.version for fv in qs}
-
-    def _overlay(self, service: Service) -> SensitiveOverlay | None:
-        """Return the SensitiveOverlay for ``service`` if it exists."""
+    def get(self, request: Request, id: str) -> Response:
+        """Return the composed resource with ETag and Last-Modified headers.
 
-        try:
-            return SensitiveOverlay.objects.get(
-                entity_type=SensitiveOverlay.EntityType.SERVICE,
-                entity_id=service.id,
-            )
-        except SensitiveOverlay.DoesNotExist:
-            return None
+        Served from the resource cache; answers ``304 Not Modified`` before
+        serializing anything when the client's validators still match.
+        """
 
-    def get(self, request: Request, id: str) -> Response:
-        """Return the composed resource with ETag header."""
-
-        service = self._get_service(id)
-        versions = self._version_map(service)
-        overlay = self._overlay(service)
-        serializer = ResourceSerializer(
-            {
-                "service": service,
-                "organization": service.organization,
-                "location": next(iter(service.locations.all()), None),
-            },
-            context={"versions": versions, "sensitive_overlay": overlay},
-        )
-        etag = resource_etag(versions)
-        return Response(serializer.data, headers={"ETag": etag})
+        resource = resource_cache.fetch(id)
+        if not_modified(request.headers, resource.etag, resource.last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(resource.data)
+        return set_validators(response, resource.etag, resource.last_modified)
 
     def patch(self, request: Request, id: str) -> Response:
         """Apply partial updates to auto-publish fields with optimistic locking."""
 
-        service = self._get_service(id)
-        versions = self._version_map(service)
-        current_etag = resource_etag(versions)
-        if request.headers.get("If-Match") != current_etag:
-            overlay = self._overlay(service)
-            data = ResourceSerializer(
-                {
-                    "service": service,
-                    "organization": service.organization,
-                    "location": next(iter(service.locations.all()), None),
-                },
-                context={"versions": versions, "sensitive_overlay": overlay},
-            ).data
+        resource = ResourceAssembler(id)
+        if request.headers.get("If-Match") != resource.etag:
             fields = []
             if isinstance(request.data, QueryDict):
                 for key in request.data.keys():
@@ -112,34 +70,19 @@ class ResourceView(APIView):
                 for path in iter_paths(request.data):
                     if not path.startswith("assert_versions"):
                         fields.append(path)
-            current = {}
-            for path in fields:
-                try:
-                    current[path] = get_value(data, path)
-                except Exception:
-                    current[path] = None
+            data = resource.data
+            current = {path: _safe_get_value(data, path) for path in fields}
             return Response(
                 {"detail": "Precondition Failed", "etags": data["etags"], "current": current},
                 status=status.HTTP_412_PRECONDITION_FAILED,
             )
 
-        mismatches = assert_versions(versions, request.data.get("assert_versions", {}))
+        mismatches = assert_versions(
+            resource.versions, request.data.get("assert_versions", {})
+        )
         if mismatches:
-            overlay = self._overlay(service)
-            data = ResourceSerializer(
-                {
-                    "service": service,
-                    "organization": service.organization,
-                    "location": next(iter(service.locations.all()), None),
-                },
-                context={"versions": versions, "sensitive_overlay": overlay},
-            ).data
-            def safe_get_value(data, path):
-                try:
-                    return get_value(data, path)
-                except Exception:
-                    return None
-            current = {path: safe_get_value(data, path) for path in mismatches}
+            data = resource.data
+            current = {path: _safe_get_value(data, path) for path in mismatches}
             return Response(
                 {
                     "detail": "Version mismatch",
@@ -154,39 +97,23 @@ class ResourceView(APIView):
         if isinstance(request.data, (QueryDict, dict)):
             # Convert dotted keys like ``service.url`` into nested structures.
             incoming = {}
-            items = request.data.items() if isinstance(request.data, QueryDict) else request.data.items()
-            for key, value in items:
+            for key, value in request.data.items():
                 set_value(incoming, key, value)
         else:
             incoming = request.data
 
-        overlay = self._overlay(service)
-        serializer = ResourceSerializer(
-            {
-                "service": service,
-                "organization": service.organization,
-                "location": next(iter(service.locations.all()), None),
-            },
-            data=incoming,
-            partial=True,
-            context={
-                "versions": versions,
-                "user": request.user,
-                "sensitive_overlay": overlay,
-            },
-        )
+        serializer = resource.serializer(incoming, user=request.user)
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
-        versions = self._version_map(service)
-        overlay = self._overlay(service)
-        data = ResourceSerializer(
-            {
-                "service": service,
-                "organization": service.organization,
-                "location": next(iter(service.locations.all()), None),
-            },
-            context={"versions": versions, "sensitive_overlay": overlay},
-        ).data
-        new_etag = resource_etag(versions)
-        return Response(data, headers={"ETag": new_etag})
+        resource.refresh(serializer.bumped_versions)
+        return set_validators(Response(resource.data), resource.etag, resource.last_modified)
+
+
+def _safe_get_value(data: Dict[str, Any], path: str) -> Any:
+    """Return the value at ``path`` in ``data`` or ``None`` if absent."""
+
+    try:
+        return get_value(data, path)
+    except Exception:
+        return None
@@ -0,0 +1,90 @@
+"""Endpoints for claiming and releasing review-queue items."""
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from resources.permissions import IsEditor
+from resources.utils.review_leases import MAX_CLAIM, REVIEW_ITEMS, claim_next, release
+
+
+def _kind_error(kind: Any) -> Response | None:
+    """Return a 400 response when ``kind`` is not a review item kind."""
+
+    if isinstance(kind, str) and kind in REVIEW_ITEMS:
+        return None
+    return Response(
+        {"detail": f"kind must be one of: {', '.join(REVIEW_ITEMS)}"},
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+class ReviewClaimView(APIView):
+    """Lease the next reviewable items to the requesting editor."""
+
+    permission_classes = [IsEditor]
+
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Claim up to ``count`` of the oldest unleased items of ``kind``.
+
+        Concurrent claims return disjoint items; see :func:`claim_next`.
+        """
+
+        kind = request.data.get("kind", "change_request")
+        error = _kind_error(kind)
+        if error:
+            return error
+        try:
+            count = int(request.data.get("count", 1))
+        except (TypeError, ValueError):
+            count = 0
+        if not 1 <= count <= MAX_CLAIM:
+            return Response(
+                {"detail": f"count must be between 1 and {MAX_CLAIM}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        items = claim_next(kind, request.user, count)
+        return Response(
+            {
+                "kind": kind,
+                "results": [
+                    {"id": str(item.id), "claimed_until": item.claimed_until.isoformat()}
+                    for item in items
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class ReviewReleaseView(APIView):
+    """Give back items the requesting editor has claimed."""
+
+    permission_classes = [IsEditor]
+
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Release the caller's leases on the items listed in ``ids``."""
+
+        kind = request.data.get("kind", "change_request")
+        error = _kind_error(kind)
+        if error:
+            return error
+        ids = request.data.get("ids")
+        if not isinstance(ids, list) or not ids:
+            return Response(
+                {"detail": "ids must be a non-empty list"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            ids = [UUID(str(value)) for value in ids]
+        except ValueError:
+            return Response(
+                {"detail": "ids must be UUIDs"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        released = release(kind, request.user, ids)
+        return Response({"released": released}, status=status.HTTP_200_OK)
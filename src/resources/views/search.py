@@ -3,26 +3,32 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from django.db.models import Q
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from hsds.models import Location, Organization, Phone, Service
+from hsds_ext.models import SearchDocument
 from resources.permissions import IsVolunteer
+from resources.utils.search_index import (
+    phone_matches,
+    phone_query_digits,
+    search_documents,
+)
 
 
 class SearchView(APIView):
-    """Simple fuzzy search across core HSDS entities.
+    """Ranked search across core HSDS entities.
 
-    This endpoint is used for live duplicate hints. It performs a very basic
-    `icontains` search across organization, service, location names as well as
-    phone numbers and address lines. Results are intentionally lightweight and
-    limited in number to keep the response fast.
+    This endpoint is used for live duplicate hints. Organizations, services
+    and locations are matched on their name, address lines and phone numbers
+    with a single ranked query over the denormalized search document index.
+    Results are intentionally lightweight and limited in number to keep the
+    response fast.
     """
 
     permission_classes = [IsVolunteer]
+    max_results = 20
 
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Return a list of candidate matches for the provided query string."""
@@ -34,67 +40,27 @@ class SearchView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        needle = query.lower()
+        digits = phone_query_digits(query)
         results: List[Dict[str, Any]] = []
-
-        # Organization name search
-        for org in Organization.objects.filter(name__icontains=query)[:5]:
-            results.append(
-                {
-                    "type": "organization",
-                    "id": str(org.id),
-                    "name": org.name,
-                }
-            )
-
-        # Service name search
-        for svc in Service.objects.filter(name__icontains=query)[:5]:
-            results.append(
-                {
-                    "type": "service",
-                    "id": str(svc.id),
-                    "name": svc.name,
-                }
-            )
-
-        # Location name or address search
-        locations = (
-            Location.objects.filter(
-                Q(name__icontains=query)
-                | Q(addresses__address_1__icontains=query)
-                | Q(addresses__city__icontains=query)
-            )
-            .prefetch_related("addresses")
-            .distinct()[:5]
-        )
-        for loc in locations:
-            addr_obj = loc.addresses.first()
-            addr = (
-                f"{addr_obj.address_1}, {addr_obj.city}" if addr_obj else ""
-            )
-            results.append(
-                {
-                    "type": "location",
-                    "id": str(loc.id),
-                    "name": loc.name or addr,
-                    "address": addr,
-                }
-            )
-
-        # Phone number search (maps back to owning entity)
-        phones = Phone.objects.filter(number__icontains=query).select_related(
-            "service", "organization", "location"
-        )[:5]
-        for ph in phones:
-            entity = ph.service or ph.location or ph.organization
-            if not entity:
-                continue
-            results.append(
-                {
-                    "type": entity.__class__.__name__.lower(),
-                    "id": str(entity.id),
-                    "name": getattr(entity, "name", ""),
-                    "phone": ph.number,
-                }
+        for doc in search_documents(query, limit=self.max_results):
+            item: Dict[str, Any] = {
+                "type": doc.entity_type,
+                "id": str(doc.entity_id),
+                "name": doc.name or doc.address,
+            }
+            if doc.entity_type == SearchDocument.EntityType.LOCATION:
+                item["address"] = doc.address
+            phone = next(
+                (
+                    n
+                    for n in doc.phones
+                    if needle in n.lower() or (digits and phone_matches(n, digits))
+                ),
+                None,
             )
+            if phone:
+                item["phone"] = phone
+            results.append(item)
 
         return Response({"results": results})
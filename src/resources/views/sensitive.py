@@ -3,16 +3,13 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from django.shortcuts import get_object_or_404
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from hsds.models import Service
-from hsds_ext.models import FieldVersion, SensitiveOverlay
+from hsds_ext.models import SensitiveOverlay
 from resources.permissions import IsEditor
-from resources.serializers.resource import ResourceSerializer
-from resources.utils.etags import resource_etag
+from resources.utils.assembler import ResourceAssembler
 
 
 class ResourceSensitiveView(APIView):
@@ -23,14 +20,10 @@ class ResourceSensitiveView(APIView):
     def patch(self, request: Request, id: str) -> Response:
         """Create or update the overlay then return redacted resource data."""
 
-        service = get_object_or_404(
-            Service.objects.select_related("organization").prefetch_related("locations"),
-            id=id,
-        )
-
-        overlay, _ = SensitiveOverlay.objects.get_or_create(
+        resource = ResourceAssembler(id)
+        overlay = resource.overlay or SensitiveOverlay(
             entity_type=SensitiveOverlay.EntityType.SERVICE,
-            entity_id=service.id,
+            entity_id=resource.service.id,
         )
 
         payload: Dict[str, Any] = request.data or {}
@@ -40,20 +33,6 @@ class ResourceSensitiveView(APIView):
             overlay.visibility_rules = payload.get("visibility_rules") or {}
         overlay.save()
 
-        versions = {
-            fv.field_path: fv.version
-            for fv in FieldVersion.objects.filter(
-                entity_type=FieldVersion.EntityType.SERVICE, entity_id=service.id
-            )
-        }
-        serializer = ResourceSerializer(
-            {
-                "service": service,
-                "organization": service.organization,
-                "location": service.locations.first(),
-            },
-            context={"versions": versions, "sensitive_overlay": overlay},
-        )
-        etag = resource_etag(versions)
-        return Response(serializer.data, headers={"ETag": etag})
-
+        resource.overlay = overlay
+        resource.refresh()
+        return Response(resource.data, headers={"ETag": resource.etag})
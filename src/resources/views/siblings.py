@@ -4,20 +4,35 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 from django.shortcuts import get_object_or_404
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from hsds.models import Service
-from resources.utils.siblings import get_sibling_data
+from resources.utils.siblings import SIBLING_WINDOW, get_sibling_data
 
 
 class SiblingServiceView(APIView):
-    """Return services related by organization or location."""
+    """Return services related by organization or location.
+
+    Sibling lists are windows of ``size`` services centred on the current
+    one; ``org_start``/``loc_start`` page through the rest of a group.
+    """
 
     def get(self, request, id: str) -> Response:
         service = get_object_or_404(
             Service.objects.select_related("organization").prefetch_related("locations"), id=id
         )
 
-        data = get_sibling_data(service)
+        params = request.query_params
+        try:
+            size = int(params.get("size", SIBLING_WINDOW))
+            org_start = int(params["org_start"]) if "org_start" in params else None
+            loc_start = int(params["loc_start"]) if "loc_start" in params else None
+        except ValueError:
+            return Response(
+                {"detail": "size, org_start and loc_start must be integers"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        data = get_sibling_data(service, size=size, org_start=org_start, loc_start=loc_start)
         return Response(data)
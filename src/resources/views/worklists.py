@@ -1,14 +1,15 @@
 """API endpoints for Worklists (saved searches)."""
 from __future__ import annotations
 
+import uuid
+from datetime import timedelta
 from typing import Any, List
 
-from django.contrib.postgres.search import TrigramSimilarity
-from django.db import connection
-from django.db.models import Q
-from django.db.models.functions import Greatest
+from django.db import transaction
+from django.db.models import Subquery
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django.utils.html import escape
 from rest_framework import status
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
@@ -17,31 +18,68 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from hsds.models import Service
-from hsds_ext.models import Worklist
+from hsds_ext.models import SearchDocument, Worklist, WorklistMember
 from resources.permissions import IsVolunteer
+from resources.utils.search_index import search_documents
 
+SNAPSHOT_MAX_AGE = timedelta(hours=1)
+"""Snapshots older than this are retaken the next time a worklist is opened."""
 
-def _search_service_ids(query: str) -> List[str]:
-    """Return service IDs matching the query using trigram similarity."""
-
-    base_q = Service.objects.filter(name__icontains=query)
-    if connection.vendor == "postgresql":
-        services = (
-            base_q.annotate(
-                sim=Greatest(
-                    TrigramSimilarity("name", query),
-                    TrigramSimilarity("organization__name", query),
-                    TrigramSimilarity("phones__number", query),
-                    TrigramSimilarity("locations__addresses__address_1", query),
-                    TrigramSimilarity("locations__addresses__city", query),
-                )
-            )
-            .order_by("-sim")
-            .distinct()[:50]
+SNAPSHOT_LIMIT = 500
+"""Maximum number of services captured in a worklist snapshot."""
+
+
+def _search_service_ids(query: str, limit: int = 50) -> List[str]:
+    """Return up to ``limit`` service IDs matching the query, best match first."""
+
+    docs = search_documents(
+        query, entity_types=[SearchDocument.EntityType.SERVICE], limit=limit
+    )
+    return [str(entity_id) for entity_id in docs.values_list("entity_id", flat=True)]
+
+
+def _is_fresh(snapshot_at, max_age: timedelta) -> bool:
+    """Return whether a snapshot taken at ``snapshot_at`` is younger than ``max_age``."""
+
+    return snapshot_at is not None and timezone.now() - snapshot_at <= max_age
+
+
+def _snapshot(wl: Worklist, max_age: timedelta | None = None) -> bool:
+    """Replace the membership snapshot of ``wl`` with fresh search results.
+
+    The worklist row is locked first, so concurrent callers take turns
+    instead of colliding on the unique ``(worklist, position)`` rows. With
+    ``max_age``, a caller that finds the snapshot already retaken by the
+    one before it keeps that snapshot. Returns whether it was retaken.
+    """
+
+    with transaction.atomic():
+        locked = Worklist.objects.select_for_update().get(pk=wl.pk)
+        if max_age is not None and _is_fresh(locked.snapshot_at, max_age):
+            wl.snapshot_at = locked.snapshot_at
+            return False
+        ids = _search_service_ids(wl.query, limit=SNAPSHOT_LIMIT)
+        WorklistMember.objects.filter(worklist=wl).delete()
+        WorklistMember.objects.bulk_create(
+            [
+                WorklistMember(worklist=wl, position=position, service_id=service_id)
+                for position, service_id in enumerate(ids)
+            ]
         )
-    else:
-        services = base_q.distinct()[:50]
-    return [str(s.id) for s in services]
+        wl.snapshot_at = timezone.now()
+        wl.save(update_fields=["snapshot_at"])
+    return True
+
+
+def _snapshot_if_stale(wl: Worklist) -> bool:
+    """Retake the snapshot of ``wl`` if missing or older than the max age.
+
+    Returns whether the snapshot was retaken.
+    """
+
+    if _is_fresh(wl.snapshot_at, SNAPSHOT_MAX_AGE):
+        return False
+    return _snapshot(wl, SNAPSHOT_MAX_AGE)
 
 
 class WorklistListCreateView(APIView):
@@ -82,12 +120,14 @@ class WorklistDetailView(APIView):
 
     def get(self, request: Request, id: str) -> Response:
         wl = get_object_or_404(Worklist, id=id, owner=request.user)
+        _snapshot_if_stale(wl)
         return Response(
             {
                 "id": str(wl.id),
                 "name": wl.name,
                 "query": wl.query,
                 "is_shared": wl.is_shared,
+                "snapshot_at": wl.snapshot_at,
             }
         )
 
@@ -98,27 +138,53 @@ class WorklistDetailView(APIView):
 
 
 class WorklistNavigateView(APIView):
-    """Return next or previous service ID in the worklist."""
+    """Return next or previous service ID in the worklist.
+
+    Steps through the worklist's membership snapshot, taken on first use and
+    retaken once it goes stale, so each keypress is an indexed lookup and
+    the order stays stable while working the list. The caller passes either
+    the ``position`` returned by the previous step or the ``current``
+    service ID; after a refresh positions from the old snapshot no longer
+    apply, so the step is anchored on ``current``.
+    """
 
     permission_classes = [IsVolunteer]
 
     def get(self, request: Request, id: str, direction: str) -> Response:
         wl = get_object_or_404(Worklist, id=id)
+        refreshed = _snapshot_if_stale(wl)
+
+        step = 1 if direction == "next" else -1
+        members = WorklistMember.objects.filter(worklist=wl)
+        member = None
+        anchored = False
+        position = request.query_params.get("position", "")
         current = request.query_params.get("current")
-        ids = _search_service_ids(wl.query)
-        if not ids:
+        if position.isdigit() and not refreshed:
+            anchored = True
+            member = members.filter(position=int(position) + step).first()
+        elif current and _is_uuid(current):
+            current_position = members.filter(service_id=current).values("position")[:1]
+            member = members.filter(position=Subquery(current_position) + step).first()
+            anchored = member is not None or members.filter(service_id=current).exists()
+
+        if not anchored:
+            ordered = members.order_by("position" if step > 0 else "-position")
+            member = ordered.first()
+        if member is None:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        if current and current in ids:
-            idx = ids.index(current)
-            idx = idx + 1 if direction == "next" else idx - 1
-        else:
-            idx = 0 if direction == "next" else len(ids) - 1
+        return Response({"id": str(member.service_id), "position": member.position})
 
-        if idx < 0 or idx >= len(ids):
-            return Response(status=status.HTTP_404_NOT_FOUND)
 
-        return Response({"id": ids[idx]})
+def _is_uuid(value: str) -> bool:
+    """Return whether ``value`` parses as a UUID."""
+
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
 
 
 class WorklistSearchView(APIView):
@@ -4,6 +4,7 @@ from django.urls import reverse
 
 from hsds.models import Organization, Service
 from hsds_ext.models import ChangeRequest, FieldVersion, VerificationEvent
+from resources.views import change_requests_review
 from users.models import User
 
 
@@ -120,3 +121,251 @@ def test_reject_change_request(client):
     cr.refresh_from_db()
     assert cr.status == ChangeRequest.Status.REJECTED
 
+
+
+@pytest.mark.django_db
+def test_batch_approve_composes_requests_per_target(client):
+    org = Organization.objects.create(name="Org", description="d")
+    first = Service.objects.create(organization=org, name="A", status=Service.Status.ACTIVE)
+    second = Service.objects.create(organization=org, name="B", status=Service.Status.ACTIVE)
+    volunteer = User.objects.create_user(
+        username="vol", password="pw", role=User.Role.VOLUNTEER
+    )
+
+    def submit(service, patch):
+        return ChangeRequest.objects.create(
+            target_entity_type=ChangeRequest.EntityType.SERVICE,
+            target_entity_id=service.id,
+            patch=patch,
+            submitted_by=volunteer,
+        )
+
+    rename = submit(first, [{"op": "replace", "path": "/service/name", "value": "A1"}])
+    rename_again = submit(first, [{"op": "replace", "path": "/service/name", "value": "A2"}])
+    broken = submit(first, [{"op": "remove", "path": "/service/missing"}])
+    email = submit(second, [{"op": "replace", "path": "/service/email", "value": "b@example.com"}])
+    editor = User.objects.create_user(username="ed", password="pw", role=User.Role.EDITOR)
+    client.force_login(editor)
+
+    ids = [str(cr.id) for cr in (rename, rename_again, broken, email)]
+    stale = "00000000-0000-0000-0000-000000000000"
+    resp = client.post(
+        reverse("resources:change-request-batch-approve"),
+        {"ids": ids + [stale]},
+        content_type="application/json",
+    )
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert sorted(body["approved"]) == sorted(ids[:2] + ids[3:])
+    assert list(body["failed"]) == [str(broken.id)]
+    assert body["skipped"] == [stale]
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert (first.name, second.email) == ("A2", "b@example.com")
+    assert FieldVersion.objects.get(entity_id=first.id, field_path="service.name").version == 1
+    assert VerificationEvent.objects.filter(entity_id=first.id).count() == 1
+    broken.refresh_from_db()
+    assert broken.status == ChangeRequest.Status.PENDING
+
+
+@pytest.mark.django_db
+def test_queue_pages_by_keyset_with_stored_diffs_and_counts(client):
+    org = Organization.objects.create(name="Org", description="d")
+    service = Service.objects.create(organization=org, name="Svc", status=Service.Status.ACTIVE)
+    volunteer = User.objects.create_user(
+        username="vol", password="pw", role=User.Role.VOLUNTEER
+    )
+    client.force_login(volunteer)
+    for index in range(5):
+        target = Service.objects.create(organization=org, name="Svc", status=Service.Status.ACTIVE)
+        patch = [{"op": "replace", "path": "/service/name", "value": f"New {index}"}]
+        resp = client.post(
+            reverse("resources:change-request-submit", args=[target.id]),
+            {"patch": patch},
+            content_type="application/json",
+        )
+        assert resp.status_code == 201
+    bad = [{"op": "remove", "path": "/service/missing"}]
+    submit_url = reverse("resources:change-request-submit", args=[service.id])
+    assert client.post(submit_url, {"patch": bad}, content_type="application/json").status_code == 400
+    ChangeRequest.objects.filter(patch__0__value="New 0").update(status=ChangeRequest.Status.REJECTED)
+
+    editor = User.objects.create_user(username="ed", password="pw", role=User.Role.EDITOR)
+    client.force_login(editor)
+    url = reverse("resources:change-request-list") + "?page_size=3"
+    seen = []
+    while url:
+        resp = client.get(url)
+        seen.extend(resp.json())
+        links = resp.headers.get("Link", "")
+        url = next(
+            (part.split(";")[0].strip("<> ") for part in links.split(",") if 'rel="next"' in part),
+            None,
+        )
+    assert [cr["diff"][0]["after"] for cr in seen] == ["New 4", "New 3", "New 2", "New 1"]
+    assert seen[0]["diff"][0] == {"field": "service.name", "before": "Svc", "after": "New 4"}
+
+    counts = client.get(reverse("resources:change-request-counts")).json()
+    assert counts == {"pending": 4, "approved": 0, "rejected": 1, "superseded": 0}
+
+
+@pytest.mark.django_db
+def test_reviewers_claim_disjoint_items_and_leases_block_others(client):
+    org = Organization.objects.create(name="Org", description="d")
+    service = Service.objects.create(organization=org, name="Svc", status=Service.Status.ACTIVE)
+    volunteer = User.objects.create_user(
+        username="vol", password="pw", role=User.Role.VOLUNTEER
+    )
+    for index in range(4):
+        ChangeRequest.objects.create(
+            target_entity_type=ChangeRequest.EntityType.SERVICE,
+            target_entity_id=service.id,
+            patch=[{"op": "replace", "path": "/service/name", "value": f"N{index}"}],
+            submitted_by=volunteer,
+        )
+    alice = User.objects.create_user(username="alice", password="pw", role=User.Role.EDITOR)
+    bob = User.objects.create_user(username="bob", password="pw", role=User.Role.EDITOR)
+    claim_url = reverse("resources:review-claim")
+
+    client.force_login(alice)
+    alice_ids = [
+        item["id"]
+        for item in client.post(
+            claim_url, {"kind": "change_request", "count": 2}, content_type="application/json"
+        ).json()["results"]
+    ]
+    client.force_login(bob)
+    bob_ids = [
+        item["id"]
+        for item in client.post(
+            claim_url, {"kind": "change_request", "count": 3}, content_type="application/json"
+        ).json()["results"]
+    ]
+    assert len(alice_ids) == 2 and len(bob_ids) == 2
+    assert not set(alice_ids) & set(bob_ids)
+    assert client.post(claim_url, {"kind": "shelf"}, content_type="application/json").status_code == 400
+    for kind in (["change_request"], {"change_request": 1}):
+        resp = client.post(claim_url, {"kind": kind}, content_type="application/json")
+        assert resp.status_code == 400
+        resp = client.post(
+            reverse("resources:review-release"),
+            {"kind": kind, "ids": bob_ids},
+            content_type="application/json",
+        )
+        assert resp.status_code == 400
+
+    approve_url = reverse("resources:change-request-approve", args=[alice_ids[0]])
+    assert client.post(approve_url).status_code == 409
+    reject_url = reverse("resources:change-request-reject", args=[alice_ids[0]])
+    assert client.post(reject_url).status_code == 409
+    batch = client.post(
+        reverse("resources:change-request-batch-approve"),
+        {"ids": alice_ids},
+        content_type="application/json",
+    ).json()
+    assert sorted(batch["skipped"]) == sorted(alice_ids)
+
+    client.force_login(alice)
+    resp = client.post(
+        reverse("resources:review-release"),
+        {"kind": "change_request", "ids": alice_ids},
+        content_type="application/json",
+    )
+    assert resp.json() == {"released": 2}
+    client.force_login(bob)
+    assert client.post(approve_url).status_code == 200
+
+
+@pytest.mark.django_db
+def test_submit_coalesces_pending_requests_on_same_field(client):
+    org = Organization.objects.create(name="Org", description="d")
+    service = Service.objects.create(organization=org, name="Svc", status=Service.Status.ACTIVE)
+    volunteer = User.objects.create_user(
+        username="vol", password="pw", role=User.Role.VOLUNTEER
+    )
+    client.force_login(volunteer)
+    url = reverse("resources:change-request-submit", args=[service.id])
+
+    def submit(*ops):
+        resp = client.post(url, {"patch": list(ops)}, content_type="application/json")
+        assert resp.status_code == 201
+        return resp.json()
+
+    first = submit({"op": "replace", "path": "/service/name", "value": "A"})
+    other = submit({"op": "replace", "path": "/service/email", "value": "a@example.com"})
+    second = submit(
+        {"op": "replace", "path": "/service/name", "value": "B"},
+        {"op": "replace", "path": "/service/url", "value": "https://example.com"},
+    )
+    assert other["supersedes"] == []
+    assert second["supersedes"] == [first["id"]]
+
+    old = ChangeRequest.objects.get(id=first["id"])
+    assert old.status == ChangeRequest.Status.SUPERSEDED
+    assert str(old.superseded_by_id) == second["id"]
+    merged = ChangeRequest.objects.get(id=second["id"])
+    assert merged.paths == ["service.name", "service.url"]
+    assert [change["after"] for change in merged.diff] == ["B", "https://example.com"]
+    assert ChangeRequest.objects.filter(status=ChangeRequest.Status.PENDING).count() == 2
+
+    editor = User.objects.create_user(username="ed", password="pw", role=User.Role.EDITOR)
+    client.force_login(editor)
+    resp = client.post(reverse("resources:change-request-approve", args=[merged.id]))
+    assert resp.status_code == 200
+    service.refresh_from_db()
+    assert (service.name, service.url) == ("B", "https://example.com")
+
+
+@pytest.mark.django_db
+def test_coalesced_request_keeps_earlier_submitters_as_contributors(client):
+    org = Organization.objects.create(name="Org", description="d")
+    service = Service.objects.create(organization=org, name="Svc", status=Service.Status.ACTIVE)
+    url = reverse("resources:change-request-submit", args=[service.id])
+    ids = []
+    for username, name in (("ann", "A"), ("bea", "B"), ("cal", "C")):
+        client.force_login(
+            User.objects.create_user(username=username, password="pw", role=User.Role.VOLUNTEER)
+        )
+        patch = [{"op": "replace", "path": "/service/name", "value": name}]
+        resp = client.post(url, {"patch": patch}, content_type="application/json")
+        ids.append(resp.json()["id"])
+
+    merged = ChangeRequest.objects.get(id=ids[-1])
+    assert merged.submitted_by.username == "cal"
+    assert sorted(user.username for user in merged.contributors.all()) == ["ann", "bea"]
+
+    editor = User.objects.create_user(username="ed", password="pw", role=User.Role.EDITOR)
+    client.force_login(editor)
+    results = client.get(reverse("resources:change-request-list")).json()
+    assert [(r["submitted_by"], sorted(r["contributors"])) for r in results] == [
+        ("cal", ["ann", "bea"])
+    ]
+
+
+@pytest.mark.django_db
+def test_approve_conflicts_when_request_is_taken_after_the_check(client, monkeypatch):
+    org = Organization.objects.create(name="Org", description="d")
+    service = Service.objects.create(organization=org, name="Svc", status=Service.Status.ACTIVE)
+    volunteer = User.objects.create_user(
+        username="vol", password="pw", role=User.Role.VOLUNTEER
+    )
+    cr = ChangeRequest.objects.create(
+        target_entity_type=ChangeRequest.EntityType.SERVICE,
+        target_entity_id=service.id,
+        patch=[{"op": "replace", "path": "/service/name", "value": "New"}],
+        submitted_by=volunteer,
+    )
+    approve = change_requests_review.approve_change_requests
+
+    def superseded_meanwhile(ids, user):
+        ChangeRequest.objects.filter(id=cr.id).update(status=ChangeRequest.Status.SUPERSEDED)
+        return approve(ids, user)
+
+    monkeypatch.setattr(change_requests_review, "approve_change_requests", superseded_meanwhile)
+    editor = User.objects.create_user(username="ed", password="pw", role=User.Role.EDITOR)
+    client.force_login(editor)
+    resp = client.post(reverse("resources:change-request-approve", args=[cr.id]))
+    assert resp.status_code == 409
+    service.refresh_from_db()
+    assert service.name == "Svc"
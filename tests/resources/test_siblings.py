@@ -28,3 +28,44 @@ def test_sibling_service_view(client):
     data = resp.json()
     assert any(s["id"] == str(service2.id) for s in data["organization"])
     assert any(s["id"] == str(service2.id) for s in data["location"])
+
+
+@pytest.mark.django_db
+def test_sibling_windows_and_navigation(client):
+    org = Organization.objects.create(name="Org", description="d")
+    loc = Location.objects.create(
+        location_type=Location.LocationType.PHYSICAL,
+        organization=org,
+        name="Loc",
+    )
+    services = []
+    for index in range(30):
+        service = Service.objects.create(
+            organization=org, name=f"S{index:02d}", status=Service.Status.ACTIVE
+        )
+        ServiceAtLocation.objects.create(service=service, location=loc)
+        services.append(service)
+    current = services[15]
+
+    url = reverse("resources:resource-siblings", args=[current.id])
+    data = client.get(url, {"size": 5}).json()
+    assert [s["name"] for s in data["location"]] == ["S13", "S14", "S16", "S17"]
+    assert data["location_page"] == {
+        "start": 13,
+        "size": 5,
+        "total": 29,
+        "previous_start": 8,
+        "next_start": 18,
+    }
+    assert (data["prev_id"], data["next_id"]) == (str(services[14].id), str(services[16].id))
+    assert data["first_loc"] == data["first_org"] == str(services[0].id)
+
+    data = client.get(url, {"size": 5, "org_start": 40}).json()
+    assert [s["name"] for s in data["organization"]] == ["S25", "S26", "S27", "S28", "S29"]
+    assert data["organization_page"]["start"] == 25
+    assert data["organization_page"]["next_start"] is None
+
+    first = client.get(reverse("resources:resource-siblings", args=[services[0].id])).json()
+    assert first["prev_id"] == ""
+    assert first["first_loc"] == str(services[1].id)
+    assert client.get(url, {"size": "x"}).status_code == 400